@@ -0,0 +1,69 @@
+"""Alembic-Umgebung für die async Engine aus app.database."""
+
+import asyncio
+from logging.config import fileConfig
+
+from alembic import context
+from sqlalchemy.engine import Connection
+
+import app.models  # noqa: F401  (registriert alle Tabellen an Base.metadata)
+from app.database import Base, async_database_url, engine_options
+from app.config import settings
+
+config = context.config
+target_metadata = Base.metadata
+
+if config.config_file_name is not None and config.attributes.get("connection") is None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+
+def _database_url() -> str:
+    return async_database_url(settings.database_url)
+
+
+def run_migrations_offline() -> None:
+    """SQL-Skript erzeugen, ohne mit der Datenbank zu verbinden (alembic upgrade --sql)."""
+    context.configure(
+        url=_database_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def do_run_migrations(connection: Connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite kann ALTER TABLE nur eingeschränkt – Batch-Modus baut Tabellen neu auf
+        render_as_batch=connection.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_async_migrations() -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    url = _database_url()
+    connectable = create_async_engine(url, **engine_options(url))
+    async with connectable.connect() as connection:
+        await connection.run_sync(do_run_migrations)
+    await connectable.dispose()
+
+
+def run_migrations_online() -> None:
+    # Aufruf aus init_db: die Verbindung der laufenden App wird mitbenutzt
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+    asyncio.run(run_async_migrations())
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,61 @@
+"""Baseline: analysis_tasks
+
+Entspricht dem Schema, das vor Einführung von Alembic per
+``Base.metadata.create_all`` angelegt wurde (nur ``analysis_tasks``).
+Bestehende Datenbanken ohne ``alembic_version`` werden von ``init_db`` auf
+diese Revision gestempelt statt neu angelegt; alles Weitere kommt über die
+Folge-Revisionen.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+TASK_STATUS = sa.Enum(
+    "PENDING", "AWAITING_CONFIRMATION", "PROCESSING", "COMPLETED", "FAILED",
+    name="taskstatus",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_tasks",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("unternehmen", sa.String(500), nullable=False),
+        sa.Column("standort", sa.String(300), nullable=False),
+        sa.Column("position", sa.String(300), nullable=False),
+        sa.Column("zusatzkontext", sa.Text(), nullable=True),
+        sa.Column("manus_prompt", sa.Text(), nullable=True),
+        sa.Column("manus_task_id", sa.String(200), nullable=True),
+        sa.Column("manus_task_url", sa.String(1000), nullable=True),
+        sa.Column("status", TASK_STATUS, nullable=False),
+        sa.Column("result_file_url", sa.String(1000), nullable=True),
+        sa.Column("result_file_name", sa.String(500), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("source_platform", sa.String(20), nullable=False),
+        sa.Column("teams_user_id", sa.String(200), nullable=True),
+        sa.Column("teams_user_name", sa.String(300), nullable=True),
+        sa.Column("teams_conversation_id", sa.String(500), nullable=True),
+        sa.Column("teams_activity_id", sa.String(500), nullable=True),
+        sa.Column("conversation_reference", sa.Text(), nullable=True),
+        sa.Column("slack_channel_id", sa.String(200), nullable=True),
+        sa.Column("slack_user_id", sa.String(200), nullable=True),
+        sa.Column("input_modus", sa.String(20), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+    )
+    op.create_index("ix_analysis_tasks_manus_task_id", "analysis_tasks", ["manus_task_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("analysis_tasks")
+    TASK_STATUS.drop(op.get_bind(), checkfirst=True)
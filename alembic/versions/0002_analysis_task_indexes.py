@@ -0,0 +1,30 @@
+"""Composite-Indizes für Status- und User-Abfragen auf analysis_tasks
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "ix_analysis_tasks_status_created_at": ["status", "created_at"],
+    "ix_analysis_tasks_slack_user_created_at": ["slack_user_id", "created_at"],
+    "ix_analysis_tasks_teams_user_created_at": ["teams_user_id", "created_at"],
+    "ix_analysis_tasks_source_platform_created_at": ["source_platform", "created_at"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES.items():
+        op.create_index(name, "analysis_tasks", columns)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        op.drop_index(name, table_name="analysis_tasks")
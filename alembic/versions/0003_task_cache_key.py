@@ -0,0 +1,28 @@
+"""cache_key auf analysis_tasks für den Report-Cache
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("analysis_tasks") as batch_op:
+        batch_op.add_column(sa.Column("cache_key", sa.String(64), nullable=True))
+        batch_op.create_index(
+            "ix_analysis_tasks_cache_key_completed_at", ["cache_key", "completed_at"]
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("analysis_tasks") as batch_op:
+        batch_op.drop_index("ix_analysis_tasks_cache_key_completed_at")
+        batch_op.drop_column("cache_key")
@@ -0,0 +1,35 @@
+"""coalesced_into_task_id auf analysis_tasks für Single-Flight-Briefings
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("analysis_tasks") as batch_op:
+        batch_op.add_column(sa.Column("coalesced_into_task_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_analysis_tasks_coalesced_into_task_id",
+            "analysis_tasks",
+            ["coalesced_into_task_id"],
+            ["id"],
+        )
+        batch_op.create_index(
+            "ix_analysis_tasks_coalesced_into_task_id", ["coalesced_into_task_id"]
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("analysis_tasks") as batch_op:
+        batch_op.drop_index("ix_analysis_tasks_coalesced_into_task_id")
+        batch_op.drop_constraint("fk_analysis_tasks_coalesced_into_task_id", type_="foreignkey")
+        batch_op.drop_column("coalesced_into_task_id")
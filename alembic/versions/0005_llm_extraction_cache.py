@@ -0,0 +1,34 @@
+"""Tabelle llm_extraction_cache für gecachte LLM-Extraktionen
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "llm_extraction_cache",
+        sa.Column("key", sa.String(64), primary_key=True),
+        sa.Column("fields", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_llm_extraction_cache_created_at", "llm_extraction_cache", ["created_at"]
+    )
+    op.create_index(
+        "ix_llm_extraction_cache_last_used_at", "llm_extraction_cache", ["last_used_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("llm_extraction_cache")
@@ -0,0 +1,54 @@
+"""Tabellen jobs (Job-Queue) und processed_webhook_events (Webhook-Dedupe)
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+JOB_STATUS = sa.Enum("QUEUED", "RUNNING", "DONE", "FAILED", name="jobstatus")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "jobs",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("task_id", sa.Integer(), sa.ForeignKey("analysis_tasks.id"), nullable=True),
+        sa.Column("ordering_key", sa.String(200), nullable=True),
+        sa.Column("status", JOB_STATUS, nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("run_after", sa.DateTime(), nullable=False),
+        sa.Column("locked_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index("ix_jobs_task_id", "jobs", ["task_id"])
+    op.create_index("ix_jobs_status_run_after", "jobs", ["status", "run_after"])
+    op.create_index("ix_jobs_ordering_key_status", "jobs", ["ordering_key", "status"])
+
+    op.create_table(
+        "processed_webhook_events",
+        sa.Column("event_id", sa.String(200), primary_key=True),
+        sa.Column("event_type", sa.String(50), nullable=False),
+        sa.Column("manus_task_id", sa.String(200), nullable=True),
+        sa.Column("received_at", sa.DateTime(), nullable=False),
+    )
+    op.create_index(
+        "ix_processed_webhook_events_received_at", "processed_webhook_events", ["received_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("processed_webhook_events")
+    op.drop_table("jobs")
+    JOB_STATUS.drop(op.get_bind(), checkfirst=True)
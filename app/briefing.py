@@ -0,0 +1,125 @@
+"""Gemeinsame Briefing-Annahme für Slack, Teams und die HTTP-Schnittstelle.
+
+Die Chat-Handler klassifizieren und validieren nur, legen den Task samt Job in
+einer Transaktion an und antworten sofort. LLM-Extraktion und Manus-Aufruf
+laufen anschließend im Job-Worker (siehe ``app.jobs.briefing``).
+"""
+
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.input_processor import (
+    build_manus_prompt,
+    build_talent_report_prompt,
+    classify_input,
+    try_extract_without_llm,
+    validate_fields,
+    InputModus,
+)
+from app.input_processor.extractor import ExtractionResult
+from app.jobs.queue import enqueue, wake_workers
+from app.models.task import AnalysisTask, TaskStatus
+from app.coalescing import briefing_ordering_key
+from app.report_cache import report_cache_key, split_refresh_keyword
+
+logger = logging.getLogger(__name__)
+
+BRIEFING_JOB = "briefing"
+# Bulk-Importe laufen über einen eigenen Worker-Pool mit begrenzter Parallelität
+BULK_BRIEFING_JOB = "bulk_briefing"
+
+RECEIVED_MESSAGE = "Briefing erhalten – ich werte es aus und melde mich gleich."
+
+
+@dataclass
+class BriefingAck:
+    message: str
+    status: str
+    task: AnalysisTask | None = None
+
+
+def apply_extraction(
+    task: AnalysisTask, extraction: ExtractionResult, modus: InputModus
+) -> None:
+    """Überträgt die extrahierten Felder und den Manus-Prompt auf den Task."""
+    task.unternehmen = extraction.unternehmen
+    task.standort = extraction.standort
+    task.position = extraction.position
+    task.zusatzkontext = extraction.zusatzkontext
+    task.input_modus = modus.value
+    task.cache_key = report_cache_key(extraction, modus)
+
+    # Routing: Talent-Report oder HiOffice-Wettbewerbsanalyse
+    if modus == InputModus.TALENT_REPORT:
+        task.manus_prompt = build_talent_report_prompt(extraction)
+    else:
+        task.manus_prompt = build_manus_prompt(extraction)
+
+
+async def accept_briefing(text: str, db: AsyncSession, **origin) -> BriefingAck:
+    """Nimmt ein Briefing an und reiht es in die Job-Queue ein.
+
+    Args:
+        text: Briefing-Text des Users.
+        db: SQLAlchemy AsyncSession.
+        origin: Plattform-Kontext für den Task (source_platform, teams_*, slack_*).
+    """
+    text, force_refresh = split_refresh_keyword(text)
+    modus = classify_input(text)
+    extraction = try_extract_without_llm(text, modus)
+
+    if extraction is not None:
+        validation = validate_fields(extraction)
+        if not validation.is_valid:
+            return BriefingAck(message=validation.reply_message, status="needs_input")
+        message = validation.reply_message
+    else:
+        message = RECEIVED_MESSAGE
+
+    task = await queue_briefing(db, text, modus, extraction, force_refresh=force_refresh, **origin)
+    await db.commit()
+    wake_workers(BRIEFING_JOB)
+
+    logger.info("Briefing als Task %s eingereiht (modus=%s)", task.id, modus.value)
+    return BriefingAck(message=message, status="queued", task=task)
+
+
+async def queue_briefing(
+    db: AsyncSession,
+    text: str,
+    modus: InputModus,
+    extraction: ExtractionResult | None,
+    *,
+    force_refresh: bool = False,
+    kind: str = BRIEFING_JOB,
+    **origin,
+) -> AnalysisTask:
+    """Legt Task und Briefing-Job an. Committet nicht – das übernimmt der Aufrufer.
+
+    Ohne ``extraction`` bleiben die Pflichtfelder leer, bis die LLM-Extraktion
+    im Worker gelaufen ist.
+    """
+    task = AnalysisTask(
+        unternehmen="",
+        standort="",
+        position="",
+        input_modus=modus.value,
+        status=TaskStatus.PENDING,
+        **origin,
+    )
+    if extraction is not None:
+        apply_extraction(task, extraction, modus)
+
+    db.add(task)
+    await db.flush()
+    enqueue(
+        db,
+        kind,
+        task_id=task.id,
+        payload={"text": text, "force_refresh": force_refresh},
+        # Identische Briefings nacheinander, damit sie sich an den ersten anhängen
+        ordering_key=briefing_ordering_key(task.cache_key) if task.cache_key else None,
+    )
+    return task
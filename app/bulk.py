@@ -0,0 +1,281 @@
+"""Bulk-Import: CRM-Listen (CSV/JSONL) klassifizieren, extrahieren und einreihen.
+
+Jede Zeile durchläuft dieselbe Pipeline wie eine Chat-Nachricht
+(``classify_input`` → ``extract_fields`` → ``validate_fields``). Regelbasiert
+erkannte Zeilen sind sofort fertig; LLM-Extraktionen laufen gebündelt parallel
+(``bulk_llm_concurrency``, zusätzlich gedrosselt durch den gemeinsamen
+OpenAI-Limiter), identische Texte werden nur einmal extrahiert. Gültige Zeilen
+werden als ``bulk_briefing``-Jobs eingereiht; die Manus-Übergabe übernimmt ein
+eigener Worker-Pool mit ``bulk_manus_concurrency`` Workern, damit ein Import
+weder Manus flutet noch Chat-Briefings blockiert.
+
+Das Ergebnis jeder Zeile wird als NDJSON-Zeile geliefert, sobald es feststeht
+(nicht in Eingabe-Reihenfolge, siehe ``row``); die letzte Zeile ist eine
+Zusammenfassung.
+
+CLI (die Manus-Übergabe übernimmt der laufende Server auf derselben Datenbank):
+  python -m app.bulk accounts.csv [--format csv|jsonl] [--dry-run] [-o results.ndjson]
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import logging
+import sys
+from collections import Counter
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from app import metrics
+from app.briefing import BULK_BRIEFING_JOB, queue_briefing
+from app.config import settings
+from app.input_processor import InputModus, classify_input, extract_fields, validate_fields
+from app.input_processor.extractor import ExtractionResult, try_extract_without_llm
+from app.jobs.queue import wake_workers
+from app.report_cache import split_refresh_keyword
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("csv", "jsonl")
+SOURCE_PLATFORM = "bulk"
+
+# Freitext-Spalte (Gesprächsnotiz) oder die drei Pflichtfelder als eigene Spalten
+_TEXT_COLUMNS = ("text", "briefing")
+_FIELD_COLUMNS = ("unternehmen", "standort", "position")
+
+
+@dataclass
+class BulkRow:
+    row: int
+    text: str | None = None
+    id: str | None = None
+    zusatzkontext: str | None = None
+    missing_fields: list[str] = field(default_factory=list)
+    error: str | None = None
+
+
+def _row_from_record(row: int, record: dict) -> BulkRow:
+    record = {
+        str(key).strip().lower(): value.strip() if isinstance(value, str) else value
+        for key, value in record.items()
+        if key is not None
+    }
+    row_id = str(record["id"]) if record.get("id") not in (None, "") else None
+
+    for column in _TEXT_COLUMNS:
+        if record.get(column):
+            return BulkRow(row, text=str(record[column]), id=row_id)
+
+    values = {name: record.get(name) for name in _FIELD_COLUMNS}
+    if not any(values.values()):
+        return BulkRow(
+            row, id=row_id, error="Weder Spalte 'text' noch unternehmen/standort/position gefüllt"
+        )
+    missing = [name for name, value in values.items() if not value]
+    if missing:
+        return BulkRow(row, id=row_id, missing_fields=missing)
+
+    # Als strukturierter Input, damit die Pipeline die Felder ohne LLM übernimmt
+    text = "\n".join(f"**{name.capitalize()}:** {values[name]}" for name in _FIELD_COLUMNS)
+    return BulkRow(row, text=text, id=row_id, zusatzkontext=record.get("zusatzkontext") or None)
+
+
+def detect_format(data: str, content_type: str | None = None) -> str:
+    """Format aus Content-Type bzw. Dateiinhalt (JSONL beginnt mit ``{``)."""
+    content_type = (content_type or "").lower()
+    if "csv" in content_type:
+        return "csv"
+    if "json" in content_type:
+        return "jsonl"
+    return "jsonl" if data.lstrip().startswith("{") else "csv"
+
+
+def parse_rows(data: str, fmt: str) -> list[BulkRow]:
+    """Zerlegt CSV (Trennzeichen , ; oder Tab) bzw. JSONL in Zeilen.
+
+    Fehlerhafte Zeilen werden als ``BulkRow`` mit ``error`` geliefert, damit
+    ein Import nicht an einer einzelnen Zeile scheitert.
+
+    Raises:
+        ValueError: Unbekanntes Format.
+    """
+    data = data.lstrip("\ufeff")
+    if fmt == "csv":
+        header = data.split("\n", 1)[0]
+        try:
+            dialect = csv.Sniffer().sniff(header, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.DictReader(io.StringIO(data), dialect=dialect)
+        return [_row_from_record(n, record) for n, record in enumerate(reader, start=1)]
+
+    if fmt == "jsonl":
+        rows = []
+        for n, line in enumerate((line for line in data.splitlines() if line.strip()), start=1):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                rows.append(BulkRow(n, error=f"Ungültiges JSON: {e}"))
+                continue
+            if not isinstance(record, dict):
+                rows.append(BulkRow(n, error="Zeile ist kein JSON-Objekt"))
+                continue
+            rows.append(_row_from_record(n, record))
+        return rows
+
+    raise ValueError(f"Unbekanntes Format '{fmt}' (erlaubt: {', '.join(FORMATS)})")
+
+
+class BulkImport:
+    """Verarbeitet die Zeilen eines Imports nebenläufig und liefert Ergebnisse pro Zeile."""
+
+    def __init__(self, db_session_factory, *, dry_run: bool = False):
+        self.db_session_factory = db_session_factory
+        self.dry_run = dry_run
+        self._llm_slots = asyncio.Semaphore(max(1, settings.bulk_llm_concurrency))
+        # Ein Import belegt zum Einreihen höchstens eine DB-Verbindung
+        self._db_lock = asyncio.Lock()
+        self._extractions: dict[str, asyncio.Task] = {}
+
+    async def _extract_limited(self, text: str, modus: InputModus) -> ExtractionResult:
+        async with self._llm_slots:
+            return await extract_fields(text, modus)
+
+    async def _extract(self, text: str, modus: InputModus) -> ExtractionResult:
+        # Identische Zeilen (z.B. doppelte CRM-Einträge) teilen sich eine Extraktion
+        task = self._extractions.get(text)
+        if task is None:
+            task = asyncio.create_task(self._extract_limited(text, modus))
+            self._extractions[text] = task
+        extraction = await asyncio.shield(task)
+        # validate_fields verändert das Ergebnis – jede Zeile bekommt eine Kopie
+        return replace(extraction, errors=list(extraction.errors))
+
+    async def process_row(self, row: BulkRow) -> dict:
+        result: dict = {"row": row.row, "id": row.id}
+        if row.error:
+            return {**result, "status": "error", "error": row.error}
+        if row.missing_fields:
+            return {**result, "status": "needs_input", "missing_fields": row.missing_fields}
+
+        text, force_refresh = split_refresh_keyword(row.text)
+        modus = classify_input(text)
+        extraction = try_extract_without_llm(text, modus)
+        if extraction is None:
+            extraction = await self._extract(text, modus)
+        if row.zusatzkontext and not extraction.zusatzkontext:
+            extraction.zusatzkontext = row.zusatzkontext
+
+        validation = validate_fields(extraction)
+        result.update(
+            modus=modus.value,
+            used_llm=extraction.used_llm,
+            unternehmen=extraction.unternehmen,
+            standort=extraction.standort,
+            position=extraction.position,
+        )
+        if extraction.errors:
+            result["errors"] = extraction.errors
+
+        if not validation.is_valid:
+            return {
+                **result,
+                "status": "needs_input",
+                "missing_fields": validation.missing_fields,
+                "ambiguous_fields": sorted(validation.ambiguous_fields),
+            }
+        if self.dry_run:
+            return {**result, "status": "valid"}
+
+        async with self._db_lock, self.db_session_factory() as db:
+            task = await queue_briefing(
+                db,
+                text,
+                modus,
+                extraction,
+                force_refresh=force_refresh,
+                kind=BULK_BRIEFING_JOB,
+                source_platform=SOURCE_PLATFORM,
+            )
+            await db.commit()
+        wake_workers(BULK_BRIEFING_JOB)
+        return {**result, "status": "queued", "task_id": task.id}
+
+    async def _process_safely(self, row: BulkRow) -> dict:
+        try:
+            return await self.process_row(row)
+        except Exception as e:
+            logger.error("Bulk-Import: Zeile %d fehlgeschlagen: %s", row.row, e, exc_info=True)
+            return {"row": row.row, "id": row.id, "status": "error", "error": str(e)}
+
+    async def run(self, rows: list[BulkRow]) -> AsyncIterator[dict]:
+        """Liefert je Zeile ein Ergebnis (sobald fertig) und zum Schluss eine Zusammenfassung."""
+        pending = [asyncio.create_task(self._process_safely(row)) for row in rows]
+        counts: Counter = Counter()
+        try:
+            for next_done in asyncio.as_completed(pending):
+                result = await next_done
+                counts[result["status"]] += 1
+                metrics.inc("bulk_rows_total", status=result["status"])
+                yield result
+        finally:
+            # Abbruch durch den Client: offene Zeilen und Extraktionen beenden
+            for task in (*pending, *self._extractions.values()):
+                task.cancel()
+
+        logger.info("Bulk-Import: %d Zeilen verarbeitet (%s)", len(rows), dict(counts))
+        yield {
+            "summary": {
+                "rows": len(rows),
+                "llm_extractions": len(self._extractions),
+                "dry_run": self.dry_run,
+                **counts,
+            }
+        }
+
+
+async def ndjson_lines(results: AsyncIterator[dict]) -> AsyncIterator[str]:
+    async for result in results:
+        yield json.dumps(result, ensure_ascii=False) + "\n"
+
+
+async def _main(args: argparse.Namespace) -> int:
+    from app.database import AsyncSessionLocal, dispose_db, init_db
+    from app.llm import close_openai_client
+
+    data = args.file.read_text(encoding="utf-8-sig")
+    fmt = args.format or ("csv" if args.file.suffix.lower() in (".csv", ".tsv") else detect_format(data))
+    rows = parse_rows(data, fmt)
+    if len(rows) > settings.bulk_max_rows:
+        print(f"Zu viele Zeilen: {len(rows)} > BULK_MAX_ROWS={settings.bulk_max_rows}", file=sys.stderr)
+        return 2
+
+    await init_db()
+    output = args.output.open("w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        async for line in ndjson_lines(BulkImport(AsyncSessionLocal, dry_run=args.dry_run).run(rows)):
+            output.write(line)
+            output.flush()
+    finally:
+        if args.output:
+            output.close()
+        await close_openai_client()
+        await dispose_db()
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bulk-Import von Briefings aus CSV/JSONL")
+    parser.add_argument("file", type=Path, help="CSV- oder JSONL-Datei")
+    parser.add_argument("--format", choices=FORMATS, help="Standard: aus Endung/Inhalt erkennen")
+    parser.add_argument("--dry-run", action="store_true", help="Nur prüfen, nichts einreihen")
+    parser.add_argument("-o", "--output", type=Path, help="NDJSON-Ergebnis (Standard: stdout)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Single-Flight für identische Briefings (gleicher Report-Cache-Schlüssel).
+
+Briefing-Jobs mit gleichem ``cache_key`` laufen über den ``ordering_key`` der
+Job-Queue strikt nacheinander – auch über mehrere Prozesse hinweg. Der erste
+Job startet den Manus-Task; jeder weitere findet ihn als laufenden Task und
+hängt sich an, statt einen zweiten Manus-Lauf zu starten. Ist der Manus-Task
+fertig oder fehlgeschlagen, wird Ergebnis bzw. Fehler an alle wartenden Tasks
+verteilt und ihnen zugestellt.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import metrics
+from app.models.task import AnalysisTask, TaskStatus
+
+
+def briefing_ordering_key(cache_key: str) -> str:
+    """``ordering_key`` für Briefing-Jobs mit gleichem Report-Cache-Schlüssel."""
+    return f"briefing:{cache_key}"
+
+
+async def find_inflight_task(db: AsyncSession, task: AnalysisTask) -> AnalysisTask | None:
+    """Laufender Manus-Task mit gleichem ``cache_key`` (nicht selbst angehängt)."""
+    if not task.cache_key:
+        return None
+    return await db.scalar(
+        select(AnalysisTask)
+        .where(
+            AnalysisTask.cache_key == task.cache_key,
+            AnalysisTask.status == TaskStatus.PROCESSING,
+            AnalysisTask.manus_task_id.is_not(None),
+            AnalysisTask.coalesced_into_task_id.is_(None),
+            AnalysisTask.id != task.id,
+        )
+        .order_by(AnalysisTask.created_at.desc())
+        .limit(1)
+    )
+
+
+def attach(task: AnalysisTask, leader: AnalysisTask) -> None:
+    """Hängt ``task`` an den laufenden ``leader`` an."""
+    task.coalesced_into_task_id = leader.id
+    task.status = TaskStatus.PROCESSING
+    metrics.inc("briefings_coalesced_total")
+
+
+async def settle_waiting_tasks(db: AsyncSession, leader: AnalysisTask) -> list[AnalysisTask]:
+    """Überträgt Ergebnis bzw. Fehler des ``leader`` auf alle angehängten Tasks.
+
+    Committet nicht. Returns: die aktualisierten Tasks.
+    """
+    waiting = (
+        await db.scalars(
+            select(AnalysisTask).where(
+                AnalysisTask.coalesced_into_task_id == leader.id,
+                AnalysisTask.status == TaskStatus.PROCESSING,
+            )
+        )
+    ).all()
+    for task in waiting:
+        task.status = leader.status
+        task.completed_at = datetime.now(timezone.utc)
+        task.result_file_url = leader.result_file_url
+        task.result_file_name = leader.result_file_name
+        task.manus_task_url = leader.manus_task_url
+        task.error_message = leader.error_message
+    return list(waiting)
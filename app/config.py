@@ -18,8 +18,126 @@ class Settings(BaseSettings):
         description="Manus Project ID fuer Talent Report. Env: MANUS_TALENT_REPORT_PROJECT_ID",
     )
 
+    # Manus HTTP-Client (ein gemeinsamer Connection-Pool pro Prozess)
+    manus_http_max_connections: int = Field(
+        default=20, description="Max. gleichzeitige Verbindungen zur Manus API"
+    )
+    manus_http_max_keepalive: int = Field(
+        default=10, description="Max. offen gehaltene Keep-Alive-Verbindungen"
+    )
+    manus_http_keepalive_expiry: float = Field(
+        default=30.0, description="Sekunden bis eine ungenutzte Verbindung geschlossen wird"
+    )
+    manus_http2: bool = Field(
+        default=False, description="HTTP/2 zur Manus API verwenden (benoetigt Paket 'h2')"
+    )
+    manus_connect_timeout: float = Field(default=5.0, description="Connect-Timeout (s)")
+    manus_timeout_create: float = Field(default=30.0, description="Timeout create_task (s)")
+    manus_timeout_get: float = Field(default=15.0, description="Timeout get_task (s)")
+    manus_timeout_download: float = Field(
+        default=60.0, description="Timeout download_artifact (s)"
+    )
+
+    # Manus Resilienz (Retry + Circuit Breaker)
+    manus_retry_max_attempts: int = Field(default=4, description="Versuche pro Aufruf inkl. erstem")
+    manus_retry_base_delay: float = Field(default=0.5, description="Basis-Backoff (s)")
+    manus_retry_max_delay: float = Field(default=20.0, description="Max. Backoff pro Versuch (s)")
+    manus_breaker_failure_threshold: int = Field(
+        default=5, description="Fehler in Folge bis der Circuit Breaker öffnet"
+    )
+    manus_breaker_reset_timeout: float = Field(
+        default=30.0, description="Sekunden bis zum Probe-Request nach dem Öffnen"
+    )
+
+    # Job-Queue (Briefings werden asynchron von Workern verarbeitet)
+    job_worker_concurrency: int = Field(
+        default=4, description="Anzahl paralleler Briefing-Worker pro Prozess"
+    )
+    job_poll_interval: float = Field(
+        default=2.0, description="Poll-Intervall (s) der Worker wenn die Queue leer ist"
+    )
+    webhook_worker_concurrency: int = Field(
+        default=4, description="Anzahl paralleler Webhook-Worker pro Prozess"
+    )
+    webhook_dedupe_ttl_hours: float = Field(
+        default=72.0, description="Aufbewahrung verarbeiteter Webhook-event_ids (h)"
+    )
+    job_max_attempts: int = Field(
+        default=60, description="Max. Versuche pro Job (z.B. bei offenem Circuit Breaker)"
+    )
+    job_stale_after: float = Field(
+        default=300.0, description="Sekunden nach denen ein RUNNING-Job als verwaist gilt"
+    )
+
+    # Bulk-Import (CRM-Listen über /api/bulk/briefings bzw. python -m app.bulk)
+    bulk_max_rows: int = Field(default=1000, description="Max. Zeilen pro Bulk-Import")
+    bulk_llm_concurrency: int = Field(
+        default=8, description="Parallele LLM-Extraktionen pro Bulk-Import"
+    )
+    bulk_manus_concurrency: int = Field(
+        default=2, description="Parallele Manus-Übergaben aus Bulk-Importen pro Prozess"
+    )
+
+    # Report-Cache
+    report_cache_max_age_days: float = Field(
+        default=7.0, description="Analysen bis zu N Tage wiederverwenden (0 = Cache aus)"
+    )
+
+    # Reconciler (Status-Abgleich für Tasks ohne Webhook)
+    reconcile_enabled: bool = Field(default=True, description="Manus-Status periodisch nachholen")
+    reconcile_stale_after: float = Field(
+        default=900.0, description="PROCESSING-Tasks ohne Update seit N Sekunden abgleichen"
+    )
+    reconcile_interval: float = Field(
+        default=60.0, description="Kürzester Abstand zwischen zwei Durchläufen (Sekunden)"
+    )
+    reconcile_max_interval: float = Field(
+        default=900.0, description="Längster Abstand bei Leerlauf bzw. pro Task (Sekunden)"
+    )
+    reconcile_batch_size: int = Field(default=20, description="Max. Tasks pro Durchlauf")
+    reconcile_concurrency: int = Field(default=4, description="Parallele get_task-Aufrufe")
+
     # LLM
     openai_api_key: str = Field(default="", description="OpenAI API Key")
+    openai_timeout: float = Field(default=30.0, description="Timeout pro OpenAI-Request (Sekunden)")
+    openai_max_retries: int = Field(default=2, description="Retries des OpenAI-SDKs (429/5xx)")
+    openai_stream_extraction: bool = Field(
+        default=True,
+        description="LLM-Extraktion streamen und Bestätigung vorab senden "
+        "(mit Korrektur, falls das Endergebnis abweicht)",
+    )
+    openai_max_concurrency: int = Field(
+        default=4, description="Max. parallele OpenAI-Requests pro Prozess"
+    )
+    openai_tokens_per_minute: int = Field(
+        default=200_000, description="Token-Budget pro Minute (OpenAI-Tier, 0 = unbegrenzt)"
+    )
+    extraction_speculative: bool = Field(
+        default=True,
+        description="Bei Minimal Inputs LLM-Extraktion parallel zum Regel-Durchlauf starten "
+        "(abgebrochen, sobald die Regeln vollständig sind)",
+    )
+    extraction_rich_rules: bool = Field(
+        default=True, description="Rich Inputs zuerst regelbasiert extrahieren (LLM nur bei Unsicherheit)"
+    )
+    extraction_rule_confidence: float = Field(
+        default=0.7, description="Ab dieser Regel-Konfidenz (0–1) wird kein LLM gefragt"
+    )
+    taxonomy_path: str = Field(
+        default="", description="Taxonomie-JSON (leer = mitgelieferte app/input_processor/data/taxonomy.json)"
+    )
+    taxonomy_reload_interval: float = Field(
+        default=30.0, description="Prüfintervall (s) für Änderungen der Taxonomie-Datei (0 = aus)"
+    )
+    llm_cache_ttl_hours: float = Field(
+        default=168.0, description="Gültigkeit gecachter LLM-Extraktionen (h, 0 = Cache aus)"
+    )
+    llm_cache_memory_entries: int = Field(
+        default=256, description="LRU-Größe des In-Memory-Caches für LLM-Extraktionen"
+    )
+    llm_cache_max_db_entries: int = Field(
+        default=10000, description="Max. Einträge im DB-Cache (älteste Nutzung fliegt zuerst)"
+    )
 
     # Teams / Azure
     microsoft_app_id: str = Field(default="", description="Azure AD App ID")
@@ -30,11 +148,33 @@ class Settings(BaseSettings):
     slack_bot_token: str = Field(default="", description="Slack Bot Token (xoxb-...)")
     slack_signing_secret: str = Field(default="", description="Slack Signing Secret")
 
+    # Admin-Endpoints (/api/admin/*, Header X-Admin-Key; leer = deaktiviert)
+    admin_api_key: str = Field(default="", description="Schlüssel für die Admin-Endpoints")
+
     # Datenbank
     database_url: str = Field(
         default="sqlite:///./salesbot.db",
         description="Database connection string",
     )
+    db_pool_size: int = Field(default=5, description="Dauerhaft offene DB-Verbindungen")
+    db_max_overflow: int = Field(
+        default=5, description="Zusätzliche DB-Verbindungen bei Lastspitzen"
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True, description="Verbindung vor Wiederverwendung prüfen (tote Verbindungen)"
+    )
+    db_pool_recycle: int = Field(
+        default=1800, description="DB-Verbindungen nach N Sekunden neu aufbauen"
+    )
+    db_pool_timeout: float = Field(
+        default=10.0, description="Max. Wartezeit auf eine freie Pool-Verbindung (Sekunden)"
+    )
+    db_statement_timeout: float = Field(
+        default=30.0, description="Statement-Timeout für Postgres in Sekunden (0 = aus)"
+    )
+    sqlite_busy_timeout: float = Field(
+        default=5.0, description="SQLite: Wartezeit auf Schreibsperren in Sekunden"
+    )
 
     # Allgemein
     environment: str = Field(default="development")
@@ -1,27 +1,103 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
 
-connect_args = {}
-if settings.database_url.startswith("sqlite"):
-    connect_args["check_same_thread"] = False
+_ASYNC_DRIVERS = {"postgresql": "postgresql+asyncpg", "sqlite": "sqlite+aiosqlite"}
+
+
+def async_database_url(url: str) -> str:
+    """Setzt den async-Treiber (asyncpg / aiosqlite) in die Database-URL ein."""
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url.removeprefix("postgres://")
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def engine_options(url: str) -> dict:
+    """Pool- und Treiber-Optionen für ``create_async_engine`` aus den Settings."""
+    parsed = make_url(url)
+    options: dict = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "pool_recycle": settings.db_pool_recycle,
+    }
+    # In-Memory-SQLite nutzt einen StaticPool ohne Größenbegrenzung
+    if parsed.get_backend_name() != "sqlite" or parsed.database not in (None, "", ":memory:"):
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    if parsed.get_backend_name() == "postgresql" and settings.db_statement_timeout > 0:
+        timeout_ms = str(int(settings.db_statement_timeout * 1000))
+        options["connect_args"] = {"server_settings": {"statement_timeout": timeout_ms}}
+    return options
+
+
+def configure_sqlite_connection(dbapi_connection, connection_record) -> None:
+    """WAL-Modus, synchronous=NORMAL und Busy-Timeout für jede SQLite-Verbindung.
+
+    WAL erlaubt parallele Leser neben einem Schreiber; NORMAL spart den fsync
+    pro Commit (nur beim Checkpoint), ohne die DB bei einem Crash zu beschädigen.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout * 1000)}")
+    cursor.close()
 
-engine = create_engine(settings.database_url, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+_url = async_database_url(settings.database_url)
+engine = create_async_engine(_url, **engine_options(_url))
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", configure_sqlite_connection)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def init_db():
-    Base.metadata.create_all(bind=engine)
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+# Schema-Stand, den ältere Installationen per create_all angelegt haben
+BASELINE_REVISION = "0001"
+
+
+def upgrade_schema(connection) -> None:
+    """Alembic-Upgrade auf ``head``; Altbestände ohne alembic_version werden gestempelt."""
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["connection"] = connection
+    tables = inspect(connection).get_table_names()
+    if "analysis_tasks" in tables and "alembic_version" not in tables:
+        command.stamp(config, BASELINE_REVISION)
+    command.upgrade(config, "head")
+
+
+async def init_db():
+    """Bringt das Schema per Alembic auf den neuesten Stand (alembic upgrade head)."""
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+
+
+async def dispose_db():
+    await engine.dispose()
@@ -1,5 +1,5 @@
 from app.input_processor.classifier import classify_input, InputModus
-from app.input_processor.extractor import extract_fields
+from app.input_processor.extractor import extract_fields, try_extract_without_llm
 from app.input_processor.validator import validate_fields, ValidationResult
 from app.input_processor.prompt_builder import build_manus_prompt, build_talent_report_prompt
 
@@ -7,6 +7,7 @@ __all__ = [
     "classify_input",
     "InputModus",
     "extract_fields",
+    "try_extract_without_llm",
     "validate_fields",
     "ValidationResult",
     "build_manus_prompt",
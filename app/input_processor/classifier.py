@@ -2,6 +2,7 @@
 
 import enum
 import re
+from dataclasses import dataclass
 
 
 class InputModus(str, enum.Enum):
@@ -17,6 +18,7 @@ _TALENT_REPORT_PATTERN = re.compile(
 )
 
 
+# Muster (klein geschrieben, ohne Wortgrenzen) für Gesprächsnotizen
 _RICH_INDICATORS = [
     r"rentenwelle",
     r"ghosting",
@@ -46,6 +48,79 @@ _STRUCTURED_PATTERN = re.compile(
     re.IGNORECASE | re.DOTALL,
 )
 
+# Alle Zeilenumbrüche, an denen ``str.splitlines`` trennt
+_LINE_BREAKS = "\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
+
+# Ein einziger Scan über den klein geschriebenen Text: jeder Beginn einer
+# nicht-leeren Zeile (ab der zweiten) und jeder Indikator ist ein Treffer.
+# Indikatoren stehen in einem Lookahead und verbrauchen keine Zeichen, damit
+# überlappende Treffer wie "in rente|nwelle" oder "leih|arbeitnehmerüberlassung"
+# genauso gefunden werden wie mit einem ``re.search`` pro Muster.
+_SCANNER = re.compile(
+    rf"[{_LINE_BREAKS}][^\S{_LINE_BREAKS}]*(?=\S)|(?=(" + "|".join(_RICH_INDICATORS) + "))"
+)
+_FIRST_LINE = re.compile(rf"[^\S{_LINE_BREAKS}]*\S")
+# Reine Literale direkt nachschlagen, nur Muster wie "pain\s*point" per fullmatch
+_LITERAL_INDICATORS = {
+    pattern: pattern for pattern in _RICH_INDICATORS if re.escape(pattern).replace("\\ ", " ") == pattern
+}
+_PATTERN_INDICATORS = [
+    (pattern, re.compile(pattern)) for pattern in _RICH_INDICATORS if pattern not in _LITERAL_INDICATORS
+]
+
+# Ab so vielen Indikatoren ist der Input Rich – unabhängig von der Zeilenzahl
+_RICH_THRESHOLD = 3
+# Ab so vielen Zeilen ist der Input Rich – unabhängig von den Indikatoren
+_RICH_LINES = 9
+# Lange Inputs (eingefügte CRM-Notizen) entscheiden sich fast immer am Anfang
+_PREFIX_CHARS = 4096
+
+
+@dataclass(frozen=True)
+class InputScan:
+    indicators: frozenset[str]
+    line_count: int
+
+
+def _indicator_for(matched: str) -> str:
+    literal = _LITERAL_INDICATORS.get(matched)
+    if literal is not None:
+        return literal
+    for pattern, compiled in _PATTERN_INDICATORS:
+        if compiled.fullmatch(matched):
+            return pattern
+    raise ValueError(matched)
+
+
+def _is_decided(scan: InputScan) -> bool:
+    return len(scan.indicators) >= _RICH_THRESHOLD or scan.line_count >= _RICH_LINES
+
+
+def _scan(text: str, decisive: bool = False) -> InputScan:
+    """Zählt Indikatoren und nicht-leere Zeilen.
+
+    Mit ``decisive`` endet der Scan, sobald das Ergebnis von
+    ``classify_input`` feststeht (genug Indikatoren oder genug Zeilen).
+    """
+    indicators: set[str] = set()
+    line_count = 1 if _FIRST_LINE.match(text) else 0
+    for match in _SCANNER.finditer(text.lower()):
+        matched = match.group(1)
+        if matched is None:
+            line_count += 1
+            if decisive and line_count >= _RICH_LINES:
+                break
+        else:
+            indicators.add(_indicator_for(matched))
+            if decisive and len(indicators) >= _RICH_THRESHOLD:
+                break
+    return InputScan(frozenset(indicators), line_count)
+
+
+def scan_input(text: str) -> InputScan:
+    """Gefundene Rich-Indikatoren und Anzahl nicht-leerer Zeilen in einem Durchlauf."""
+    return _scan(text)
+
 
 def classify_input(text: str) -> InputModus:
     """Klassifiziert den Input-Modus anhand von Heuristiken."""
@@ -56,21 +131,20 @@ def classify_input(text: str) -> InputModus:
     if _STRUCTURED_PATTERN.search(text):
         return InputModus.STRUCTURED
 
-    text_lower = text.lower()
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-
-    rich_score = sum(
-        1 for pattern in _RICH_INDICATORS
-        if re.search(pattern, text_lower)
-    )
+    # Treffer im Anfang gelten auch für den ganzen Text – steht das Ergebnis
+    # dort schon fest, muss der Rest nicht klein geschrieben und gescannt werden
+    scan = _scan(text[:_PREFIX_CHARS], decisive=True)
+    if not _is_decided(scan) and len(text) > _PREFIX_CHARS:
+        scan = _scan(text, decisive=True)
+    rich_score = len(scan.indicators)
 
-    if rich_score >= 3:
+    if rich_score >= _RICH_THRESHOLD:
         return InputModus.RICH
 
-    if len(lines) <= 5 and rich_score == 0:
+    if scan.line_count <= 5 and rich_score == 0:
         return InputModus.MINIMAL
 
-    if len(lines) > 8:
+    if scan.line_count >= _RICH_LINES:
         return InputModus.RICH
 
     return InputModus.MINIMAL
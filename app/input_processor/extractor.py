@@ -1,18 +1,37 @@
 """Extrahiert die 3 Manus-Pflichtfelder aus dem User-Input.
 
 Verwendet einen zweistufigen Ansatz:
-1. Regelbasiert (schnell, kostenlos) für strukturierte und einfache Inputs
-2. LLM-basiert (OpenAI) als Fallback für komplexe Freitext-Inputs
+1. Regelbasiert (schnell, kostenlos) für strukturierte und einfache Inputs sowie
+   für Rich Inputs mit erkennbarer Trägerzeile (Ortsverzeichnis + Taxonomie)
+2. LLM-basiert (OpenAI) als Fallback, wenn die Regeln unsicher sind
 """
 
+import asyncio
+import hashlib
+import json
 import re
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 
-from openai import AsyncOpenAI
-
+from app import metrics
 from app.config import settings
+from app.input_processor import llm_cache
 from app.input_processor.classifier import InputModus
-from app.input_processor.taxonomy import resolve_position
+from app.input_processor.gazetteer import (
+    BUNDESLAENDER,
+    PLACE_PATTERN,
+    format_standort,
+    is_place_mention,
+)
+from app.input_processor.taxonomy import (
+    current_taxonomy,
+    is_ambiguous_position,
+    match_position,
+    resolve_position,
+)
+from app.input_processor.stream_parser import IncrementalJsonParser
+from app.llm import chat_completion, stream_chat_completion
 
 EXTRACTION_SYSTEM_PROMPT = """\
 Du bist ein Extraktions-Assistent für ein Recruiting-Unternehmen.
@@ -32,6 +51,30 @@ Antworte ausschließlich im folgenden JSON-Format, ohne Markdown-Codeblöcke:
 Wenn ein Feld nicht erkennbar ist, setze es auf null.
 Verwende für die Position immer die vollständige Berufsbezeichnung (nicht die Abkürzung)."""
 
+EXTRACTION_MODEL = "gpt-4o-mini"
+# Ändert sich der Prompt, ändern sich auch die Cache-Schlüssel der LLM-Extraktion
+EXTRACTION_PROMPT_VERSION = hashlib.sha256(EXTRACTION_SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+_LLM_FIELDS = ("unternehmen", "standort", "position", "zusatzkontext")
+_MANDATORY_FIELDS = ("unternehmen", "standort", "position")
+
+# Typische Träger-/Rechtsform-Bestandteile in der Unternehmenszeile
+_ORG_INDICATORS = re.compile(
+    r"(?<!\w)(?:e\.\s?v\.|g?gmbh|ag|kg|stiftung|verein|\w*verband|diakonie|"
+    r"diakonisch\w*|caritas|drk|awo|asb|lebenshilfe|paritätisch\w*|klinik\w*|"
+    r"krankenhaus|kita|träger|\w*werk|gemeinschaft|ug)(?!\w)",
+    re.IGNORECASE,
+)
+# Rechtsformen, die eine Zeile eindeutig als Trägernamen ausweisen
+_LEGAL_FORMS = re.compile(
+    r"(?<!\w)(?:e\.\s?v\.|g?gmbh|mbh|kdör|k\.\s?d\.\s?ö\.\s?r\.|g?ag)(?!\w)",
+    re.IGNORECASE,
+)
+# Orte in Entfernungsangaben ("55 km zu Dresden") sind nicht der Standort
+_DISTANCE_CONTEXT = re.compile(r"\bkm\b[^,;\n]{0,12}$", re.IGNORECASE)
+# Nur die ersten Zeilen kommen als Unternehmenszeile in Frage
+_COMPANY_LINE_WINDOW = 3
+_COMPANY_LINE_MAX_WORDS = 12
+
 
 @dataclass
 class ExtractionResult:
@@ -43,6 +86,7 @@ class ExtractionResult:
     raw_input: str = ""
     input_modus: InputModus = InputModus.MINIMAL
     used_llm: bool = False
+    confidence: float | None = None
     errors: list[str] = field(default_factory=list)
 
 
@@ -69,6 +113,32 @@ def _extract_structured(text: str) -> ExtractionResult:
     return result
 
 
+def rule_confidence(result: ExtractionResult, lines: list[str]) -> float:
+    """Heuristische Sicherheit (0–1), dass die Zeilen-Zuordnung eines Minimal Inputs stimmt."""
+    score = 0.0
+    if result.unternehmen:
+        score += 0.35 if _ORG_INDICATORS.search(result.unternehmen) else 0.2
+    if result.position:
+        raw = lines[1] if len(lines) >= 2 else ""
+        match = match_position(raw)
+        # Mehrdeutige Begriffe klärt der Validator per Rückfrage – kein LLM nötig
+        if match is not None:
+            score += 0.35 * match.confidence
+        else:
+            score += 0.35 if is_ambiguous_position(raw) else 0.1
+    if result.standort:
+        # Eine Berufsbezeichnung in der Standort-Zeile spricht für verrutschte Zeilen
+        score += 0.0 if resolve_position(result.standort) else 0.3
+    if len(lines) > 3:
+        # Zusätzliche Zeilen werden ignoriert – evtl. falsch zugeordnet
+        score -= 0.1
+    return max(0.0, min(1.0, score))
+
+
+def _is_complete(result: ExtractionResult) -> bool:
+    return bool(result.unternehmen and result.standort and result.position)
+
+
 def _extract_minimal(text: str) -> ExtractionResult:
     """Extrahiert Felder aus einem Minimal Input (3-4 Zeilen)."""
     result = ExtractionResult(raw_input=text, input_modus=InputModus.MINIMAL)
@@ -83,13 +153,155 @@ def _extract_minimal(text: str) -> ExtractionResult:
     if len(lines) >= 3:
         result.standort = lines[2]
 
+    result.confidence = rule_confidence(result, lines)
     return result
 
 
-async def _extract_with_llm(text: str, modus: InputModus) -> ExtractionResult:
-    """Verwendet OpenAI für die Extraktion aus komplexem Freitext."""
-    import json
+def _pick(counts: dict[str, int], first_seen: dict[str, int]) -> tuple[str | None, float]:
+    """Häufigster Kandidat und seine Sicherheit: eindeutig, klar vorn oder Gleichstand."""
+    if not counts:
+        return None, 0.0
+    ranked = sorted(counts, key=lambda name: (-counts[name], first_seen[name]))
+    if len(ranked) == 1:
+        return ranked[0], 0.9
+    if counts[ranked[0]] > counts[ranked[1]]:
+        return ranked[0], 0.75
+    return ranked[0], 0.4
+
+
+def _find_company_line(lines: list[str]) -> tuple[int | None, float]:
+    candidates = [
+        (index, line)
+        for index, line in enumerate(lines[:_COMPANY_LINE_WINDOW])
+        if len(line.split()) <= _COMPANY_LINE_MAX_WORDS
+    ]
+    for index, line in candidates:
+        if _LEGAL_FORMS.search(line):
+            return index, 0.9
+    for index, line in candidates:
+        if _ORG_INDICATORS.search(line):
+            return index, 0.75
+    return None, 0.0
+
+
+def _find_position(lines: list[str]) -> tuple[str | None, float]:
+    taxonomy = current_taxonomy()
+    counts: dict[str, int] = {}
+    first_seen: dict[str, int] = {}
+    for match in taxonomy.term_pattern.finditer("\n".join(lines)):
+        canonical = taxonomy.position_map[match.group(1).lower()]
+        counts[canonical] = counts.get(canonical, 0) + 1
+        first_seen.setdefault(canonical, match.start())
+    return _pick(counts, first_seen)
+
+
+def _find_standort(lines: list[str], company_index: int | None) -> tuple[str | None, float]:
+    places: dict[str, int] = {}
+    states: dict[str, int] = {}
+    first_seen: dict[str, int] = {}
+    offset = 0
+    for index, line in enumerate(lines):
+        for match in PLACE_PATTERN.finditer(line):
+            if _DISTANCE_CONTEXT.search(line, 0, match.start()):
+                continue
+            # Im Trägernamen ("AWO Kreisverband Halle e.V.") ist auch ein
+            # mehrdeutiger Name ein Ort
+            if index != company_index and not is_place_mention(line, match):
+                continue
+            name = match.group(1)
+            bucket = states if name in BUNDESLAENDER else places
+            # Ein Ort im Trägernamen ("Kreisverband Lausitz") zählt doppelt
+            bucket[name] = bucket.get(name, 0) + (2 if index == company_index else 1)
+            first_seen.setdefault(name, offset + match.start())
+        offset += len(line) + 1
+
+    name, confidence = _pick(places, first_seen)
+    if name is None:
+        # Nur ein Bundesland genannt: als Standort zu grob für eine sichere Zuordnung
+        name, confidence = _pick(states, first_seen)
+        confidence = min(confidence, 0.6)
+    return (format_standort(name) if name else None), confidence
+
+
+def _extract_rich_rules(text: str) -> ExtractionResult:
+    """Regelbasierte Extraktion aus einem Rich Input (Freitext mit Trägerzeile).
+
+    Unternehmen: Zeile mit Rechtsform bzw. Träger-Begriff unter den ersten
+    Zeilen. Position: häufigster Begriff aus der Taxonomie. Standort:
+    häufigster Ort aus dem Ortsverzeichnis. Die Konfidenz ist die des
+    unsichersten Feldes.
+    """
+    result = ExtractionResult(raw_input=text, input_modus=InputModus.RICH)
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+
+    company_index, company_confidence = _find_company_line(lines)
+    if company_index is not None:
+        result.unternehmen = lines[company_index]
+    result.position, position_confidence = _find_position(
+        [line for index, line in enumerate(lines) if index != company_index]
+    )
+    result.standort, standort_confidence = _find_standort(lines, company_index)
+
+    context = [line for index, line in enumerate(lines) if index != company_index]
+    result.zusatzkontext = "\n".join(context) or None
+    result.confidence = min(company_confidence, position_confidence, standort_confidence)
+    return result
+
+
+def _apply_llm_fields(result: ExtractionResult, data: dict) -> None:
+    for name in _LLM_FIELDS:
+        setattr(result, name, data.get(name))
+
+    if result.position:
+        resolved = resolve_position(result.position)
+        if resolved:
+            result.position = resolved
+
 
+MandatoryFieldsCallback = Callable[[ExtractionResult], Awaitable[None]]
+
+
+async def _stream_llm_fields(
+    text: str,
+    modus: InputModus,
+    messages: list[dict],
+    on_mandatory_fields: MandatoryFieldsCallback | None,
+) -> dict:
+    """Streamt die Completion und meldet die Pflichtfelder, sobald alle drei vorliegen."""
+    parser = IncrementalJsonParser()
+    started = time.monotonic()
+    reported = False
+
+    async for delta in stream_chat_completion(
+        model=EXTRACTION_MODEL, messages=messages, temperature=0.0, max_tokens=500
+    ):
+        parser.feed(delta)
+        if reported or not all(parser.fields.get(name) for name in _MANDATORY_FIELDS):
+            continue
+        reported = True
+        metrics.inc("llm_mandatory_fields_seconds_total", time.monotonic() - started)
+        metrics.inc("llm_mandatory_fields_early_total")
+        if on_mandatory_fields is not None:
+            partial = ExtractionResult(raw_input=text, input_modus=modus, used_llm=True)
+            _apply_llm_fields(partial, parser.fields)
+            await on_mandatory_fields(partial)
+
+    if not parser.done:
+        raise json.JSONDecodeError("Unvollständiges JSON-Objekt", "", 0)
+    return parser.fields
+
+
+async def _extract_with_llm(
+    text: str,
+    modus: InputModus,
+    on_mandatory_fields: MandatoryFieldsCallback | None = None,
+) -> ExtractionResult:
+    """Verwendet OpenAI für die Extraktion aus komplexem Freitext.
+
+    Im Streaming-Modus wird ``on_mandatory_fields`` mit einem Teilergebnis
+    aufgerufen, sobald Unternehmen, Standort und Position feststehen – während
+    ``zusatzkontext`` noch gestreamt wird.
+    """
     result = ExtractionResult(
         raw_input=text, input_modus=modus, used_llm=True
     )
@@ -98,32 +310,25 @@ async def _extract_with_llm(text: str, modus: InputModus) -> ExtractionResult:
         result.errors.append("OpenAI API Key nicht konfiguriert – LLM-Extraktion nicht möglich")
         return result
 
-    client = AsyncOpenAI(api_key=settings.openai_api_key)
-
+    messages = [
+        {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
+        {"role": "user", "content": text},
+    ]
     try:
-        response = await client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": EXTRACTION_SYSTEM_PROMPT},
-                {"role": "user", "content": text},
-            ],
-            temperature=0.0,
-            max_tokens=500,
-        )
-
-        raw_json = response.choices[0].message.content.strip()
-        raw_json = raw_json.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
-        data = json.loads(raw_json)
-
-        result.unternehmen = data.get("unternehmen")
-        result.standort = data.get("standort")
-        result.position = data.get("position")
-        result.zusatzkontext = data.get("zusatzkontext")
-
-        if result.position:
-            resolved = resolve_position(result.position)
-            if resolved:
-                result.position = resolved
+        if settings.openai_stream_extraction:
+            data = await _stream_llm_fields(text, modus, messages, on_mandatory_fields)
+        else:
+            response = await chat_completion(
+                model=EXTRACTION_MODEL,
+                messages=messages,
+                temperature=0.0,
+                max_tokens=500,
+            )
+            raw_json = response.choices[0].message.content.strip()
+            raw_json = raw_json.removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+            data = json.loads(raw_json)
+
+        _apply_llm_fields(result, data)
 
     except json.JSONDecodeError as e:
         result.errors.append(f"LLM-Antwort konnte nicht geparst werden: {e}")
@@ -159,8 +364,12 @@ def _extract_talent_report(text: str) -> ExtractionResult:
     return result
 
 
-async def extract_fields(text: str, modus: InputModus) -> ExtractionResult:
-    """Hauptfunktion: Extrahiert Felder basierend auf dem Input-Modus."""
+def try_extract_without_llm(text: str, modus: InputModus) -> ExtractionResult | None:
+    """Regelbasierte Extraktion ohne LLM-Aufruf.
+
+    Returns:
+        Das Ergebnis, oder None wenn für diesen Input das LLM nötig ist.
+    """
 
     if modus == InputModus.TALENT_REPORT:
         return _extract_talent_report(text)
@@ -170,9 +379,63 @@ async def extract_fields(text: str, modus: InputModus) -> ExtractionResult:
 
     if modus == InputModus.MINIMAL:
         result = _extract_minimal(text)
-        if result.unternehmen and result.standort and result.position:
+        if _is_complete(result):
             return result
-        return await _extract_with_llm(text, modus)
 
-    # Rich Input → immer LLM
-    return await _extract_with_llm(text, modus)
+    if modus == InputModus.RICH and settings.extraction_rich_rules:
+        result = _extract_rich_rules(text)
+        if _is_complete(result) and result.confidence >= settings.extraction_rule_confidence:
+            metrics.inc("extraction_rich_rules_total", outcome="accepted")
+            return result
+        metrics.inc("extraction_rich_rules_total", outcome="llm")
+
+    # Unsicherer Rich Input, unvollständiger oder unsicherer Minimal Input → LLM
+    return None
+
+
+async def extract_fields(
+    text: str,
+    modus: InputModus,
+    on_mandatory_fields: MandatoryFieldsCallback | None = None,
+) -> ExtractionResult:
+    """Hauptfunktion: Extrahiert Felder basierend auf dem Input-Modus.
+
+    ``on_mandatory_fields`` wird nur bei gestreamter LLM-Extraktion vorab
+    aufgerufen (siehe ``_extract_with_llm``).
+
+    Mit ``extraction_speculative`` startet bei Minimal Inputs die LLM-Extraktion
+    zusammen mit dem Regel-Durchlauf. Ist das Regel-Ergebnis vollständig, wird
+    sie abgebrochen, bevor sie einen Request sendet (die Regeln laufen ohne
+    ``await``); sonst läuft sie schon während der Cache-Abfrage und wird erst
+    dann abgewartet.
+    """
+
+    llm_task = None
+    if modus == InputModus.MINIMAL and settings.extraction_speculative:
+        llm_task = asyncio.create_task(_extract_with_llm(text, modus, on_mandatory_fields))
+
+    result = try_extract_without_llm(text, modus)
+    if result is not None:
+        if llm_task is not None:
+            llm_task.cancel()
+            metrics.inc("extraction_speculative_total", winner="rules")
+        return result
+
+    key = llm_cache.extraction_cache_key(text, EXTRACTION_PROMPT_VERSION, EXTRACTION_MODEL)
+    cached = await llm_cache.lookup(key)
+    if cached is not None:
+        if llm_task is not None:
+            llm_task.cancel()
+            metrics.inc("extraction_speculative_total", winner="cache")
+        result = ExtractionResult(raw_input=text, input_modus=modus, used_llm=True)
+        _apply_llm_fields(result, cached)
+        return result
+
+    if llm_task is not None:
+        metrics.inc("extraction_speculative_total", winner="llm")
+        result = await llm_task
+    else:
+        result = await _extract_with_llm(text, modus, on_mandatory_fields)
+    if not result.errors:
+        await llm_cache.store(key, {name: getattr(result, name) for name in _LLM_FIELDS})
+    return result
@@ -0,0 +1,194 @@
+"""Ortsverzeichnis (Bundesländer, Großstädte, Regionen) für die regelbasierte Standort-Erkennung."""
+
+import re
+
+BUNDESLAENDER: dict[str, str] = {
+    "Baden-Württemberg": "Baden-Württemberg",
+    "Bayern": "Bayern",
+    "Berlin": "Berlin",
+    "Brandenburg": "Brandenburg",
+    "Bremen": "Bremen",
+    "Hamburg": "Hamburg",
+    "Hessen": "Hessen",
+    "Mecklenburg-Vorpommern": "Mecklenburg-Vorpommern",
+    "Niedersachsen": "Niedersachsen",
+    "Nordrhein-Westfalen": "Nordrhein-Westfalen",
+    "NRW": "Nordrhein-Westfalen",
+    "Rheinland-Pfalz": "Rheinland-Pfalz",
+    "Saarland": "Saarland",
+    "Sachsen": "Sachsen",
+    "Sachsen-Anhalt": "Sachsen-Anhalt",
+    "Schleswig-Holstein": "Schleswig-Holstein",
+    "Thüringen": "Thüringen",
+}
+
+# Stadt bzw. Region -> Bundesland
+PLACES: dict[str, str] = {
+    # Großstädte und Landeshauptstädte
+    "Aachen": "Nordrhein-Westfalen",
+    "Augsburg": "Bayern",
+    "Bamberg": "Bayern",
+    "Bayreuth": "Bayern",
+    "Bergisch Gladbach": "Nordrhein-Westfalen",
+    "Bielefeld": "Nordrhein-Westfalen",
+    "Bochum": "Nordrhein-Westfalen",
+    "Bonn": "Nordrhein-Westfalen",
+    "Bottrop": "Nordrhein-Westfalen",
+    "Brandenburg an der Havel": "Brandenburg",
+    "Braunschweig": "Niedersachsen",
+    "Bremerhaven": "Bremen",
+    "Chemnitz": "Sachsen",
+    "Cottbus": "Brandenburg",
+    "Darmstadt": "Hessen",
+    "Dessau": "Sachsen-Anhalt",
+    "Dortmund": "Nordrhein-Westfalen",
+    "Dresden": "Sachsen",
+    "Duisburg": "Nordrhein-Westfalen",
+    "Düsseldorf": "Nordrhein-Westfalen",
+    "Erfurt": "Thüringen",
+    "Erlangen": "Bayern",
+    "Essen": "Nordrhein-Westfalen",
+    "Flensburg": "Schleswig-Holstein",
+    "Frankfurt am Main": "Hessen",
+    "Frankfurt (Oder)": "Brandenburg",
+    "Frankfurt": "Hessen",
+    "Freiburg": "Baden-Württemberg",
+    "Fulda": "Hessen",
+    "Gelsenkirchen": "Nordrhein-Westfalen",
+    "Gera": "Thüringen",
+    "Gießen": "Hessen",
+    "Görlitz": "Sachsen",
+    "Göttingen": "Niedersachsen",
+    "Greifswald": "Mecklenburg-Vorpommern",
+    "Gütersloh": "Nordrhein-Westfalen",
+    "Hagen": "Nordrhein-Westfalen",
+    "Halle": "Sachsen-Anhalt",
+    "Hamm": "Nordrhein-Westfalen",
+    "Hannover": "Niedersachsen",
+    "Heidelberg": "Baden-Württemberg",
+    "Heilbronn": "Baden-Württemberg",
+    "Herne": "Nordrhein-Westfalen",
+    "Hildesheim": "Niedersachsen",
+    "Hoyerswerda": "Sachsen",
+    "Ingolstadt": "Bayern",
+    "Jena": "Thüringen",
+    "Kaiserslautern": "Rheinland-Pfalz",
+    "Karlsruhe": "Baden-Württemberg",
+    "Kassel": "Hessen",
+    "Kiel": "Schleswig-Holstein",
+    "Koblenz": "Rheinland-Pfalz",
+    "Köln": "Nordrhein-Westfalen",
+    "Konstanz": "Baden-Württemberg",
+    "Krefeld": "Nordrhein-Westfalen",
+    "Leipzig": "Sachsen",
+    "Leverkusen": "Nordrhein-Westfalen",
+    "Lübeck": "Schleswig-Holstein",
+    "Ludwigshafen": "Rheinland-Pfalz",
+    "Lüneburg": "Niedersachsen",
+    "Magdeburg": "Sachsen-Anhalt",
+    "Mainz": "Rheinland-Pfalz",
+    "Mannheim": "Baden-Württemberg",
+    "Moers": "Nordrhein-Westfalen",
+    "Mönchengladbach": "Nordrhein-Westfalen",
+    "Mülheim an der Ruhr": "Nordrhein-Westfalen",
+    "München": "Bayern",
+    "Münster": "Nordrhein-Westfalen",
+    "Neubrandenburg": "Mecklenburg-Vorpommern",
+    "Neuss": "Nordrhein-Westfalen",
+    "Nürnberg": "Bayern",
+    "Oberhausen": "Nordrhein-Westfalen",
+    "Offenbach": "Hessen",
+    "Oldenburg": "Niedersachsen",
+    "Osnabrück": "Niedersachsen",
+    "Paderborn": "Nordrhein-Westfalen",
+    "Pforzheim": "Baden-Württemberg",
+    "Potsdam": "Brandenburg",
+    "Regensburg": "Bayern",
+    "Remscheid": "Nordrhein-Westfalen",
+    "Reutlingen": "Baden-Württemberg",
+    "Rostock": "Mecklenburg-Vorpommern",
+    "Saarbrücken": "Saarland",
+    "Salzgitter": "Niedersachsen",
+    "Schwerin": "Mecklenburg-Vorpommern",
+    "Siegen": "Nordrhein-Westfalen",
+    "Solingen": "Nordrhein-Westfalen",
+    "Stralsund": "Mecklenburg-Vorpommern",
+    "Stuttgart": "Baden-Württemberg",
+    "Trier": "Rheinland-Pfalz",
+    "Ulm": "Baden-Württemberg",
+    "Weimar": "Thüringen",
+    "Wiesbaden": "Hessen",
+    "Wolfsburg": "Niedersachsen",
+    "Wuppertal": "Nordrhein-Westfalen",
+    "Würzburg": "Bayern",
+    "Zwickau": "Sachsen",
+    # Regionen
+    "Allgäu": "Bayern",
+    "Altmark": "Sachsen-Anhalt",
+    "Bodensee": "Baden-Württemberg",
+    "Eifel": "Rheinland-Pfalz",
+    "Emsland": "Niedersachsen",
+    "Erzgebirge": "Sachsen",
+    "Harz": "Sachsen-Anhalt",
+    "Havelland": "Brandenburg",
+    "Lausitz": "Brandenburg",
+    "Münsterland": "Nordrhein-Westfalen",
+    "Niederlausitz": "Brandenburg",
+    "Oberlausitz": "Sachsen",
+    "Prignitz": "Brandenburg",
+    "Rügen": "Mecklenburg-Vorpommern",
+    "Ruhrgebiet": "Nordrhein-Westfalen",
+    "Sauerland": "Nordrhein-Westfalen",
+    "Schwarzwald": "Baden-Württemberg",
+    "Spreewald": "Brandenburg",
+    "Uckermark": "Brandenburg",
+    "Vogtland": "Sachsen",
+}
+
+# Ortsnamen, die zugleich gängige Wörter sind ("Essen wird gestellt", "Halle 3",
+# "Rügen vom Amt"): zählen nur mit Ortskontext, siehe is_place_mention()
+AMBIGUOUS_PLACES = frozenset({"Essen", "Hagen", "Halle", "Harz", "Hamm", "Kiel", "Rügen", "Siegen"})
+
+# Groß-/Kleinschreibung zählt ("Essen" vs. "essen"); längste Namen zuerst
+_NAMES = sorted({*BUNDESLAENDER, *PLACES}, key=len, reverse=True)
+PLACE_PATTERN = re.compile(r"(?<![\w-])(" + "|".join(map(re.escape, _NAMES)) + r")(?![\w-])")
+
+# Präposition, Ortsbegriff, Feldname oder Postleitzahl direkt vor dem Namen
+_PLACE_CONTEXT = re.compile(
+    r"(?:\b(?:in|aus|bei|nach|nahe|raum|region|großraum|stadt|kreis|landkreis)"
+    r"|\b(?:standort|ort|sitz|region)\s*:|\b\d{5})\s*$",
+    re.IGNORECASE,
+)
+# Allein in der Zeile bzw. als Aufzählung ("Essen", "Essen, NRW", "Halle (Saale)")
+_LINE_REST = re.compile(r"\s*(?:$|[,(/])")
+_LIST_BULLETS = " \t-–•*"
+# "Halle 3", "in Halle 2b": Hallen-, keine Ortsangabe
+_FOLLOWING_NUMBER = re.compile(r"\s*\d{1,4}(?!\d)")
+
+
+def is_place_mention(line: str, match: re.Match) -> bool:
+    """Ob ein Treffer von PLACE_PATTERN in ``line`` als Ort gemeint ist.
+
+    Eindeutige Namen zählen immer. Mehrdeutige (AMBIGUOUS_PLACES) nur nach
+    Präposition/Ortsbegriff/PLZ ("in Essen", "Raum Hamm", "06108 Halle")
+    oder allein am Zeilenanfang ("Essen, NRW").
+    """
+    if match.group(1) not in AMBIGUOUS_PLACES:
+        return True
+    before = line[: match.start()]
+    after = line[match.end() :]
+    if _FOLLOWING_NUMBER.match(after):
+        return False
+    if _PLACE_CONTEXT.search(before):
+        return True
+    return not before.strip(_LIST_BULLETS) and bool(_LINE_REST.match(after))
+
+
+def format_standort(name: str) -> str:
+    """Ort bzw. Region mit Bundesland, z.B. "Lausitz, Brandenburg"."""
+    if name in BUNDESLAENDER:
+        return BUNDESLAENDER[name]
+    state = PLACES[name]
+    if name == state:
+        return name
+    return f"{name}, {state}"
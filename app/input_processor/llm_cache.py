@@ -0,0 +1,162 @@
+"""Inhaltsadressierter Cache für LLM-Extraktionen (Memory-LRU vor DB-Tabelle).
+
+Schlüssel ist ein Hash aus normalisiertem Briefing-Text, Version des
+System-Prompts und Modell – ändert sich Prompt oder Modell, greifen alte
+Einträge automatisch nicht mehr. Gespeichert werden die rohen LLM-Felder;
+die Positions-Auflösung über die Taxonomie läuft bei jedem Treffer neu.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+
+from app import metrics
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models.llm_cache import LlmExtractionCacheEntry
+
+logger = logging.getLogger(__name__)
+
+_PURGE_INTERVAL = 3600.0
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _ttl() -> timedelta:
+    return timedelta(hours=settings.llm_cache_ttl_hours)
+
+
+def extraction_cache_key(text: str, prompt_version: str, model: str) -> str:
+    """Hash aus normalisiertem Text (Unicode, Leerraum, Groß-/Kleinschreibung), Prompt und Modell."""
+    normalized = _WHITESPACE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+    return hashlib.sha256(f"{model}\n{prompt_version}\n{normalized}".encode("utf-8")).hexdigest()
+
+
+class _MemoryTier:
+    """Kleiner LRU-Cache mit Ablaufzeit pro Eintrag."""
+
+    def __init__(self):
+        self._entries: OrderedDict[str, tuple[datetime, dict]] = OrderedDict()
+
+    def get(self, key: str) -> dict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, fields = entry
+        if expires_at <= _utcnow():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return fields
+
+    def put(self, key: str, fields: dict, created_at: datetime) -> None:
+        self._entries[key] = (created_at + _ttl(), fields)
+        self._entries.move_to_end(key)
+        while len(self._entries) > max(0, settings.llm_cache_memory_entries):
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_memory = _MemoryTier()
+
+
+async def lookup(key: str) -> dict | None:
+    """Sucht zuerst im Speicher, dann in der DB. Fehler der DB zählen als Miss."""
+    if settings.llm_cache_ttl_hours <= 0:
+        return None
+
+    fields = _memory.get(key)
+    if fields is not None:
+        metrics.inc("llm_extraction_cache_total", tier="memory", outcome="hit")
+        return fields
+
+    try:
+        async with AsyncSessionLocal() as db:
+            entry = await db.get(LlmExtractionCacheEntry, key)
+            if entry is not None and entry.created_at > _utcnow() - _ttl():
+                entry.last_used_at = _utcnow()
+                await db.commit()
+                fields = json.loads(entry.fields)
+                _memory.put(key, fields, entry.created_at)
+                metrics.inc("llm_extraction_cache_total", tier="db", outcome="hit")
+                return fields
+    except Exception as e:
+        logger.warning("LLM-Cache: DB-Lookup fehlgeschlagen: %s", e)
+
+    metrics.inc("llm_extraction_cache_total", tier="db", outcome="miss")
+    return None
+
+
+async def store(key: str, fields: dict) -> None:
+    """Legt eine erfolgreiche Extraktion in beiden Stufen ab."""
+    if settings.llm_cache_ttl_hours <= 0:
+        return
+
+    now = _utcnow()
+    _memory.put(key, fields, now)
+    try:
+        async with AsyncSessionLocal() as db:
+            await db.merge(
+                LlmExtractionCacheEntry(
+                    key=key,
+                    fields=json.dumps(fields, ensure_ascii=False),
+                    created_at=now,
+                    last_used_at=now,
+                )
+            )
+            await db.commit()
+    except IntegrityError:
+        # Paralleler Worker hat denselben Text gerade gespeichert
+        pass
+    except Exception as e:
+        logger.warning("LLM-Cache: Speichern fehlgeschlagen: %s", e)
+
+
+async def purge_llm_cache(db) -> int:
+    """Entfernt abgelaufene Einträge und kappt die Tabelle auf die zuletzt genutzten."""
+    removed = (
+        await db.execute(
+            delete(LlmExtractionCacheEntry).where(
+                LlmExtractionCacheEntry.created_at < _utcnow() - _ttl()
+            )
+        )
+    ).rowcount or 0
+
+    keep = (
+        select(LlmExtractionCacheEntry.key)
+        .order_by(LlmExtractionCacheEntry.last_used_at.desc())
+        .limit(settings.llm_cache_max_db_entries)
+    )
+    removed += (
+        await db.execute(
+            delete(LlmExtractionCacheEntry).where(LlmExtractionCacheEntry.key.not_in(keep))
+        )
+    ).rowcount or 0
+    await db.commit()
+    return removed
+
+
+async def purge_llm_cache_loop(db_session_factory) -> None:
+    """Hintergrundschleife für TTL- und LRU-Bereinigung (im Lifespan gestartet)."""
+    while True:
+        try:
+            async with db_session_factory() as db:
+                removed = await purge_llm_cache(db)
+            if removed:
+                logger.info("%d LLM-Cache-Einträge entfernt", removed)
+        except Exception as e:
+            logger.error("Bereinigung des LLM-Caches fehlgeschlagen: %s", e)
+        await asyncio.sleep(_PURGE_INTERVAL)
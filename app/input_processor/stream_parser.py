@@ -0,0 +1,104 @@
+"""Inkrementeller Parser für das flache JSON-Objekt der LLM-Extraktion.
+
+Wird mit den Text-Deltas einer gestreamten Completion gefüttert und liefert
+jedes Feld, sobald sein Wert vollständig ist – ``unternehmen``, ``standort``
+und ``position`` also lange bevor ``zusatzkontext`` fertig gestreamt ist.
+Markdown-Codeblöcke vor dem Objekt werden übersprungen.
+"""
+
+import json
+
+
+class IncrementalJsonParser:
+    """Zeichenweiser Parser für ``{"key": value, ...}`` mit beliebigen JSON-Werten."""
+
+    def __init__(self):
+        self.fields: dict[str, object] = {}
+        self.done = False
+        self._state = "start"
+        self._buf: list[str] = []
+        self._key: str | None = None
+        self._escape = False
+        self._depth = 0
+        self._in_nested_string = False
+
+    def feed(self, chunk: str) -> dict[str, object]:
+        """Verarbeitet ``chunk`` und liefert die darin abgeschlossenen Felder."""
+        completed: dict[str, object] = {}
+        for char in chunk:
+            if self.done:
+                break
+            self._step(char, completed)
+        self.fields.update(completed)
+        return completed
+
+    def _step(self, char: str, completed: dict[str, object]) -> None:
+        state = self._state
+
+        if state == "start":
+            if char == "{":
+                self._state = "key_or_end"
+
+        elif state == "key_or_end":
+            if char == '"':
+                self._state, self._buf = "key", []
+            elif char == "}":
+                self.done = True
+
+        elif state in ("key", "string"):
+            if self._escape:
+                self._escape = False
+                self._buf.append(char)
+            elif char == "\\":
+                self._escape = True
+                self._buf.append(char)
+            elif char == '"':
+                text = json.loads('"' + "".join(self._buf) + '"')
+                if state == "key":
+                    self._key, self._state = text, "colon"
+                else:
+                    completed[self._key] = text
+                    self._state = "key_or_end"
+            else:
+                self._buf.append(char)
+
+        elif state == "colon":
+            if char == ":":
+                self._state = "value"
+
+        elif state == "value":
+            if char == '"':
+                self._state, self._buf = "string", []
+            elif not char.isspace():
+                self._state, self._buf = "literal", [char]
+                self._depth = 1 if char in "[{" else 0
+
+        elif state == "literal":
+            self._step_literal(char, completed)
+
+    def _step_literal(self, char: str, completed: dict[str, object]) -> None:
+        # Zahlen, true/false/null oder verschachtelte Arrays/Objekte
+        if self._depth and self._in_nested_string:
+            self._buf.append(char)
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_nested_string = False
+            return
+
+        if self._depth == 0 and (char in ",}" or char.isspace()):
+            completed[self._key] = json.loads("".join(self._buf))
+            self._state = "key_or_end"
+            if char == "}":
+                self.done = True
+            return
+
+        self._buf.append(char)
+        if char == '"':
+            self._in_nested_string = True
+        elif char in "[{":
+            self._depth += 1
+        elif char in "]}":
+            self._depth -= 1
@@ -1,58 +1,412 @@
-"""Berufsgruppen-Taxonomie für die Normalisierung von Zielgruppen/Positionen."""
-
-POSITION_MAP: dict[str, str] = {
-    # Heilerziehungspfleger
-    "hep": "Heilerziehungspfleger",
-    "heilerziehungspfleger": "Heilerziehungspfleger",
-    "heilerziehungspflegerin": "Heilerziehungspfleger",
-    "heilerziehungspfleger/in": "Heilerziehungspfleger",
-    # Pflegefachkraft
-    "pfk": "Pflegefachkraft",
-    "pflegefachkraft": "Pflegefachkraft",
-    "pflegefachfrau": "Pflegefachkraft",
-    "pflegefachmann": "Pflegefachkraft",
-    "exam. pflegekraft": "Pflegefachkraft",
-    "examinierte pflegekraft": "Pflegefachkraft",
-    "krankenschwester": "Pflegefachkraft",
-    "krankenpfleger": "Pflegefachkraft",
-    "gesundheits- und krankenpfleger": "Pflegefachkraft",
-    # Erzieher
-    "erzieher": "Erzieher",
-    "erzieherin": "Erzieher",
-    "erzieher/in": "Erzieher",
-    # Altenpfleger
-    "ap": "Altenpfleger",
-    "altenpfleger": "Altenpfleger",
-    "altenpflegerin": "Altenpfleger",
-    "altenpfleger/in": "Altenpfleger",
-    # OTA
-    "ota": "OTA",
-    "op-pflege": "OTA",
-    "op-pflegekraft": "OTA",
-    "operationstechnischer assistent": "OTA",
-    "operationstechnische assistentin": "OTA",
-    # Sozialarbeiter
-    "sozialarbeiter": "Sozialarbeiter",
-    "sozialarbeiterin": "Sozialarbeiter",
-    "sozialpädagoge": "Sozialarbeiter",
-    "sozialpädagogin": "Sozialarbeiter",
-    "sozialarbeiter/in": "Sozialarbeiter",
-}
-
-AMBIGUOUS_TERMS: set[str] = {
-    "pfleger",
-    "pflegerin",
-    "pflege",
-    "pflegekraft",
-    "fachkraft",
-}
-
-DISAMBIGUATION_OPTIONS: list[dict[str, str]] = [
-    {"key": "1", "label": "Pflegefachkraft (PFK)", "value": "Pflegefachkraft"},
-    {"key": "2", "label": "Heilerziehungspfleger (HEP)", "value": "Heilerziehungspfleger"},
-    {"key": "3", "label": "Altenpfleger/in", "value": "Altenpfleger"},
-    {"key": "4", "label": "Pflegehelfer / Pflegeassistent", "value": "Pflegehelfer"},
-]
+"""Berufsgruppen-Taxonomie für die Normalisierung von Zielgruppen/Positionen.
+
+Die Taxonomie liegt als versionierte JSON-Datei vor (``data/taxonomy.json``
+bzw. ``TAXONOMY_PATH``) und wird beim Laden zu einem unveränderlichen
+``Taxonomy``-Snapshot samt Suchindex kompiliert. Neu laden (Dateiänderung
+oder Admin-Endpoint) baut einen neuen Snapshot und tauscht die Referenz in
+einem Schritt aus – Leser nehmen sich den aktuellen Snapshot ohne Lock und
+arbeiten innerhalb eines Aufrufs konsistent mit ihm.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+from collections import Counter
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import MappingProxyType
+
+from app import metrics
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+PACKAGED_TAXONOMY = Path(__file__).resolve().parent / "data" / "taxonomy.json"
+
+
+class TaxonomyError(ValueError):
+    """Taxonomie-Datei fehlt, ist kein gültiges JSON oder inkonsistent."""
+
+
+# Gender-Schreibweisen und Stellenanzeigen-Zusätze, die für die Zuordnung egal sind
+_GENDER_MARKERS = re.compile(
+    r"\s*\((?:[mwd]\s*/\s*){1,2}[mwd]\)|\((?:in|innen)\)|[/*:_](?:in|innen)\b",
+    re.IGNORECASE,
+)
+_WORD_SPLIT = re.compile(r"[\s,;]+")
+# Plural-/Gender-Endungen, längste zuerst; jeweils mehrfach anwendbar ("männer" → "mann" → "man")
+_SUFFIXES = (
+    ("innen", ""),
+    ("kräfte", "kraft"),
+    ("männer", "mann"),
+    ("frauen", "frau"),
+    ("in", ""),
+    ("en", ""),
+    ("e", ""),
+    ("n", ""),
+    ("s", ""),
+)
+_MIN_STEM = 2
+# Unscharfe Suche erst ab dieser Länge – Kürzel wie "HEP" oder "AP" nur exakt
+_FUZZY_MIN_LENGTH = 5
+_FUZZY_CANDIDATES = 5
+# Mindestanteil gemeinsamer Trigramme (Dice), bevor die Edit-Distanz gerechnet wird
+_FUZZY_MIN_DICE = 0.5
+FUZZY_MIN_CONFIDENCE = 0.75
+# Rollen-Morpheme (gestemmt), die eine andere, meist niedriger qualifizierte
+# Berufsgruppe bezeichnen: "Heilerziehungspflegehelfer" ist kein Heilerziehungspfleger
+_ROLE_MORPHEMES = ("helfer", "assistent", "hilf")
+
+
+@dataclass(frozen=True)
+class PositionMatch:
+    position: str
+    confidence: float
+    term: str
+
+
+def _normalize(raw: str) -> str:
+    return " ".join(_GENDER_MARKERS.sub("", raw.strip().lower()).split())
+
+
+def _stem_word(word: str) -> str:
+    for _ in range(3):
+        for suffix, replacement in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= _MIN_STEM:
+                word = word[: -len(suffix)] + replacement
+                break
+        else:
+            break
+    return word
+
+
+def _stem(normalized: str) -> str:
+    return " ".join(_stem_word(word) for word in normalized.split())
+
+
+def _adds_role(query: str, candidate: str) -> bool:
+    """True wenn ``query`` ein Rollen-Morphem trägt, das ``candidate`` fehlt."""
+    return any(morpheme in query and morpheme not in candidate for morpheme in _ROLE_MORPHEMES)
+
+
+def _trigrams(term: str) -> set[str]:
+    padded = f" {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein-Distanz im Band ``|i - j| <= limit``; ``limit + 1`` wenn sie größer ist."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    too_far = limit + 1
+    previous = [j if j <= limit else too_far for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        char_a = a[i - 1]
+        low, high = max(1, i - limit), min(len(b), i + limit)
+        current = [too_far] * (len(b) + 1)
+        current[0] = i if i <= limit else too_far
+        best = current[0]
+        for j in range(low, high + 1):
+            cost = previous[j - 1] + (char_a != b[j - 1])
+            value = min(previous[j] + 1, current[j - 1] + 1, cost)
+            current[j] = value
+            if value < best:
+                best = value
+        if best > limit:
+            return too_far
+        previous = current
+    return min(previous[-1], too_far)
+
+
+class PositionIndex:
+    """Einmal aufgebauter Index über die Taxonomie: exakt, gestemmt, Trigramm/Edit-Distanz.
+
+    Mehrdeutige Begriffe (``ambiguous_terms``) werden nie aufgelöst – auch nicht
+    in Plural- oder Tippfehler-Varianten –, damit der Validator weiter nachfragt.
+    """
+
+    def __init__(self, position_map: Mapping[str, str], ambiguous_terms: frozenset[str]):
+        self._exact = {_normalize(term): position for term, position in position_map.items()}
+        self._stems: dict[str, tuple[str, str]] = {}
+        for term, position in position_map.items():
+            self._stems.setdefault(_stem(_normalize(term)), (position, term))
+        self._ambiguous = {_stem(_normalize(term)) for term in ambiguous_terms}
+
+        # Trigramm -> Stämme; mehrdeutige Begriffe sind Kandidaten, damit sie Treffer blockieren
+        self._trigrams: dict[str, list[str]] = {}
+        self._gram_counts: dict[str, int] = {}
+        for stem in {*self._stems, *self._ambiguous}:
+            grams = _trigrams(stem)
+            self._gram_counts[stem] = len(grams)
+            for gram in grams:
+                self._trigrams.setdefault(gram, []).append(stem)
+
+    def is_ambiguous(self, raw: str) -> bool:
+        return _stem(_normalize(raw)) in self._ambiguous
+
+    def match(self, raw: str) -> PositionMatch | None:
+        """Bester Treffer mit Konfidenz (1.0 exakt … ``FUZZY_MIN_CONFIDENCE``), sonst None."""
+        normalized = _normalize(raw)
+        if not normalized:
+            return None
+        stem = _stem(normalized)
+        if stem in self._ambiguous:
+            return None
+
+        if normalized in self._exact:
+            return PositionMatch(self._exact[normalized], 1.0, normalized)
+        if stem in self._stems:
+            position, term = self._stems[stem]
+            return PositionMatch(position, 0.95, term)
+        return self._match_words(stem) or self._match_fuzzy(stem)
+
+    def _match_words(self, stem: str) -> PositionMatch | None:
+        # "exam. Pflegefachkraft", "HEP Wohngruppe": genau eine bekannte Berufsgruppe im Text
+        words = [word for word in _WORD_SPLIT.split(stem) if word]
+        if len(words) < 2 or any(word in self._ambiguous for word in words):
+            return None
+        hits = {self._stems[word] for word in words if word in self._stems and not _adds_role(stem, word)}
+        if len({position for position, _ in hits}) != 1:
+            return None
+        position, term = hits.pop()
+        return PositionMatch(position, 0.9, term)
+
+    def _match_fuzzy(self, stem: str) -> PositionMatch | None:
+        if len(stem) < _FUZZY_MIN_LENGTH:
+            return None
+        grams = _trigrams(stem)
+        shared = Counter(candidate for gram in grams for candidate in self._trigrams.get(gram, ()))
+        if not shared:
+            return None
+
+        scored: list[tuple[float, str]] = []
+        for candidate, common in shared.most_common(_FUZZY_CANDIDATES):
+            if 2 * common / (len(grams) + self._gram_counts[candidate]) < _FUZZY_MIN_DICE:
+                break
+            if _adds_role(stem, candidate):
+                continue
+            longest = max(len(stem), len(candidate))
+            limit = int(longest * (1.0 - FUZZY_MIN_CONFIDENCE))
+            distance = _edit_distance(stem, candidate, limit)
+            if distance > limit:
+                continue
+            scored.append((1.0 - distance / longest, candidate))
+        if not scored:
+            return None
+        scored.sort(reverse=True)
+
+        confidence, best = scored[0]
+        if confidence < FUZZY_MIN_CONFIDENCE or best in self._ambiguous:
+            return None
+        position, term = self._stems[best]
+        # Zwei verschiedene Berufsgruppen gleich nah: lieber nachfragen als raten
+        if any(
+            score == confidence and self._stems.get(other, (position,))[0] != position
+            for score, other in scored[1:]
+        ):
+            return None
+        return PositionMatch(position, round(confidence, 3), term)
+
+
+def _term_pattern(position_map: Mapping[str, str]) -> re.Pattern:
+    # Positionsbegriffe im Fließtext, auch im Plural ("HEPs") und in Komposita ("Erzieher-Mangel")
+    return re.compile(
+        r"(?<![\w/-])("
+        + "|".join(map(re.escape, sorted(position_map, key=len, reverse=True)))
+        + r")(?:s|n|en|innen)?(?![\w/])",
+        re.IGNORECASE,
+    )
+
+
+@dataclass(frozen=True)
+class Taxonomy:
+    version: str
+    position_map: Mapping[str, str]
+    ambiguous_terms: frozenset[str]
+    disambiguation_options: tuple[Mapping[str, str], ...]
+    index: PositionIndex = field(repr=False)
+    term_pattern: re.Pattern = field(repr=False)
+    source: str = ""
+    loaded_at: datetime | None = None
+
+
+def compile_taxonomy(data: dict, source: str = "") -> Taxonomy:
+    """Prüft die Rohdaten und baut daraus einen unveränderlichen Snapshot.
+
+    Raises:
+        TaxonomyError: Fehlende Felder, doppelt belegte oder widersprüchliche Begriffe.
+    """
+    if not isinstance(data, dict):
+        raise TaxonomyError("Taxonomie muss ein JSON-Objekt sein")
+    version = data.get("version")
+    if not isinstance(version, str) or not version.strip():
+        raise TaxonomyError("Feld 'version' fehlt")
+
+    positions = data.get("positions")
+    if not isinstance(positions, dict) or not positions:
+        raise TaxonomyError("Feld 'positions' fehlt oder ist leer")
+    position_map: dict[str, str] = {}
+    for position, terms in positions.items():
+        if not isinstance(terms, list) or not all(isinstance(t, str) and t.strip() for t in terms):
+            raise TaxonomyError(f"Begriffe für '{position}' müssen eine Liste von Strings sein")
+        for term in terms:
+            term = term.strip().lower()
+            if position_map.get(term, position) != position:
+                raise TaxonomyError(
+                    f"Begriff '{term}' gehört zu '{position_map[term]}' und '{position}'"
+                )
+            position_map[term] = position
+
+    ambiguous = data.get("ambiguous_terms", [])
+    if not isinstance(ambiguous, list) or not all(isinstance(t, str) for t in ambiguous):
+        raise TaxonomyError("'ambiguous_terms' muss eine Liste von Strings sein")
+    ambiguous_terms = frozenset(t.strip().lower() for t in ambiguous if t.strip())
+    if conflicts := ambiguous_terms & position_map.keys():
+        raise TaxonomyError(f"Begriffe zugleich eindeutig und mehrdeutig: {sorted(conflicts)}")
+
+    options = data.get("disambiguation_options", [])
+    if not isinstance(options, list) or not all(
+        isinstance(o, dict) and all(isinstance(o.get(k), str) for k in ("key", "label", "value"))
+        for o in options
+    ):
+        raise TaxonomyError("'disambiguation_options' braucht key, label und value je Option")
+
+    return Taxonomy(
+        version=version.strip(),
+        position_map=MappingProxyType(position_map),
+        ambiguous_terms=ambiguous_terms,
+        disambiguation_options=tuple(
+            MappingProxyType({k: o[k] for k in ("key", "label", "value")}) for o in options
+        ),
+        index=PositionIndex(position_map, ambiguous_terms),
+        term_pattern=_term_pattern(position_map),
+        source=source,
+        loaded_at=datetime.now(timezone.utc).replace(tzinfo=None),
+    )
+
+
+def taxonomy_path() -> Path:
+    return Path(settings.taxonomy_path) if settings.taxonomy_path else PACKAGED_TAXONOMY
+
+
+def load_taxonomy(path: Path) -> Taxonomy:
+    """Liest und kompiliert eine Taxonomie-Datei (tauscht noch nichts aus)."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        raise TaxonomyError(f"{path}: {e}") from e
+    return compile_taxonomy(data, source=str(path))
+
+
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+_current: Taxonomy = load_taxonomy(taxonomy_path())
+_current_signature = _file_signature(taxonomy_path())
+
+
+def current_taxonomy() -> Taxonomy:
+    """Aktueller Snapshot. Innerhalb eines Vorgangs einmal holen und weiterverwenden."""
+    return _current
+
+
+def _swap(taxonomy: Taxonomy) -> Taxonomy:
+    global _current
+    previous, _current = _current, taxonomy
+    metrics.inc("taxonomy_reloads_total", outcome="ok")
+    logger.info(
+        "Taxonomie %s → %s geladen (%d Begriffe, Quelle %s)",
+        previous.version,
+        taxonomy.version,
+        len(taxonomy.position_map),
+        taxonomy.source,
+    )
+    return taxonomy
+
+
+def reload_taxonomy() -> Taxonomy:
+    """Lädt die Taxonomie-Datei neu. Bei Fehlern bleibt der alte Snapshot aktiv.
+
+    Raises:
+        TaxonomyError: Datei ungültig – nichts wurde ausgetauscht.
+    """
+    global _current_signature
+    path = taxonomy_path()
+    signature = _file_signature(path)
+    try:
+        taxonomy = load_taxonomy(path)
+    except TaxonomyError:
+        metrics.inc("taxonomy_reloads_total", outcome="error")
+        raise
+    _current_signature = signature
+    return _swap(taxonomy)
+
+
+def save_taxonomy(data: dict) -> Taxonomy:
+    """Prüft neue Rohdaten, schreibt sie atomar nach ``TAXONOMY_PATH`` und aktiviert sie.
+
+    Weitere Worker-Prozesse übernehmen die Datei über ``watch_taxonomy_loop``.
+
+    Raises:
+        TaxonomyError: Daten ungültig oder Datei nicht schreibbar.
+    """
+    global _current_signature
+    path = taxonomy_path()
+    taxonomy = compile_taxonomy(data, source=str(path))
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError as e:
+        tmp.unlink(missing_ok=True)
+        raise TaxonomyError(f"{path} nicht schreibbar: {e}") from e
+    _current_signature = _file_signature(path)
+    return _swap(taxonomy)
+
+
+async def watch_taxonomy_loop() -> None:
+    """Lädt die Datei neu, sobald sich mtime oder Größe ändern (im Lifespan gestartet)."""
+    global _current_signature
+    while True:
+        await asyncio.sleep(settings.taxonomy_reload_interval)
+        path = taxonomy_path()
+        signature = _file_signature(path)
+        if signature is None or signature == _current_signature:
+            continue
+        # Auch eine fehlerhafte Version merken, damit sie nicht jede Runde neu gemeldet wird
+        _current_signature = signature
+        try:
+            # Kompilieren außerhalb des Event-Loops; getauscht wird nur die Referenz
+            taxonomy = await asyncio.to_thread(load_taxonomy, path)
+        except TaxonomyError as e:
+            metrics.inc("taxonomy_reloads_total", outcome="error")
+            logger.error("Taxonomie nicht neu geladen, alte Version bleibt aktiv: %s", e)
+            continue
+        _swap(taxonomy)
+
+
+def disambiguation_options() -> list[dict[str, str]]:
+    """Auswahl für mehrdeutige Positionen (Kopie, darf verändert werden)."""
+    return [dict(option) for option in _current.disambiguation_options]
+
+
+def match_position(raw: str) -> PositionMatch | None:
+    """Unscharfe Zuordnung (Plural, Gender-Endungen, Tippfehler) mit Konfidenz."""
+    return _current.index.match(raw)
+
+
+def is_ambiguous_position(raw: str) -> bool:
+    """Mehrdeutiger Begriff wie "Pflegekraft" – auch als "Pflegekräfte" oder "Pfleger/in"."""
+    return _current.index.is_ambiguous(raw)
 
 
 def resolve_position(raw: str) -> str | None:
@@ -61,7 +415,5 @@ def resolve_position(raw: str) -> str | None:
     Returns:
         Normalisierte Position oder None bei mehrdeutigen/unbekannten Eingaben.
     """
-    normalized = raw.strip().lower()
-    if normalized in AMBIGUOUS_TERMS:
-        return None
-    return POSITION_MAP.get(normalized)
+    match = _current.index.match(raw)
+    return match.position if match else None
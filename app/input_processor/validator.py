@@ -4,8 +4,8 @@ from dataclasses import dataclass, field
 
 from app.input_processor.extractor import ExtractionResult
 from app.input_processor.taxonomy import (
-    AMBIGUOUS_TERMS,
-    DISAMBIGUATION_OPTIONS,
+    disambiguation_options,
+    is_ambiguous_position,
     resolve_position,
 )
 
@@ -31,8 +31,8 @@ def validate_fields(extraction: ExtractionResult) -> ValidationResult:
 
     if not extraction.position:
         result.missing_fields.append("position")
-    elif extraction.position.strip().lower() in AMBIGUOUS_TERMS:
-        result.ambiguous_fields["position"] = DISAMBIGUATION_OPTIONS
+    elif is_ambiguous_position(extraction.position):
+        result.ambiguous_fields["position"] = disambiguation_options()
         extraction.position = None
 
     if result.missing_fields or result.ambiguous_fields:
@@ -53,7 +53,7 @@ def apply_user_choice(
     """Wendet die Auswahl des Users auf ein mehrdeutiges Feld an."""
 
     if field_name == "position":
-        for option in DISAMBIGUATION_OPTIONS:
+        for option in disambiguation_options():
             if option["key"] == choice_key:
                 extraction.position = option["value"]
                 break
@@ -72,11 +72,11 @@ def _build_reply(
     if "position" in validation.ambiguous_fields:
         raw = extraction.raw_input.strip().split("\n")
         ambig_term = next(
-            (line for line in raw if line.strip().lower() in AMBIGUOUS_TERMS),
+            (line.strip() for line in raw if is_ambiguous_position(line)),
             "Pfleger",
         )
         parts.append(f'\n"{ambig_term}" ist mehrdeutig. Meinst du:')
-        for opt in DISAMBIGUATION_OPTIONS:
+        for opt in validation.ambiguous_fields["position"]:
             parts.append(f"  {opt['key']}. {opt['label']}")
 
     if validation.missing_fields:
@@ -0,0 +1,3 @@
+from app.jobs.queue import JobWorkerPool, RetryLater, enqueue, register_handler, wake_workers
+
+__all__ = ["JobWorkerPool", "RetryLater", "enqueue", "register_handler", "wake_workers"]
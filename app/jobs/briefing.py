@@ -0,0 +1,175 @@
+"""Job-Handler: LLM-Extraktion und Manus-Übergabe für eingereihte Briefings."""
+
+import asyncio
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import metrics
+from app.briefing import BRIEFING_JOB, BULK_BRIEFING_JOB, apply_extraction
+from app.coalescing import attach, briefing_ordering_key, find_inflight_task, settle_waiting_tasks
+from app.config import settings
+from app.input_processor import InputModus, extract_fields, validate_fields
+from app.input_processor.extractor import ExtractionResult
+from app.input_processor.validator import ValidationResult
+from app.jobs.queue import RetryLater, enqueue, job_payload, register_handler, wake_workers
+from app.jobs.webhook import DELIVERY_JOB, enqueue_delivery
+from app.manus.resilience import CircuitOpenError
+from app.manus.submission import QUEUED_MESSAGE, submit_task
+from app.models.job import Job
+from app.models.task import AnalysisTask, TaskStatus
+from app.notifications import notify_user
+from app.report_cache import REFRESH_KEYWORD, find_cached_report, reuse_report
+
+logger = logging.getLogger(__name__)
+
+
+async def _notify(task: AnalysisTask, text: str) -> None:
+    """Benachrichtigt den Absender; ein Fehler beim Senden bricht den Job nicht ab.
+
+    Sonst würde der Job wiederholt bzw. als Manus-Fehler verbucht, obwohl nur
+    Teams/Slack nicht erreichbar war.
+    """
+    try:
+        await notify_user(task, text)
+    except Exception as e:
+        metrics.inc("briefing_notifications_failed_total")
+        logger.error("Benachrichtigung für Task %s fehlgeschlagen: %s", task.id, e, exc_info=True)
+
+
+# Vorangestellt, wenn eine vorab gesendete Bestätigung nicht mehr stimmt
+CORRECTION_PREFIX = "Korrektur zu meiner Bestätigung von eben:\n\n"
+
+
+def _mandatory(extraction: ExtractionResult) -> tuple:
+    return extraction.unternehmen, extraction.standort, extraction.position
+
+
+async def _confirm(
+    task: AnalysisTask, validation: ValidationResult, confirmed: ExtractionResult | None
+) -> None:
+    """Antwortet auf die Validierung – oder korrigiert eine vorab gesendete Bestätigung.
+
+    Wurde aus dem Stream schon bestätigt und die Pflichtfelder sind gleich
+    geblieben, wird nichts mehr gesendet.
+    """
+    if confirmed is None:
+        await _notify(task, validation.reply_message)
+    elif not validation.is_valid or _mandatory(confirmed) != _mandatory(validation.extraction):
+        metrics.inc("briefing_early_confirmations_corrected_total")
+        await _notify(task, CORRECTION_PREFIX + validation.reply_message)
+
+
+async def process_briefing(job: Job, db: AsyncSession) -> None:
+    task = await db.get(AnalysisTask, job.task_id)
+    if task is None:
+        logger.warning("Briefing-Job %s: Task %s existiert nicht", job.id, job.task_id)
+        return
+    if task.manus_task_id or task.status != TaskStatus.PENDING:
+        return
+
+    payload = job_payload(job)
+    if not task.manus_prompt:
+        modus = InputModus(task.input_modus)
+        early: list[tuple[ExtractionResult, asyncio.Task]] = []
+
+        async def confirm_early(partial: ExtractionResult) -> None:
+            # Bestätigung schon senden, während zusatzkontext noch gestreamt wird;
+            # bricht der Stream danach ab, korrigiert _confirm sie
+            early_validation = validate_fields(partial)
+            if early_validation.is_valid:
+                early.append((partial, asyncio.create_task(_notify(task, early_validation.reply_message))))
+
+        extraction = await extract_fields(payload["text"], modus, on_mandatory_fields=confirm_early)
+        validation = validate_fields(extraction)
+        confirmed = None
+        if early:
+            confirmed, reply = early[0]
+            await reply
+
+        if not validation.is_valid:
+            task.status = TaskStatus.FAILED
+            task.error_message = "Eingabe unvollständig"
+            await db.commit()
+            await _confirm(task, validation, confirmed)
+            return
+
+        apply_extraction(task, extraction, modus)
+        if job.ordering_key is None:
+            # Schlüssel erst jetzt bekannt: Fortsetzung in die Reihe identischer Briefings
+            enqueue(
+                db,
+                job.kind,
+                task_id=task.id,
+                payload=payload,
+                ordering_key=briefing_ordering_key(task.cache_key),
+            )
+            await db.commit()
+            wake_workers(job.kind)
+            await _confirm(task, validation, confirmed)
+            return
+        await db.commit()
+        await _confirm(task, validation, confirmed)
+
+    if not payload.get("force_refresh"):
+        cached = await find_cached_report(db, task.cache_key)
+        if cached is not None:
+            reuse_report(task, cached)
+            enqueue_delivery(db, task)
+            await db.commit()
+            logger.info("Task %s: Analyse aus Task %s wiederverwendet", task.id, cached.id)
+            await _notify(
+                task,
+                f"Für {task.unternehmen} gibt es bereits eine aktuelle Analyse "
+                f"vom {cached.completed_at:%d.%m.%Y}. Für eine neue Analyse "
+                f"schreibe {REFRESH_KEYWORD} in dein Briefing.",
+            )
+            wake_workers(DELIVERY_JOB)
+            return
+
+    leader = await find_inflight_task(db, task)
+    if leader is not None:
+        attach(task, leader)
+        await db.commit()
+        logger.info("Task %s an laufenden Task %s angehängt", task.id, leader.id)
+        await _notify(
+            task,
+            f"Für {task.unternehmen} läuft bereits eine identische Analyse. "
+            "Du bekommst das Ergebnis, sobald sie fertig ist.",
+        )
+        return
+
+    try:
+        await submit_task(task, db)
+    except CircuitOpenError as e:
+        if job.attempts == 1:
+            await _notify(task, QUEUED_MESSAGE)
+        raise RetryLater(str(e), delay=settings.manus_breaker_reset_timeout)
+
+    logger.info(
+        "Manus task %s erstellt für %s (DB task %s, %s)",
+        task.manus_task_id,
+        task.unternehmen,
+        task.id,
+        task.source_platform,
+    )
+
+
+async def on_briefing_failed(job: Job, db: AsyncSession, error: Exception) -> None:
+    task = await db.get(AnalysisTask, job.task_id)
+    if task is None:
+        return
+    task.status = TaskStatus.FAILED
+    task.error_message = str(error)
+    # Angehängte Tasks teilen das Schicksal des Leaders
+    waiting = await settle_waiting_tasks(db, task)
+    for target in waiting:
+        enqueue_delivery(db, target)
+    await db.commit()
+    if waiting:
+        wake_workers(DELIVERY_JOB)
+    await _notify(task, f"Fehler bei der Manus-API: {error}\nBitte versuche es erneut.")
+
+
+register_handler(BRIEFING_JOB, process_briefing, on_failure=on_briefing_failed)
+register_handler(BULK_BRIEFING_JOB, process_briefing, on_failure=on_briefing_failed)
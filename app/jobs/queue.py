@@ -0,0 +1,247 @@
+"""Datenbank-gestützte Job-Queue mit Worker-Pool.
+
+Jobs werden in derselben Transaktion wie der zugehörige Task gespeichert und
+von einem Pool aus asyncio-Workern abgearbeitet. Nach einem Neustart werden
+offene Jobs einfach weiter abgearbeitet; hängengebliebene RUNNING-Jobs werden
+nach ``job_stale_after`` Sekunden wieder freigegeben.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app import metrics
+from app.config import settings
+from app.models.job import Job, JobStatus
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[Job, AsyncSession], Awaitable[None]]
+FailureHandler = Callable[[Job, AsyncSession, Exception], Awaitable[None]]
+
+
+class RetryLater(Exception):
+    """Vom Handler geworfen, wenn der Job später erneut laufen soll."""
+
+    def __init__(self, reason: str, delay: float):
+        super().__init__(reason)
+        self.delay = delay
+
+
+@dataclass
+class _Registration:
+    handler: JobHandler
+    on_failure: FailureHandler | None = None
+
+
+_HANDLERS: dict[str, _Registration] = {}
+_POOLS: list["JobWorkerPool"] = []
+
+
+def register_handler(
+    kind: str, handler: JobHandler, on_failure: FailureHandler | None = None
+) -> None:
+    """Registriert den Handler für eine Job-Art."""
+    _HANDLERS[kind] = _Registration(handler, on_failure)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def enqueue(
+    db: AsyncSession,
+    kind: str,
+    *,
+    task_id: int | None = None,
+    payload: dict | None = None,
+    ordering_key: str | None = None,
+    delay: float = 0.0,
+) -> Job:
+    """Legt einen Job an. Committet nicht – der Aufrufer committet zusammen mit dem Task.
+
+    Jobs mit gleichem ``ordering_key`` werden strikt nacheinander in
+    Einfüge-Reihenfolge verarbeitet.
+    """
+    job = Job(
+        kind=kind,
+        task_id=task_id,
+        ordering_key=ordering_key,
+        payload=json.dumps(payload or {}, ensure_ascii=False),
+        status=JobStatus.QUEUED,
+        run_after=_utcnow() + timedelta(seconds=delay),
+    )
+    db.add(job)
+    metrics.inc("jobs_enqueued_total", kind=kind)
+    return job
+
+
+def wake_workers(kind: str) -> None:
+    """Weckt wartende Worker für ``kind`` nach einem Commit sofort auf."""
+    for pool in _POOLS:
+        if kind in pool.kinds:
+            pool.wakeup.set()
+
+
+def job_payload(job: Job) -> dict:
+    return json.loads(job.payload or "{}")
+
+
+class JobWorkerPool:
+    """Pool aus ``concurrency`` Workern für die angegebenen Job-Arten."""
+
+    def __init__(self, db_session_factory, kinds: tuple[str, ...], concurrency: int):
+        self.db_session_factory = db_session_factory
+        self.kinds = kinds
+        self.concurrency = max(1, concurrency)
+        self._workers: list[asyncio.Task] = []
+        self.wakeup = asyncio.Event()
+
+    async def start(self) -> None:
+        await self._release_stale_jobs()
+        _POOLS.append(self)
+        self._workers = [
+            asyncio.create_task(self._worker_loop(n), name=f"job-worker-{n}")
+            for n in range(self.concurrency)
+        ]
+        logger.info("Job-Worker gestartet: %s x%d", ",".join(self.kinds), self.concurrency)
+
+    async def stop(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self in _POOLS:
+            _POOLS.remove(self)
+
+    async def _release_stale_jobs(self) -> None:
+        """Gibt RUNNING-Jobs frei, deren Worker abgestürzt oder neu gestartet ist."""
+        cutoff = _utcnow() - timedelta(seconds=settings.job_stale_after)
+        async with self.db_session_factory() as db:
+            result = await db.execute(
+                update(Job)
+                .where(
+                    Job.kind.in_(self.kinds),
+                    Job.status == JobStatus.RUNNING,
+                    Job.locked_at < cutoff,
+                )
+                .values(status=JobStatus.QUEUED, locked_at=None)
+            )
+            await db.commit()
+            if result.rowcount:
+                logger.warning("%d hängengebliebene Jobs wieder eingereiht", result.rowcount)
+
+    async def _claim_next(self) -> int | None:
+        """Reserviert atomar den nächsten fälligen Job und liefert dessen ID."""
+        earlier = aliased(Job)
+        blocked_by_earlier = exists().where(
+            earlier.ordering_key == Job.ordering_key,
+            earlier.id < Job.id,
+            earlier.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+        )
+        async with self.db_session_factory() as db:
+            candidates = await db.scalars(
+                select(Job.id)
+                .where(
+                    Job.kind.in_(self.kinds),
+                    Job.status == JobStatus.QUEUED,
+                    Job.run_after <= _utcnow(),
+                    or_(Job.ordering_key.is_(None), ~blocked_by_earlier),
+                )
+                .order_by(Job.id)
+                .limit(self.concurrency * 2)
+            )
+            for job_id in candidates.all():
+                result = await db.execute(
+                    update(Job)
+                    .where(Job.id == job_id, Job.status == JobStatus.QUEUED)
+                    .values(
+                        status=JobStatus.RUNNING,
+                        locked_at=_utcnow(),
+                        attempts=Job.attempts + 1,
+                    )
+                )
+                await db.commit()
+                if result.rowcount == 1:
+                    return job_id
+            return None
+
+    async def _worker_loop(self, n: int) -> None:
+        while True:
+            try:
+                job_id = await self._claim_next()
+            except Exception as e:
+                logger.error("Job-Worker %d: Fehler beim Abholen: %s", n, e, exc_info=True)
+                job_id = None
+
+            if job_id is None:
+                self.wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.wakeup.wait(), timeout=settings.job_poll_interval)
+                except asyncio.TimeoutError:
+                    if n == 0:
+                        await self._release_stale_jobs()
+                continue
+
+            await self._run(job_id)
+
+    async def _run(self, job_id: int) -> None:
+        async with self.db_session_factory() as db:
+            try:
+                job = await db.get(Job, job_id)
+                registration = _HANDLERS.get(job.kind)
+                if registration is None:
+                    job.status = JobStatus.FAILED
+                    job.last_error = f"Kein Handler für Job-Art '{job.kind}'"
+                    await db.commit()
+                    return
+
+                try:
+                    await registration.handler(job, db)
+                except RetryLater as e:
+                    await db.rollback()
+                    await db.refresh(job)
+                    if job.attempts >= settings.job_max_attempts:
+                        await self._fail(job, db, registration, e)
+                        return
+                    job.status = JobStatus.QUEUED
+                    job.locked_at = None
+                    job.last_error = str(e)
+                    job.run_after = _utcnow() + timedelta(seconds=e.delay)
+                    await db.commit()
+                    metrics.inc("jobs_retried_total", kind=job.kind)
+                    return
+                except Exception as e:
+                    await db.rollback()
+                    await db.refresh(job)
+                    logger.error("Job %s (%s) fehlgeschlagen: %s", job_id, job.kind, e, exc_info=True)
+                    await self._fail(job, db, registration, e)
+                    return
+
+                job.status = JobStatus.DONE
+                job.locked_at = None
+                await db.commit()
+                metrics.inc("jobs_completed_total", kind=job.kind)
+            except Exception as e:
+                logger.error("Job %s: unerwarteter Fehler im Worker: %s", job_id, e, exc_info=True)
+
+    async def _fail(
+        self, job: Job, db: AsyncSession, registration: _Registration, error: Exception
+    ) -> None:
+        job.status = JobStatus.FAILED
+        job.locked_at = None
+        job.last_error = str(error)
+        await db.commit()
+        metrics.inc("jobs_failed_total", kind=job.kind)
+        if registration.on_failure is not None:
+            try:
+                await registration.on_failure(job, db, error)
+            except Exception as e:
+                logger.error("on_failure für Job %s fehlgeschlagen: %s", job.id, e, exc_info=True)
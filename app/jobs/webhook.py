@@ -0,0 +1,64 @@
+"""Job-Handler: Verarbeitung eingegangener Manus-Webhooks im Hintergrund."""
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.coalescing import settle_waiting_tasks
+from app.jobs.queue import RetryLater, enqueue, job_payload, register_handler, wake_workers
+from app.manus.schemas import WebhookEvent
+from app.manus.webhook_handler import handle_manus_webhook
+from app.models.job import Job
+from app.models.task import AnalysisTask, TaskStatus
+from app.notifications import deliver_result
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_JOB = "manus_webhook"
+DELIVERY_JOB = "deliver_result"
+
+# Zustellung an Teams/Slack wird bei Fehlern einige Male wiederholt
+_DELIVERY_ATTEMPTS = 3
+_DELIVERY_RETRY_DELAY = 30.0
+
+
+def enqueue_delivery(db: AsyncSession, task: AnalysisTask) -> None:
+    """Reiht die Zustellung des Ergebnisses ein (Commit durch den Aufrufer)."""
+    enqueue(db, DELIVERY_JOB, task_id=task.id)
+
+
+async def process_webhook_event(job: Job, db: AsyncSession) -> None:
+    event = WebhookEvent(**job_payload(job))
+
+    task = await handle_manus_webhook(event, db)
+    if not task:
+        logger.info("Webhook-Job %s: nichts zu tun (Task unbekannt oder abgeschlossen)", job.id)
+        return
+
+    if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED):
+        # Auch Fehler werden zugestellt – angehängte Tasks warten sonst ewig
+        waiting = await settle_waiting_tasks(db, task)
+        for target in (task, *waiting):
+            enqueue_delivery(db, target)
+        if waiting:
+            logger.info("Ergebnis von Task %s an %d wartende Tasks verteilt", task.id, len(waiting))
+
+    await db.commit()
+    wake_workers(DELIVERY_JOB)
+
+
+async def process_delivery(job: Job, db: AsyncSession) -> None:
+    task = await db.get(AnalysisTask, job.task_id)
+    if task is None:
+        return
+    try:
+        await deliver_result(task)
+    except Exception as e:
+        logger.error("Fehler beim Senden der Präsentation: %s", e, exc_info=True)
+        if job.attempts < _DELIVERY_ATTEMPTS:
+            raise RetryLater(f"Zustellung fehlgeschlagen: {e}", delay=_DELIVERY_RETRY_DELAY)
+        raise
+
+
+register_handler(WEBHOOK_JOB, process_webhook_event)
+register_handler(DELIVERY_JOB, process_delivery)
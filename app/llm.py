@@ -0,0 +1,158 @@
+"""Gemeinsamer OpenAI-Client mit Parallelitäts- und Token-Limit.
+
+Der Client wird einmal im FastAPI-Lifespan erzeugt, damit der HTTP-Pool
+zwischen Extraktionen wiederverwendet wird. Jeder Request wartet lokal auf
+einen freien Slot (Semaphore) und auf genug Token-Budget pro Minute, statt
+bei Lastspitzen eine Welle von 429-Fehlern auszulösen.
+"""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from openai import AsyncOpenAI
+
+from app import metrics
+from app.config import settings
+
+_openai_client: AsyncOpenAI | None = None
+_semaphore: asyncio.Semaphore | None = None
+_limiter: "TokenRateLimiter | None" = None
+_inflight = 0
+
+# Grobe Schätzung für deutsche Texte (OpenAI: ~4 Zeichen pro Token)
+_CHARS_PER_TOKEN = 4
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Liefert den gemeinsamen AsyncOpenAI-Client (wird bei Bedarf erzeugt)."""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            timeout=settings.openai_timeout,
+            max_retries=settings.openai_max_retries,
+        )
+    return _openai_client
+
+
+async def close_openai_client() -> None:
+    """Schließt den gemeinsamen Client (Lifespan-Shutdown)."""
+    global _openai_client
+    if _openai_client is not None:
+        await _openai_client.close()
+        _openai_client = None
+
+
+class TokenRateLimiter:
+    """Token-Bucket: füllt sich mit ``tokens_per_minute / 60`` Token pro Sekunde."""
+
+    def __init__(self, tokens_per_minute: int):
+        self.capacity = float(tokens_per_minute)
+        self.rate = tokens_per_minute / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int) -> float:
+        """Wartet, bis ``tokens`` verfügbar sind. Liefert die Wartezeit in Sekunden."""
+        tokens = min(float(tokens), self.capacity)
+        waited = 0.0
+        # Lock = FIFO: ein großer Request wird nicht von kleinen überholt
+        async with self._lock:
+            self._refill()
+            while self._tokens < tokens:
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self._tokens -= tokens
+        return waited
+
+    def adjust(self, estimated: int, actual: int) -> None:
+        """Korrigiert das Budget um die Differenz aus Schätzung und tatsächlichem Verbrauch."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + estimated - actual)
+
+
+def _get_limits() -> tuple[asyncio.Semaphore, TokenRateLimiter | None]:
+    global _semaphore, _limiter
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(max(1, settings.openai_max_concurrency))
+        if settings.openai_tokens_per_minute > 0:
+            _limiter = TokenRateLimiter(settings.openai_tokens_per_minute)
+    return _semaphore, _limiter
+
+
+def estimate_tokens(messages: list[dict], max_tokens: int) -> int:
+    """Obergrenze für den Verbrauch eines Requests: Prompt-Schätzung plus max_tokens."""
+    chars = sum(len(m.get("content") or "") for m in messages)
+    return chars // _CHARS_PER_TOKEN + max_tokens
+
+
+@asynccontextmanager
+async def _request_slot(estimated: int):
+    """Wartet auf Token-Budget und freien Slot; ``usage["total"]`` wird danach verrechnet."""
+    global _inflight
+    semaphore, limiter = _get_limits()
+
+    if limiter is not None:
+        waited = await limiter.acquire(estimated)
+        if waited:
+            metrics.inc("llm_rate_limit_wait_seconds_total", waited)
+
+    usage: dict[str, int | None] = {"total": None}
+    async with semaphore:
+        _inflight += 1
+        metrics.set_gauge("llm_requests_inflight", _inflight)
+        try:
+            yield usage
+        except Exception:
+            metrics.inc("llm_requests_total", outcome="error")
+            raise
+        finally:
+            _inflight -= 1
+            metrics.set_gauge("llm_requests_inflight", _inflight)
+
+    metrics.inc("llm_requests_total", outcome="ok")
+    if usage["total"] is not None:
+        metrics.inc("llm_tokens_total", usage["total"])
+        if limiter is not None:
+            limiter.adjust(estimated, usage["total"])
+
+
+async def chat_completion(*, messages: list[dict], max_tokens: int, **kwargs):
+    """``chat.completions.create`` über den gemeinsamen Client, gedrosselt."""
+    async with _request_slot(estimate_tokens(messages, max_tokens)) as usage:
+        response = await get_openai_client().chat.completions.create(
+            messages=messages, max_tokens=max_tokens, **kwargs
+        )
+        if response.usage is not None:
+            usage["total"] = response.usage.total_tokens
+    return response
+
+
+async def stream_chat_completion(
+    *, messages: list[dict], max_tokens: int, **kwargs
+) -> AsyncIterator[str]:
+    """Wie ``chat_completion``, liefert aber die Text-Deltas, sobald sie eintreffen."""
+    async with _request_slot(estimate_tokens(messages, max_tokens)) as usage:
+        stream = await get_openai_client().chat.completions.create(
+            messages=messages,
+            max_tokens=max_tokens,
+            stream=True,
+            stream_options={"include_usage": True},
+            **kwargs,
+        )
+        async for chunk in stream:
+            if chunk.usage is not None:
+                usage["total"] = chunk.usage.total_tokens
+            for choice in chunk.choices:
+                if choice.delta.content:
+                    yield choice.delta.content
@@ -1,41 +1,49 @@
 """FastAPI Application – Haupteinstiegspunkt."""
 
-import json
+import asyncio
 import logging
+import secrets
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
-from botbuilder.core import TurnContext
-from botbuilder.schema import Activity, ConversationReference
-from fastapi import Depends, FastAPI, HTTPException, Request
+from botbuilder.schema import Activity
+from fastapi import Body, Depends, FastAPI, Header, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app import metrics
+from app.briefing import BRIEFING_JOB, BULK_BRIEFING_JOB, accept_briefing
+from app.bulk import BulkImport, detect_format, ndjson_lines, parse_rows
 from app.config import settings
-from app.database import get_db, init_db
-from app.input_processor import (
-    build_manus_prompt,
-    build_talent_report_prompt,
-    classify_input,
-    extract_fields,
-    validate_fields,
-    InputModus,
+from app.database import AsyncSessionLocal, dispose_db, engine, get_db, init_db
+from app.input_processor.llm_cache import purge_llm_cache_loop
+from app.input_processor.taxonomy import (
+    TaxonomyError,
+    current_taxonomy,
+    reload_taxonomy,
+    save_taxonomy,
+    watch_taxonomy_loop,
 )
-from app.manus.client import ManusClient
+from app.jobs import JobWorkerPool, enqueue, wake_workers
+from app.jobs.briefing import process_briefing  # noqa: F401  (registriert den Job-Handler)
+from app.jobs.webhook import DELIVERY_JOB, WEBHOOK_JOB
+from app.llm import close_openai_client, get_openai_client
+from app.manus.client import close_http_client, get_http_client
+from app.manus.dedupe import purge_expired_events_loop, remember_event
+from app.manus.reconciler import TaskReconciler
 from app.manus.schemas import WebhookEvent
-from app.manus.webhook_handler import handle_manus_webhook
-from app.models.task import AnalysisTask, TaskStatus
+from app.models.job import Job
+from app.models.task import AnalysisTask
 from app.teams.messages import adapter, bot
 
 slack_handler = None
-slack_web_client = None
 if settings.slack_bot_token and settings.slack_signing_secret:
     from app.slack.app import slack_app
     from slack_bolt.adapter.fastapi.async_handler import AsyncSlackRequestHandler
-    from slack_sdk.web.async_client import AsyncWebClient
 
     slack_handler = AsyncSlackRequestHandler(slack_app)
-    slack_web_client = AsyncWebClient(token=settings.slack_bot_token)
 
 logging.basicConfig(
     level=getattr(logging, settings.log_level.upper(), logging.INFO),
@@ -47,9 +55,45 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Initialisiere Datenbank...")
-    init_db()
+    await init_db()
+    get_http_client()
+    if settings.openai_api_key:
+        get_openai_client()
+    briefing_workers = JobWorkerPool(
+        AsyncSessionLocal, kinds=(BRIEFING_JOB,), concurrency=settings.job_worker_concurrency
+    )
+    bulk_workers = JobWorkerPool(
+        AsyncSessionLocal, kinds=(BULK_BRIEFING_JOB,), concurrency=settings.bulk_manus_concurrency
+    )
+    webhook_workers = JobWorkerPool(
+        AsyncSessionLocal, kinds=(WEBHOOK_JOB, DELIVERY_JOB), concurrency=settings.webhook_worker_concurrency
+    )
+    await briefing_workers.start()
+    await bulk_workers.start()
+    await webhook_workers.start()
+    dedupe_purger = asyncio.create_task(purge_expired_events_loop(AsyncSessionLocal))
+    llm_cache_purger = asyncio.create_task(purge_llm_cache_loop(AsyncSessionLocal))
+    reconciler = None
+    if settings.reconcile_enabled:
+        reconciler = asyncio.create_task(TaskReconciler(AsyncSessionLocal, engine).run())
+    taxonomy_watcher = None
+    if settings.taxonomy_reload_interval > 0:
+        taxonomy_watcher = asyncio.create_task(watch_taxonomy_loop())
     logger.info("SalesBot Backend gestartet (env=%s)", settings.environment)
     yield
+    dedupe_purger.cancel()
+    llm_cache_purger.cancel()
+    if taxonomy_watcher is not None:
+        taxonomy_watcher.cancel()
+    if reconciler is not None:
+        reconciler.cancel()
+        await asyncio.gather(reconciler, return_exceptions=True)
+    await webhook_workers.stop()
+    await bulk_workers.stop()
+    await briefing_workers.stop()
+    await close_http_client()
+    await close_openai_client()
+    await dispose_db()
     logger.info("SalesBot Backend heruntergefahren.")
 
 
@@ -73,6 +117,12 @@ async def health():
     }
 
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """In-Process-Metriken (Retries, Circuit Breaker, ...) für Monitoring."""
+    return metrics.snapshot()
+
+
 # ---------------------------------------------------------------------------
 # Briefing-Endpoint (HTTP-Test-Schnittstelle)
 # ---------------------------------------------------------------------------
@@ -92,164 +142,134 @@ class BriefingResponse(BaseModel):
 
 @app.post("/api/briefing", response_model=BriefingResponse)
 async def create_briefing(
-    request: BriefingRequest, db: Session = Depends(get_db)
+    request: BriefingRequest, db: AsyncSession = Depends(get_db)
 ):
-    """Nimmt ein Briefing entgegen, normalisiert es und schickt es an Manus."""
-    modus = classify_input(request.text)
-    extraction = await extract_fields(request.text, modus)
-    validation = validate_fields(extraction)
-
-    if not validation.is_valid:
-        return BriefingResponse(
-            message=validation.reply_message or "Eingabe unvollständig.",
-            status="needs_input",
-        )
-
-    # Routing: Talent-Report oder HiOffice-Wettbewerbsanalyse
-    if modus == InputModus.TALENT_REPORT:
-        manus_prompt = build_talent_report_prompt(extraction)
-        raw_id = (settings.manus_talent_report_project_id or "").strip() or (settings.manus_project_id or "").strip()
-        project_id = raw_id or None
-        logger.info(
-            "Talent-Report: MANUS_TALENT_REPORT_PROJECT_ID=%s, verwende project_id=%s",
-            "gesetzt" if (settings.manus_talent_report_project_id or "").strip() else "leer",
-            "gesetzt" if project_id else "leer (404 moeglich)",
-        )
-    else:
-        manus_prompt = build_manus_prompt(extraction)
-        project_id = (settings.manus_project_id or "").strip() or None
-
-    task = AnalysisTask(
-        unternehmen=extraction.unternehmen,
-        standort=extraction.standort,
-        position=extraction.position,
-        zusatzkontext=extraction.zusatzkontext,
-        manus_prompt=manus_prompt,
-        input_modus=modus.value,
+    """Nimmt ein Briefing entgegen, normalisiert es und reiht es für Manus ein."""
+    ack = await accept_briefing(
+        request.text,
+        db,
         teams_user_id=request.user_id,
         teams_user_name=request.user_name,
-        status=TaskStatus.PROCESSING,
     )
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-
-    try:
-        manus_client = ManusClient(project_id=project_id)
-        manus_response = await manus_client.create_task(manus_prompt)
-        task.manus_task_id = manus_response.task_id
-        db.commit()
-    except Exception as e:
-        logger.error("Manus API Fehler: %s", e)
-        task.status = TaskStatus.FAILED
-        task.error_message = str(e)
-        db.commit()
+    if ack.task is None:
         return BriefingResponse(
-            message=f"Manus API Fehler: {e}",
-            task_id=task.id,
-            status="failed",
+            message=ack.message or "Eingabe unvollständig.",
+            status=ack.status,
         )
 
     return BriefingResponse(
-        message=validation.reply_message or "Wettbewerbsanalyse wird erstellt...",
-        task_id=task.id,
-        manus_task_id=manus_response.task_id,
-        manus_prompt=manus_prompt,
-        status="processing",
+        message=ack.message,
+        task_id=ack.task.id,
+        manus_prompt=ack.task.manus_prompt,
+        status=ack.status,
     )
 
 
 # ---------------------------------------------------------------------------
-# Manus Webhook
+# Admin-Zugriff (X-Admin-Key)
 # ---------------------------------------------------------------------------
-@app.post("/api/manus/webhook")
-async def manus_webhook(request: Request, db: Session = Depends(get_db)):
-    """Empfängt Webhook-Events von Manus und liefert Ergebnisse an Teams."""
-    body = await request.json()
-    logger.info("Manus webhook empfangen: %s", body.get("event_type", "unknown"))
+def require_admin(x_admin_key: str = Header(default="")) -> None:
+    if not settings.admin_api_key:
+        raise HTTPException(status_code=503, detail="Admin-API ist nicht konfiguriert")
+    if not secrets.compare_digest(x_admin_key, settings.admin_api_key):
+        raise HTTPException(status_code=401, detail="Ungültiger Admin-Key")
 
-    event = WebhookEvent(**body)
 
-    task = await handle_manus_webhook(event, db)
-    if not task:
-        return {"status": "ok", "detail": "Task nicht in DB (ggf. test event)"}
-
-    if task.status == TaskStatus.COMPLETED:
-        try:
-            if task.source_platform == "slack" and task.slack_channel_id:
-                await _send_result_to_slack(task)
-                logger.info(
-                    "Präsentation an Slack-User %s gesendet (Task %s)",
-                    task.slack_user_id,
-                    task.id,
-                )
-            elif task.conversation_reference:
-                await _send_result_to_teams(task)
-                logger.info(
-                    "Präsentation an %s gesendet (Task %s)",
-                    task.teams_user_name,
-                    task.id,
-                )
-        except Exception as e:
-            logger.error("Fehler beim Senden der Präsentation: %s", e, exc_info=True)
-
-    return {"status": "ok", "task_id": task.id, "task_status": task.status.value}
-
-
-async def _send_result_to_teams(task: AnalysisTask):
-    """Sendet den PDF-Download-Link der fertigen Praesentation proaktiv an Teams."""
-    conv_ref_data = json.loads(task.conversation_reference)
-    conv_ref = ConversationReference().deserialize(conv_ref_data)
-
-    display_name = task.unternehmen or "Wettbewerbsanalyse"
-    file_name = task.result_file_name or "Wettbewerbsanalyse.pdf"
-    download_url = task.result_file_url
-
-    if download_url:
-        link_text = (
-            f"Die Wettbewerbsanalyse für **{display_name}** ist fertig!\n\n"
-            f"📄 [{file_name}]({download_url})"
-        )
-    else:
-        link_text = (
-            f"Die Wettbewerbsanalyse für **{display_name}** wurde abgeschlossen, "
-            "aber es konnte kein Download-Link ermittelt werden. "
-            "Bitte prüfe den Status direkt in Manus."
+# ---------------------------------------------------------------------------
+# Bulk-Import (CRM-Listen)
+# ---------------------------------------------------------------------------
+@app.post("/api/bulk/briefings", dependencies=[Depends(require_admin)])
+async def bulk_briefings(
+    request: Request,
+    fmt: str | None = Query(default=None, alias="format"),
+    dry_run: bool = False,
+):
+    """Nimmt eine CSV-/JSONL-Liste entgegen und streamt das Ergebnis pro Zeile als NDJSON.
+
+    Gültige Zeilen werden für Manus eingereiht (``bulk_manus_concurrency``
+    parallel); mit ``dry_run=true`` wird nur klassifiziert, extrahiert und
+    validiert. Erfordert den Header ``X-Admin-Key``.
+    """
+    data = (await request.body()).decode("utf-8-sig")
+    try:
+        rows = parse_rows(data, fmt or detect_format(data, request.headers.get("content-type")))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if len(rows) > settings.bulk_max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Zu viele Zeilen: {len(rows)} (max. {settings.bulk_max_rows})",
         )
 
-    async def send_link(turn_context: TurnContext):
-        await turn_context.send_activity(link_text)
+    bulk = BulkImport(AsyncSessionLocal, dry_run=dry_run)
+    return StreamingResponse(ndjson_lines(bulk.run(rows)), media_type="application/x-ndjson")
 
-    await adapter.continue_conversation(conv_ref, send_link, settings.microsoft_app_id)
 
+# ---------------------------------------------------------------------------
+# Admin: Positions-Taxonomie
+# ---------------------------------------------------------------------------
+def _taxonomy_info() -> dict:
+    taxonomy = current_taxonomy()
+    return {
+        "version": taxonomy.version,
+        "positions": len(set(taxonomy.position_map.values())),
+        "terms": len(taxonomy.position_map),
+        "ambiguous_terms": len(taxonomy.ambiguous_terms),
+        "source": taxonomy.source,
+        "loaded_at": taxonomy.loaded_at.isoformat() if taxonomy.loaded_at else None,
+    }
+
+
+@app.get("/api/admin/taxonomy", dependencies=[Depends(require_admin)])
+async def get_taxonomy():
+    """Aktive Taxonomie-Version (Quelle, Ladezeitpunkt, Umfang)."""
+    return _taxonomy_info()
+
+
+@app.post("/api/admin/taxonomy/reload", dependencies=[Depends(require_admin)])
+async def reload_taxonomy_endpoint():
+    """Lädt ``TAXONOMY_PATH`` sofort neu; bei Fehlern bleibt die alte Version aktiv."""
+    try:
+        await asyncio.to_thread(reload_taxonomy)
+    except TaxonomyError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _taxonomy_info()
 
-async def _send_result_to_slack(task: AnalysisTask):
-    """Sendet den PDF-Download-Link der fertigen Praesentation proaktiv an Slack."""
-    display_name = task.unternehmen or "Wettbewerbsanalyse"
-    file_name = task.result_file_name or "Wettbewerbsanalyse.pdf"
-    download_url = task.result_file_url
-    
-    user_mention = f"<@{task.slack_user_id}>" if task.slack_user_id else ""
-    
-    if download_url:
-        message = (
-            f"{user_mention} Die Wettbewerbsanalyse für *{display_name}* ist fertig!\n\n"
-            f"📄 <{download_url}|{file_name}>"
-        )
-    else:
-        message = (
-            f"{user_mention} Die Wettbewerbsanalyse für *{display_name}* wurde abgeschlossen, "
-            "aber es konnte kein Download-Link ermittelt werden. "
-            "Bitte prüfe den Status direkt in Manus."
-        )
-    
-    if slack_web_client is None:
-        logger.error("Slack nicht konfiguriert – kann Ergebnis nicht senden")
-        return
-    await slack_web_client.chat_postMessage(
-        channel=task.slack_channel_id,
-        text=message,
-    )
+
+@app.put("/api/admin/taxonomy", dependencies=[Depends(require_admin)])
+async def put_taxonomy(data: dict = Body(...)):
+    """Ersetzt die Taxonomie (gleiches JSON-Format wie die Datei) ohne Neustart."""
+    try:
+        await asyncio.to_thread(save_taxonomy, data)
+    except TaxonomyError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _taxonomy_info()
+
+
+# ---------------------------------------------------------------------------
+# Manus Webhook
+# ---------------------------------------------------------------------------
+@app.post("/api/manus/webhook")
+async def manus_webhook(request: Request, db: AsyncSession = Depends(get_db)):
+    """Empfängt Webhook-Events von Manus.
+
+    Das Event wird nur persistiert und sofort bestätigt; DB-Update und
+    Zustellung an Teams/Slack übernimmt der Webhook-Worker (geordnet pro Task).
+    Bereits bekannte event_ids (Redelivery) kosten nur einen Index-Lookup.
+    """
+    body = await request.json()
+    event = WebhookEvent(**body)
+    logger.info("Manus webhook empfangen: %s (%s)", event.event_type, event.task_id)
+
+    if not await remember_event(db, event):
+        logger.info("Manus webhook %s bereits verarbeitet – ignoriert", event.event_id)
+        return {"status": "duplicate", "event_id": event.event_id}
+
+    job = enqueue(db, WEBHOOK_JOB, payload=body, ordering_key=event.task_id)
+    await db.commit()
+    wake_workers(WEBHOOK_JOB)
+
+    return {"status": "accepted", "job_id": job.id}
 
 
 # ---------------------------------------------------------------------------
@@ -283,12 +303,19 @@ async def teams_messages(request: Request):
 # Task-Status (Debug)
 # ---------------------------------------------------------------------------
 @app.get("/api/tasks/{task_id}")
-async def get_task(task_id: int, db: Session = Depends(get_db)):
+async def get_task(task_id: int, db: AsyncSession = Depends(get_db)):
     """Task-Status abfragen (für Debugging und Monitoring)."""
-    task = db.query(AnalysisTask).filter(AnalysisTask.id == task_id).first()
+    task = await db.get(AnalysisTask, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task nicht gefunden")
 
+    job = await db.scalar(
+        select(Job)
+        .where(Job.task_id == task.id)
+        .order_by(Job.id.desc())
+        .limit(1)
+    )
+
     return {
         "id": task.id,
         "unternehmen": task.unternehmen,
@@ -299,6 +326,21 @@ async def get_task(task_id: int, db: Session = Depends(get_db)):
         "result_file_url": task.result_file_url,
         "result_file_name": task.result_file_name,
         "error_message": task.error_message,
+        "coalesced_into_task_id": task.coalesced_into_task_id,
         "created_at": task.created_at.isoformat() if task.created_at else None,
         "completed_at": task.completed_at.isoformat() if task.completed_at else None,
+        "job": _job_status(job),
+    }
+
+
+def _job_status(job: Job | None) -> dict | None:
+    if job is None:
+        return None
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "status": job.status.value,
+        "attempts": job.attempts,
+        "last_error": job.last_error,
+        "run_after": job.run_after.isoformat() if job.run_after else None,
     }
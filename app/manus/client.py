@@ -5,17 +5,74 @@ import logging
 import httpx
 
 from app.config import settings
+from app.manus.resilience import call_with_resilience
 from app.manus.schemas import CreateTaskRequest, TaskResponse
 
 logger = logging.getLogger(__name__)
 
+# Prozessweiter Client: wird im FastAPI-Lifespan erzeugt und geschlossen,
+# damit TCP/TLS-Verbindungen zwischen Briefings wiederverwendet werden.
+_http_client: httpx.AsyncClient | None = None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.manus_http_max_connections,
+        max_keepalive_connections=settings.manus_http_max_keepalive,
+        keepalive_expiry=settings.manus_http_keepalive_expiry,
+    )
+    http2 = settings.manus_http2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("MANUS_HTTP2 aktiv, aber Paket 'h2' fehlt – verwende HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=http2,
+        timeout=httpx.Timeout(
+            settings.manus_timeout_get, connect=settings.manus_connect_timeout
+        ),
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Liefert den gemeinsamen AsyncClient (wird bei Bedarf erzeugt)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = _build_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Schließt den gemeinsamen AsyncClient (Lifespan-Shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _timeout(seconds: float) -> httpx.Timeout:
+    return httpx.Timeout(seconds, connect=settings.manus_connect_timeout)
+
 
 class ManusClient:
-    def __init__(self, project_id: str | None = None):
+    def __init__(
+        self,
+        project_id: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self.base_url = settings.manus_api_base_url.rstrip("/")
         self.api_key = settings.manus_api_key
         raw = project_id if project_id is not None else (settings.manus_project_id or None)
         self.project_id = (raw.strip() if raw else None) or None
+        self._http_client = http_client
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        return self._http_client or get_http_client()
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -23,8 +80,14 @@ class ManusClient:
             "Content-Type": "application/json",
         }
 
-    async def create_task(self, prompt: str) -> TaskResponse:
-        """Erstellt einen neuen Task in Manus."""
+    async def create_task(
+        self, prompt: str, idempotency_key: str | None = None
+    ) -> TaskResponse:
+        """Erstellt einen neuen Task in Manus.
+
+        ``idempotency_key`` bleibt über alle Retries gleich, damit ein
+        wiederholter Request keinen zweiten Manus-Task anlegt.
+        """
         request = CreateTaskRequest(
             prompt=prompt,
             project_id=self.project_id or None,
@@ -36,33 +99,49 @@ class ManusClient:
             "gesetzt" if self.project_id else "NICHT GESETZT (404-Risiko)",
         )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
+        headers = self._headers()
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+
+        response = await call_with_resilience(
+            "create_task",
+            lambda: self.http.post(
                 f"{self.base_url}/tasks",
-                headers=self._headers(),
+                headers=headers,
                 json=request.model_dump(exclude_none=True),
-            )
-            response.raise_for_status()
-            data = response.json()
+                timeout=_timeout(settings.manus_timeout_create),
+            ),
+            idempotent=False,
+        )
+        data = response.json()
 
         logger.info("Manus task created: %s", data.get("task_id"))
         return TaskResponse(**data)
 
     async def get_task(self, task_id: str) -> TaskResponse:
         """Fragt den Status eines Tasks ab."""
-        async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(
+        response = await call_with_resilience(
+            "get_task",
+            lambda: self.http.get(
                 f"{self.base_url}/tasks/{task_id}",
                 headers=self._headers(),
-            )
-            response.raise_for_status()
-            data = response.json()
+                timeout=_timeout(settings.manus_timeout_get),
+            ),
+            idempotent=True,
+        )
+        data = response.json()
 
         return TaskResponse(**data)
 
     async def download_artifact(self, url: str) -> bytes:
         """Lädt eine Ergebnisdatei (Präsentation) von Manus herunter."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(url, headers=self._headers())
-            response.raise_for_status()
-            return response.content
+        response = await call_with_resilience(
+            "download_artifact",
+            lambda: self.http.get(
+                url,
+                headers=self._headers(),
+                timeout=_timeout(settings.manus_timeout_download),
+            ),
+            idempotent=True,
+        )
+        return response.content
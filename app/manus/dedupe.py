@@ -0,0 +1,74 @@
+"""Dedupe-Store für Manus-Webhooks: jedes event_id wird nur einmal verarbeitet."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import metrics
+from app.config import settings
+from app.manus.schemas import WebhookEvent
+from app.models.webhook_event import ProcessedWebhookEvent
+
+logger = logging.getLogger(__name__)
+
+_PURGE_INTERVAL = 3600.0
+
+
+async def remember_event(db: AsyncSession, event: WebhookEvent) -> bool:
+    """Merkt sich das Event in der laufenden Transaktion.
+
+    Returns:
+        False wenn das event_id bereits bekannt ist (Redelivery).
+        Events ohne event_id werden nie als Duplikat gewertet.
+    """
+    if not event.event_id:
+        return True
+
+    if await db.get(ProcessedWebhookEvent, event.event_id) is not None:
+        metrics.inc("webhook_duplicates_total", event_type=event.event_type)
+        return False
+
+    db.add(
+        ProcessedWebhookEvent(
+            event_id=event.event_id,
+            event_type=event.event_type,
+            manus_task_id=event.task_id,
+        )
+    )
+    try:
+        await db.flush()
+    except IntegrityError:
+        # Parallele Zustellung desselben Events
+        await db.rollback()
+        metrics.inc("webhook_duplicates_total", event_type=event.event_type)
+        return False
+    return True
+
+
+async def purge_expired_events(db: AsyncSession) -> int:
+    """Löscht Dedupe-Einträge, die älter als die TTL sind."""
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+        hours=settings.webhook_dedupe_ttl_hours
+    )
+    result = await db.execute(
+        delete(ProcessedWebhookEvent).where(ProcessedWebhookEvent.received_at < cutoff)
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def purge_expired_events_loop(db_session_factory) -> None:
+    """Hintergrundschleife für die TTL-Bereinigung (im Lifespan gestartet)."""
+    while True:
+        try:
+            async with db_session_factory() as db:
+                removed = await purge_expired_events(db)
+            if removed:
+                logger.info("%d abgelaufene Webhook-Dedupe-Einträge entfernt", removed)
+        except Exception as e:
+            logger.error("Bereinigung der Webhook-Dedupe-Einträge fehlgeschlagen: %s", e)
+        await asyncio.sleep(_PURGE_INTERVAL)
@@ -0,0 +1,246 @@
+"""Reconciler: holt den Manus-Status für Tasks nach, deren Webhook nie ankam.
+
+Hängengebliebene PROCESSING-Tasks werden per ``get_task`` abgefragt. Ist der
+Task bei Manus beendet, wird daraus ein synthetisches ``task_stopped``-Event
+erzeugt und wie ein echter Webhook über die Job-Queue verarbeitet – es gelten
+also dieselben Zustandsübergänge und dieselbe Zustellung.
+
+Es pollt nur der Prozess, der den Lock hält (Postgres: Advisory Lock,
+SQLite: ``flock`` auf ``<db>.reconciler.lock``); weitere uvicorn-Worker
+warten, bis der Lock frei wird.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app import metrics
+from app.config import settings
+from app.jobs.queue import enqueue, wake_workers
+from app.jobs.webhook import WEBHOOK_JOB
+from app.manus.client import ManusClient
+from app.manus.dedupe import remember_event
+from app.manus.resilience import CircuitOpenError
+from app.manus.schemas import TaskResponse, WebhookEvent
+from app.models.task import AnalysisTask, TaskStatus
+
+try:
+    import fcntl
+except ImportError:  # Windows: kein flock, Einzelprozess-Betrieb
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Fester Schlüssel für pg_try_advisory_lock (beliebig, aber projektweit eindeutig)
+RECONCILER_LOCK_KEY = 742_001
+
+_FINISHED_STATES = {"completed", "finished", "stopped"}
+_FAILED_STATES = {"failed", "error", "cancelled"}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _attachment(artifact: dict) -> dict | None:
+    url = artifact.get("url") or artifact.get("file_url") or artifact.get("fileUrl")
+    if not url:
+        return None
+    name = artifact.get("file_name") or artifact.get("fileName") or artifact.get("name")
+    return {"file_name": name or url.rsplit("/", 1)[-1], "url": url}
+
+
+def event_from_task_response(task: TaskResponse) -> WebhookEvent | None:
+    """Übersetzt den Manus-Task-Status in ein ``task_stopped``-Event.
+
+    Returns:
+        None solange der Task bei Manus noch läuft.
+    """
+    state = (task.status or "").lower()
+    if state in _FINISHED_STATES:
+        attachments = [a for a in map(_attachment, task.artifacts or []) if a]
+        detail = {"task_id": task.task_id, "stop_reason": "finish", "attachments": attachments}
+    elif state in _FAILED_STATES:
+        detail = {
+            "task_id": task.task_id,
+            "stop_reason": "error",
+            "message": task.output or f"Manus-Status: {task.status}",
+        }
+    else:
+        return None
+
+    return WebhookEvent(
+        event_id=f"reconcile-{task.task_id}-{state}",
+        event_type="task_stopped",
+        task_detail=detail,
+    )
+
+
+class TaskReconciler:
+    """Periodischer Abgleich hängengebliebener Tasks mit der Manus-API."""
+
+    def __init__(self, db_session_factory, engine: AsyncEngine, client: ManusClient | None = None):
+        self.db_session_factory = db_session_factory
+        self.engine = engine
+        self.client = client or ManusClient()
+        self._interval = settings.reconcile_interval
+        # task.id -> (nächster Abfragezeitpunkt, aktuelles Intervall), monotone Zeit
+        self._schedule: dict[int, tuple[float, float]] = {}
+
+    async def run(self) -> None:
+        """Hintergrundschleife (im Lifespan gestartet)."""
+        while True:
+            try:
+                if self.engine.dialect.name == "postgresql":
+                    await self._run_with_advisory_lock()
+                else:
+                    await self._run_with_file_lock()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Reconciler unterbrochen: %s", e, exc_info=True)
+            metrics.set_gauge("reconciler_leader", 0)
+            await asyncio.sleep(settings.reconcile_max_interval)
+
+    async def _run_with_advisory_lock(self) -> None:
+        # Session-Lock auf einer eigenen Verbindung: stirbt der Prozess,
+        # schließt Postgres die Verbindung und gibt den Lock frei.
+        async with self.engine.connect() as conn:
+            await conn.execution_options(isolation_level="AUTOCOMMIT")
+            locked = await conn.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": RECONCILER_LOCK_KEY}
+            )
+            if not locked:
+                logger.debug("Reconciler: Lock von anderem Prozess gehalten")
+                return
+            logger.info("Reconciler: Advisory Lock erhalten – dieser Prozess gleicht ab")
+            try:
+                await self._run_as_leader()
+            finally:
+                try:
+                    await asyncio.shield(
+                        conn.execute(
+                            text("SELECT pg_advisory_unlock(:key)"), {"key": RECONCILER_LOCK_KEY}
+                        )
+                    )
+                except Exception as e:
+                    logger.warning("Reconciler: Lock-Freigabe fehlgeschlagen: %s", e)
+
+    async def _run_with_file_lock(self) -> None:
+        # SQLite: mehrere uvicorn-Worker können sich eine Datei teilen. Ein
+        # exklusiver flock neben der DB wählt einen aus; stirbt der Prozess,
+        # gibt das Betriebssystem den Lock frei.
+        database = self.engine.url.database
+        if fcntl is None or not database or database == ":memory:":
+            await self._run_as_leader()
+            return
+        with open(f"{database}.reconciler.lock", "a") as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.debug("Reconciler: Datei-Lock von anderem Prozess gehalten")
+                return
+            logger.info("Reconciler: Datei-Lock erhalten – dieser Prozess gleicht ab")
+            try:
+                await self._run_as_leader()
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    async def _run_as_leader(self) -> None:
+        metrics.set_gauge("reconciler_leader", 1)
+        while True:
+            checked = await self.sweep()
+            # Adaptiv: bei Arbeit kurz warten, im Leerlauf bis zum Maximum verdoppeln
+            if checked:
+                self._interval = settings.reconcile_interval
+            else:
+                self._interval = min(self._interval * 2, settings.reconcile_max_interval)
+            await asyncio.sleep(self._interval)
+
+    async def sweep(self) -> int:
+        """Ein Durchlauf: fällige Tasks abfragen. Liefert die Anzahl abgefragter Tasks."""
+        cutoff = _utcnow() - timedelta(seconds=settings.reconcile_stale_after)
+        async with self.db_session_factory() as db:
+            # Nutzt ix_analysis_tasks_status_created_at
+            rows = (
+                await db.execute(
+                    select(AnalysisTask.id, AnalysisTask.manus_task_id)
+                    .where(
+                        AnalysisTask.status == TaskStatus.PROCESSING,
+                        AnalysisTask.created_at < cutoff,
+                        AnalysisTask.updated_at < cutoff,
+                        AnalysisTask.manus_task_id.is_not(None),
+                    )
+                    .order_by(AnalysisTask.created_at)
+                    .limit(settings.reconcile_batch_size * 10)
+                )
+            ).all()
+
+        stale_ids = {row.id for row in rows}
+        self._schedule = {k: v for k, v in self._schedule.items() if k in stale_ids}
+
+        now = time.monotonic()
+        due = [row for row in rows if self._schedule.get(row.id, (0.0, 0.0))[0] <= now]
+        due = due[: settings.reconcile_batch_size]
+        if not due:
+            return 0
+
+        semaphore = asyncio.Semaphore(max(1, settings.reconcile_concurrency))
+        await asyncio.gather(*(self._check(semaphore, row.id, row.manus_task_id) for row in due))
+        metrics.set_gauge("reconciler_stale_tasks", len(stale_ids))
+        return len(due)
+
+    def _back_off(self, task_id: int) -> None:
+        _, interval = self._schedule.get(task_id, (0.0, settings.reconcile_interval / 2))
+        interval = min(interval * 2, settings.reconcile_max_interval)
+        self._schedule[task_id] = (time.monotonic() + interval, interval)
+
+    async def _check(self, semaphore: asyncio.Semaphore, task_id: int, manus_task_id: str) -> None:
+        async with semaphore:
+            try:
+                response = await self.client.get_task(manus_task_id)
+            except CircuitOpenError:
+                self._back_off(task_id)
+                metrics.inc("reconciler_polls_total", outcome="circuit_open")
+                return
+            except Exception as e:
+                logger.warning("Reconciler: get_task(%s) fehlgeschlagen: %s", manus_task_id, e)
+                self._back_off(task_id)
+                metrics.inc("reconciler_polls_total", outcome="error")
+                return
+
+        event = event_from_task_response(response)
+        if event is None:
+            self._back_off(task_id)
+            metrics.inc("reconciler_polls_total", outcome="running")
+            return
+
+        async with self.db_session_factory() as db:
+            if not await remember_event(db, event):
+                # Schon eingereiht (oder echter Webhook da), Job noch nicht durch:
+                # nicht in jedem Sweep erneut abfragen
+                self._back_off(task_id)
+                metrics.inc("reconciler_polls_total", outcome="duplicate")
+                return
+            enqueue(
+                db,
+                WEBHOOK_JOB,
+                task_id=task_id,
+                payload=event.model_dump(),
+                ordering_key=manus_task_id,
+            )
+            await db.commit()
+        wake_workers(WEBHOOK_JOB)
+
+        self._schedule.pop(task_id, None)
+        metrics.inc("reconciler_polls_total", outcome="recovered")
+        logger.warning(
+            "Reconciler: Webhook für Manus task %s fehlte – Status '%s' nachgeholt (DB task %s)",
+            manus_task_id,
+            response.status,
+            task_id,
+        )
@@ -0,0 +1,212 @@
+"""Retry mit Backoff und Circuit Breaker für Aufrufe der Manus API."""
+
+import asyncio
+import enum
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+from app import metrics
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Status-Codes, bei denen ein erneuter Versuch sinnvoll ist
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Bei nicht-idempotenten Aufrufen (create_task) nur Fehler, bei denen Manus den
+# Request nachweislich nicht verarbeitet hat – sonst droht ein zweiter Task.
+_SAFE_STATUS_NON_IDEMPOTENT = {429, 503}
+_SAFE_TRANSPORT_NON_IDEMPOTENT = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_RETRYABLE_TRANSPORT = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+
+class CircuitOpenError(Exception):
+    """Manus gilt als nicht erreichbar – Aufruf wurde ohne Request abgelehnt."""
+
+
+class CircuitState(str, enum.Enum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_GAUGE = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitBreaker:
+    """Öffnet nach ``failure_threshold`` Fehlern in Folge und lässt nach
+    ``reset_timeout`` Sekunden genau einen Probe-Request durch."""
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._state = CircuitState.CLOSED
+        metrics.set_gauge("circuit_state", 0, breaker=name)
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self.opened_at >= self.reset_timeout
+        ):
+            self._set_state(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _set_state(self, state: CircuitState) -> None:
+        if state != self._state:
+            logger.warning("Circuit Breaker %s: %s -> %s", self.name, self._state.value, state.value)
+        self._state = state
+        metrics.set_gauge("circuit_state", _STATE_GAUGE[state], breaker=self.name)
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if state == CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._probe_in_flight = False
+        self._set_state(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        was_probe = self._probe_in_flight
+        self._probe_in_flight = False
+        if was_probe or self.failures >= self.failure_threshold:
+            self._open()
+
+    def record_throttled(self) -> None:
+        """429: Manus lebt, will aber keine Last – zählt nicht als Fehler.
+
+        Ein gedrosselter Probe-Request beweist keine Erholung: der Breaker
+        bleibt offen und wartet erneut ``reset_timeout`` ab.
+        """
+        if self._probe_in_flight:
+            self._probe_in_flight = False
+            self._open()
+
+    def release_probe(self) -> None:
+        """Gibt den Probe-Slot ohne Ergebnis frei (Abbruch, unerwarteter Fehler)."""
+        self._probe_in_flight = False
+
+    def _open(self) -> None:
+        if self._state != CircuitState.OPEN:
+            metrics.inc("circuit_opened_total", breaker=self.name)
+        self.opened_at = time.monotonic()
+        self._set_state(CircuitState.OPEN)
+
+
+manus_breaker = CircuitBreaker(
+    "manus",
+    failure_threshold=settings.manus_breaker_failure_threshold,
+    reset_timeout=settings.manus_breaker_reset_timeout,
+)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Wertet einen Retry-After-Header aus (Sekunden oder HTTP-Datum)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(attempt: int, retry_after: float | None = None) -> float:
+    """Exponentielles Backoff mit Full Jitter; Retry-After gilt als Untergrenze."""
+    ceiling = min(settings.manus_retry_max_delay, settings.manus_retry_base_delay * 2 ** (attempt - 1))
+    delay = random.uniform(0, ceiling)
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, settings.manus_retry_max_delay))
+    return delay
+
+
+async def call_with_resilience(
+    operation: str,
+    send: Callable[[], Awaitable[httpx.Response]],
+    *,
+    idempotent: bool,
+    breaker: CircuitBreaker = manus_breaker,
+) -> httpx.Response:
+    """Führt ``send`` mit Retries und Circuit Breaker aus.
+
+    Raises:
+        CircuitOpenError: wenn der Breaker offen ist.
+        httpx.HTTPStatusError / httpx.TransportError: wenn alle Versuche scheitern.
+    """
+    max_attempts = max(1, settings.manus_retry_max_attempts)
+    attempt = 0
+
+    while True:
+        if not breaker.allow():
+            metrics.inc("manus_circuit_rejected_total", operation=operation)
+            raise CircuitOpenError(f"Manus API derzeit nicht verfügbar ({operation})")
+        # HALF_OPEN nach erfolgreichem allow() heißt: dieser Aufruf ist der Probe
+        probing = breaker.state == CircuitState.HALF_OPEN
+
+        attempt += 1
+        retry_after = None
+        try:
+            response = await send()
+        except httpx.TransportError as e:
+            breaker.record_failure()
+            safe = _SAFE_TRANSPORT_NON_IDEMPOTENT if not idempotent else _RETRYABLE_TRANSPORT
+            if attempt >= max_attempts or not isinstance(e, safe):
+                metrics.inc("manus_requests_total", operation=operation, outcome="error")
+                raise
+            reason = type(e).__name__
+        except BaseException:
+            # Abbruch (CancelledError) oder Fehler außerhalb von httpx: kein
+            # Urteil über Manus, aber der Probe-Slot darf nicht hängen bleiben
+            if probing:
+                breaker.release_probe()
+            raise
+        else:
+            status = response.status_code
+            if status not in _RETRYABLE_STATUS:
+                breaker.record_success()
+                outcome = "ok" if status < 400 else "client_error"
+                metrics.inc("manus_requests_total", operation=operation, outcome=outcome)
+                response.raise_for_status()
+                return response
+
+            # 429 heißt "zu schnell", nicht "kaputt" – zählt nicht für den Breaker
+            if status == 429:
+                breaker.record_throttled()
+            else:
+                breaker.record_failure()
+            safe = _SAFE_STATUS_NON_IDEMPOTENT if not idempotent else _RETRYABLE_STATUS
+            if attempt >= max_attempts or status not in safe:
+                metrics.inc("manus_requests_total", operation=operation, outcome="error")
+                response.raise_for_status()
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            reason = str(status)
+
+        delay = backoff_delay(attempt, retry_after)
+        metrics.inc("manus_retries_total", operation=operation, reason=reason)
+        logger.warning(
+            "Manus %s fehlgeschlagen (%s), Versuch %d/%d – neuer Versuch in %.1fs",
+            operation, reason, attempt, max_attempts, delay,
+        )
+        await asyncio.sleep(delay)
@@ -0,0 +1,47 @@
+"""Übergibt gespeicherte Tasks an Manus."""
+
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.input_processor.classifier import InputModus
+from app.manus.client import ManusClient
+from app.models.task import AnalysisTask, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+QUEUED_MESSAGE = (
+    "Manus ist gerade nicht erreichbar. Dein Briefing ist vorgemerkt "
+    "und wird automatisch gestartet, sobald Manus wieder verfügbar ist."
+)
+
+
+def project_id_for(input_modus: str | None) -> str | None:
+    """Manus-Projekt passend zum Input-Modus (Talent-Report oder HiOffice)."""
+    hioffice = (settings.manus_project_id or "").strip()
+    if input_modus == InputModus.TALENT_REPORT.value:
+        return (settings.manus_talent_report_project_id or "").strip() or hioffice or None
+    return hioffice or None
+
+
+def idempotency_key(task: AnalysisTask) -> str:
+    """Stabiler Schlüssel pro DB-Task – identisch über alle Retries."""
+    return f"salesbot-task-{task.id}"
+
+
+async def submit_task(task: AnalysisTask, db: AsyncSession) -> None:
+    """Legt den Manus-Task für einen gespeicherten AnalysisTask an."""
+    project_id = project_id_for(task.input_modus)
+    if task.input_modus == InputModus.TALENT_REPORT.value:
+        logger.info(
+            "Talent-Report: MANUS_TALENT_REPORT_PROJECT_ID=%s, project_id=%s",
+            "gesetzt" if (settings.manus_talent_report_project_id or "").strip() else "leer",
+            "gesetzt" if project_id else "leer (404 moeglich)",
+        )
+    client = ManusClient(project_id=project_id)
+    response = await client.create_task(task.manus_prompt, idempotency_key=idempotency_key(task))
+    task.manus_task_id = response.task_id
+    task.status = TaskStatus.PROCESSING
+    await db.commit()
+
@@ -3,7 +3,8 @@
 import logging
 from datetime import datetime, timezone
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.manus.schemas import WebhookAttachment, WebhookEvent
 from app.models.task import AnalysisTask, TaskStatus
@@ -25,27 +26,37 @@ def _pick_best_attachment(attachments: list[WebhookAttachment]) -> WebhookAttach
 logger = logging.getLogger(__name__)
 
 
-async def handle_manus_webhook(event: WebhookEvent, db: Session) -> AnalysisTask | None:
+async def handle_manus_webhook(event: WebhookEvent, db: AsyncSession) -> AnalysisTask | None:
     """Verarbeitet ein Manus-Webhook-Event und aktualisiert den Task in der DB.
 
+    Committet nicht – der Aufrufer committet zusammen mit den Folge-Jobs.
+
     Returns:
-        Den aktualisierten Task oder None wenn nicht gefunden.
+        Den aktualisierten Task oder None wenn nicht gefunden bzw. bereits
+        abgeschlossen (z.B. vom Reconciler nachgeholt, dann Webhook verspätet).
     """
     task_id = event.task_id
     if not task_id:
         logger.warning("Webhook ohne task_id empfangen: %s", event.event_id)
         return None
 
-    task = (
-        db.query(AnalysisTask)
-        .filter(AnalysisTask.manus_task_id == task_id)
-        .first()
+    task = await db.scalar(
+        select(AnalysisTask)
+        .where(AnalysisTask.manus_task_id == task_id)
+        .limit(1)
     )
 
     if not task:
         logger.warning("Webhook für unbekannten Task: %s", task_id)
         return None
 
+    if event.event_type == "task_stopped" and task.status in (
+        TaskStatus.COMPLETED,
+        TaskStatus.FAILED,
+    ):
+        logger.info("Task %s bereits abgeschlossen – Event %s ignoriert", task_id, event.event_id)
+        return None
+
     if event.event_type == "task_stopped" and event.task_detail:
         detail = event.task_detail
 
@@ -80,6 +91,5 @@ async def handle_manus_webhook(event: WebhookEvent, db: Session) -> AnalysisTask
     elif event.event_type == "task_created":
         logger.info("Manus task created webhook: %s", task_id)
 
-    db.commit()
-    db.refresh(task)
+    await db.flush()
     return task
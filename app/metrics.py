@@ -0,0 +1,33 @@
+"""Einfache In-Process-Metriken (Counter und Gauges) für /api/metrics."""
+
+import threading
+from collections import defaultdict
+
+_lock = threading.Lock()
+_counters: dict[str, float] = defaultdict(float)
+_gauges: dict[str, float] = {}
+
+
+def _key(name: str, labels: dict[str, object]) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{k}="{v}"' for k, v in sorted(labels.items()))
+    return f"{name}{{{rendered}}}"
+
+
+def inc(name: str, value: float = 1, **labels) -> None:
+    """Erhöht einen Counter um ``value``."""
+    with _lock:
+        _counters[_key(name, labels)] += value
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    """Setzt einen Gauge auf einen absoluten Wert."""
+    with _lock:
+        _gauges[_key(name, labels)] = value
+
+
+def snapshot() -> dict[str, dict[str, float]]:
+    """Momentaufnahme aller Metriken (für den Monitoring-Endpoint)."""
+    with _lock:
+        return {"counters": dict(_counters), "gauges": dict(_gauges)}
@@ -1,3 +1,13 @@
+from app.models.job import Job, JobStatus
+from app.models.llm_cache import LlmExtractionCacheEntry
 from app.models.task import AnalysisTask, TaskStatus
+from app.models.webhook_event import ProcessedWebhookEvent
 
-__all__ = ["AnalysisTask", "TaskStatus"]
+__all__ = [
+    "AnalysisTask",
+    "Job",
+    "JobStatus",
+    "LlmExtractionCacheEntry",
+    "ProcessedWebhookEvent",
+    "TaskStatus",
+]
@@ -0,0 +1,54 @@
+import enum
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text
+
+from app.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Job(Base):
+    """Persistenter Hintergrund-Job (überlebt Neustarts des Prozesses)."""
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    kind = Column(String(50), nullable=False)
+    payload = Column(Text, nullable=False, default="{}")
+
+    task_id = Column(Integer, ForeignKey("analysis_tasks.id"), nullable=True, index=True)
+    # Jobs mit gleichem Schlüssel laufen strikt nacheinander (z.B. Manus task_id)
+    ordering_key = Column(String(200), nullable=True)
+
+    status = Column(Enum(JobStatus), default=JobStatus.QUEUED, nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    run_after = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    locked_at = Column(DateTime, nullable=True)
+
+    created_at = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+    updated_at = Column(
+        DateTime,
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+        Index("ix_jobs_ordering_key_status", "ordering_key", "status"),
+    )
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, kind='{self.kind}', status={self.status})>"
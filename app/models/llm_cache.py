@@ -0,0 +1,23 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, String, Text
+
+from app.database import Base
+
+
+class LlmExtractionCacheEntry(Base):
+    """Persistierte LLM-Extraktion, adressiert über Hash aus Text, Prompt-Version und Modell."""
+
+    __tablename__ = "llm_extraction_cache"
+
+    key = Column(String(64), primary_key=True)
+    fields = Column(Text, nullable=False)
+    created_at = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True
+    )
+    last_used_at = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True
+    )
+
+    def __repr__(self):
+        return f"<LlmExtractionCacheEntry(key='{self.key[:12]}…')>"
@@ -1,8 +1,7 @@
 import enum
 from datetime import datetime, timezone
 
-from sqlalchemy import Column, DateTime, Enum, Integer, String, Text
-
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, String, Text
 
 from app.database import Base
 
@@ -58,6 +57,13 @@ class AnalysisTask(Base):
     # Input-Modus
     input_modus = Column(String(20), nullable=True)
 
+    # Report-Cache: Hash aus normalisiertem Unternehmen/Standort/Position/Modus
+    cache_key = Column(String(64), nullable=True)
+    # Single-Flight: wartet auf das Ergebnis eines identischen, laufenden Tasks
+    coalesced_into_task_id = Column(
+        Integer, ForeignKey("analysis_tasks.id"), nullable=True, index=True
+    )
+
     # Zeitstempel
     created_at = Column(
         DateTime, default=lambda: datetime.now(timezone.utc), nullable=False
@@ -70,6 +76,16 @@ class AnalysisTask(Base):
     )
     completed_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # Reconciliation-Sweeps und Monitoring nach Status
+        Index("ix_analysis_tasks_status_created_at", "status", "created_at"),
+        # Verlauf pro User bzw. Plattform
+        Index("ix_analysis_tasks_slack_user_created_at", "slack_user_id", "created_at"),
+        Index("ix_analysis_tasks_teams_user_created_at", "teams_user_id", "created_at"),
+        Index("ix_analysis_tasks_source_platform_created_at", "source_platform", "created_at"),
+        Index("ix_analysis_tasks_cache_key_completed_at", "cache_key", "completed_at"),
+    )
+
     def __repr__(self):
         return (
             f"<AnalysisTask(id={self.id}, "
@@ -0,0 +1,21 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, String
+
+from app.database import Base
+
+
+class ProcessedWebhookEvent(Base):
+    """Bereits angenommene Manus-Webhook-Events (Dedupe über event_id)."""
+
+    __tablename__ = "processed_webhook_events"
+
+    event_id = Column(String(200), primary_key=True)
+    event_type = Column(String(50), nullable=False)
+    manus_task_id = Column(String(200), nullable=True)
+    received_at = Column(
+        DateTime, default=lambda: datetime.now(timezone.utc), nullable=False, index=True
+    )
+
+    def __repr__(self):
+        return f"<ProcessedWebhookEvent(event_id='{self.event_id}', type='{self.event_type}')>"
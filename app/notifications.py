@@ -0,0 +1,111 @@
+"""Proaktive Nachrichten an den Absender eines Tasks (Teams oder Slack)."""
+
+import json
+import logging
+
+from botbuilder.core import TurnContext
+from botbuilder.schema import ConversationReference
+
+from app.config import settings
+from app.models.task import AnalysisTask, TaskStatus
+from app.teams.messages import adapter
+
+logger = logging.getLogger(__name__)
+
+_slack_web_client = None
+
+
+def get_slack_web_client():
+    """Slack WebClient (lazy), None wenn Slack nicht konfiguriert ist."""
+    global _slack_web_client
+    if _slack_web_client is None and settings.slack_bot_token:
+        from slack_sdk.web.async_client import AsyncWebClient
+
+        _slack_web_client = AsyncWebClient(token=settings.slack_bot_token)
+    return _slack_web_client
+
+
+async def send_to_teams(task: AnalysisTask, text: str) -> None:
+    conv_ref_data = json.loads(task.conversation_reference)
+    conv_ref = ConversationReference().deserialize(conv_ref_data)
+
+    async def send(turn_context: TurnContext):
+        await turn_context.send_activity(text)
+
+    await adapter.continue_conversation(conv_ref, send, settings.microsoft_app_id)
+
+
+async def send_to_slack(task: AnalysisTask, text: str) -> None:
+    client = get_slack_web_client()
+    if client is None:
+        logger.error("Slack nicht konfiguriert – kann Nachricht nicht senden")
+        return
+    await client.chat_postMessage(channel=task.slack_channel_id, text=text)
+
+
+async def notify_user(task: AnalysisTask, text: str) -> bool:
+    """Schickt eine Textnachricht an die Konversation, aus der der Task stammt.
+
+    Returns:
+        True wenn eine Zielkonversation bekannt war.
+    """
+    if task.source_platform == "slack" and task.slack_channel_id:
+        await send_to_slack(task, text)
+        return True
+    if task.conversation_reference:
+        await send_to_teams(task, text)
+        return True
+    logger.info("Task %s hat keine Zielkonversation (%s)", task.id, task.source_platform)
+    return False
+
+
+async def deliver_result(task: AnalysisTask) -> None:
+    """Sendet den PDF-Download-Link der fertigen Praesentation proaktiv an den Absender.
+
+    Ist der Manus-Task fehlgeschlagen, bekommt der Absender stattdessen die Fehlermeldung.
+    """
+    display_name = task.unternehmen or "Wettbewerbsanalyse"
+    if task.status == TaskStatus.FAILED:
+        await notify_user(
+            task,
+            f"Die Wettbewerbsanalyse für {display_name} ist fehlgeschlagen: "
+            f"{task.error_message or 'Unbekannter Fehler'}\nBitte versuche es erneut.",
+        )
+        logger.info("Fehlschlag an Absender gemeldet (Task %s)", task.id)
+        return
+
+    file_name = task.result_file_name or "Wettbewerbsanalyse.pdf"
+    download_url = task.result_file_url
+
+    if task.source_platform == "slack" and task.slack_channel_id:
+        user_mention = f"<@{task.slack_user_id}>" if task.slack_user_id else ""
+        if download_url:
+            message = (
+                f"{user_mention} Die Wettbewerbsanalyse für *{display_name}* ist fertig!\n\n"
+                f"📄 <{download_url}|{file_name}>"
+            )
+        else:
+            message = (
+                f"{user_mention} Die Wettbewerbsanalyse für *{display_name}* wurde abgeschlossen, "
+                "aber es konnte kein Download-Link ermittelt werden. "
+                "Bitte prüfe den Status direkt in Manus."
+            )
+        await send_to_slack(task, message)
+        logger.info(
+            "Präsentation an Slack-User %s gesendet (Task %s)", task.slack_user_id, task.id
+        )
+
+    elif task.conversation_reference:
+        if download_url:
+            message = (
+                f"Die Wettbewerbsanalyse für **{display_name}** ist fertig!\n\n"
+                f"📄 [{file_name}]({download_url})"
+            )
+        else:
+            message = (
+                f"Die Wettbewerbsanalyse für **{display_name}** wurde abgeschlossen, "
+                "aber es konnte kein Download-Link ermittelt werden. "
+                "Bitte prüfe den Status direkt in Manus."
+            )
+        await send_to_teams(task, message)
+        logger.info("Präsentation an %s gesendet (Task %s)", task.teams_user_name, task.id)
@@ -0,0 +1,102 @@
+"""Report-Cache: verwendet eine frische Analyse für denselben Träger/Standort/Position.
+
+Der Schlüssel wird aus den normalisierten Extraktionsfeldern gebildet und am
+Task gespeichert. Vor dem Manus-Aufruf sucht der Briefing-Worker nach einem
+abgeschlossenen Task mit gleichem Schlüssel innerhalb von
+``report_cache_max_age_days``. Als Quelle zählen nur Tasks, deren Report Manus
+selbst erstellt hat – wiederverwendete oder angehängte Tasks tragen nur eine
+Kopie und würden das Frische-Fenster sonst bei jeder Wiederverwendung
+verlängern. Mit ``#neu`` im Briefing wird der Cache umgangen.
+"""
+
+import hashlib
+import re
+import unicodedata
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import metrics
+from app.config import settings
+from app.input_processor.classifier import InputModus
+from app.input_processor.extractor import ExtractionResult
+from app.models.task import AnalysisTask, TaskStatus
+
+REFRESH_KEYWORD = "#neu"
+
+_REFRESH_PATTERN = re.compile(r"(?<!\w)(?:#neu|#refresh|force[ -]refresh)(?!\w)", re.IGNORECASE)
+_UMLAUTS = str.maketrans({"ä": "ae", "ö": "oe", "ü": "ue"})
+# Satzzeichen und Leerraum fallen weg: "e.V." == "eV", "Lausitz-Nord" == "Lausitz Nord"
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def split_refresh_keyword(text: str) -> tuple[str, bool]:
+    """Entfernt das Force-Refresh-Keyword aus dem Briefing.
+
+    Returns:
+        (bereinigter Text, True wenn ein Keyword gefunden wurde)
+    """
+    cleaned, count = _REFRESH_PATTERN.subn("", text)
+    if not count:
+        return text, False
+    lines = [line.rstrip() for line in cleaned.splitlines()]
+    return "\n".join(line for line in lines if line.strip()), True
+
+
+def _normalize(value: str | None) -> str:
+    value = unicodedata.normalize("NFKC", value or "").casefold().translate(_UMLAUTS)
+    return _NON_ALNUM.sub("", value)
+
+
+def report_cache_key(extraction: ExtractionResult, modus: InputModus) -> str:
+    """Stabiler Schlüssel aus Unternehmen, Standort, Position/Zielgruppe und Modus."""
+    parts = (
+        modus.value,
+        _normalize(extraction.unternehmen),
+        _normalize(extraction.standort),
+        _normalize(extraction.position or extraction.zielgruppe),
+    )
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+async def find_cached_report(db: AsyncSession, cache_key: str | None) -> AnalysisTask | None:
+    """Jüngster von Manus erstellte Report mit gleichem Schlüssel im Frische-Fenster.
+
+    Die Frische bemisst sich am ``completed_at`` des Original-Tasks, nicht am
+    Zeitpunkt einer späteren Wiederverwendung.
+    """
+    if not cache_key or settings.report_cache_max_age_days <= 0:
+        return None
+    cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+        days=settings.report_cache_max_age_days
+    )
+    cached = await db.scalar(
+        select(AnalysisTask)
+        .where(
+            AnalysisTask.cache_key == cache_key,
+            AnalysisTask.status == TaskStatus.COMPLETED,
+            AnalysisTask.completed_at >= cutoff,
+            AnalysisTask.result_file_url.is_not(None),
+            # nur Originale: Kopien (Cache-Treffer, Single-Flight) haben keinen Manus-Task
+            AnalysisTask.manus_task_id.is_not(None),
+            AnalysisTask.coalesced_into_task_id.is_(None),
+        )
+        .order_by(AnalysisTask.completed_at.desc())
+        .limit(1)
+    )
+    metrics.inc("report_cache_lookups_total", outcome="hit" if cached else "miss")
+    return cached
+
+
+def reuse_report(task: AnalysisTask, cached: AnalysisTask) -> None:
+    """Übernimmt das Ergebnis des gecachten Tasks und schließt ``task`` ab."""
+    task.status = TaskStatus.COMPLETED
+    task.completed_at = datetime.now(timezone.utc)
+    task.result_file_url = cached.result_file_url
+    task.result_file_name = cached.result_file_name
+    task.manus_task_url = cached.manus_task_url
+
+    if cached.completed_at and cached.created_at:
+        minutes = (cached.completed_at - cached.created_at).total_seconds() / 60
+        metrics.inc("report_cache_saved_minutes_total", max(minutes, 0.0))
@@ -5,7 +5,7 @@ import re
 from slack_bolt.async_app import AsyncApp
 
 from app.config import settings
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal
 from app.slack.handler import handle_slack_message
 
 logger = logging.getLogger(__name__)
@@ -24,14 +24,12 @@ async def message_handler(event, say):
     if event.get("subtype") is not None:
         return
 
-    db = SessionLocal()
     try:
-        await handle_slack_message(event, say, db)
+        async with AsyncSessionLocal() as db:
+            await handle_slack_message(event, say, db)
     except Exception as e:
         logger.error("Fehler in Slack Message Handler: %s", e, exc_info=True)
         await say("Ein Fehler ist aufgetreten. Bitte versuche es erneut.")
-    finally:
-        db.close()
 
 
 @slack_app.event("app_mention")
@@ -1,30 +1,20 @@
 """Slack Message Handler – verarbeitet eingehende Nachrichten."""
 
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import settings
-from app.input_processor import (
-    build_manus_prompt,
-    build_talent_report_prompt,
-    classify_input,
-    extract_fields,
-    validate_fields,
-    InputModus,
-)
-from app.manus.client import ManusClient
-from app.models.task import AnalysisTask, TaskStatus
+from app.briefing import accept_briefing
 
 logger = logging.getLogger(__name__)
 
 
-async def handle_slack_message(event: dict, say, db: Session):
+async def handle_slack_message(event: dict, say, db: AsyncSession):
     """Verarbeitet eine eingehende Slack-Nachricht.
     
     Args:
         event: Slack Event-Dict mit text, user, channel, etc.
         say: Slack say() Funktion zum Antworten
-        db: SQLAlchemy Session
+        db: SQLAlchemy AsyncSession
     """
     text = event.get("text", "").strip()
     user_id = event.get("user", "")
@@ -38,63 +28,14 @@ async def handle_slack_message(event: dict, say, db: Session):
         await say(_help_text())
         return
     
-    modus = classify_input(text)
-    extraction = await extract_fields(text, modus)
-    validation = validate_fields(extraction)
-    
-    if not validation.is_valid:
-        await say(validation.reply_message)
-        return
-    
-    # Routing: Talent-Report oder HiOffice-Wettbewerbsanalyse
-    if modus == InputModus.TALENT_REPORT:
-        manus_prompt = build_talent_report_prompt(extraction)
-        raw_id = (settings.manus_talent_report_project_id or "").strip() or (settings.manus_project_id or "").strip()
-        project_id = raw_id or None
-        logger.info(
-            "Talent-Report (Slack): MANUS_TALENT_REPORT_PROJECT_ID=%s, project_id=%s",
-            "gesetzt" if (settings.manus_talent_report_project_id or "").strip() else "leer",
-            "gesetzt" if project_id else "leer",
-        )
-    else:
-        manus_prompt = build_manus_prompt(extraction)
-        project_id = (settings.manus_project_id or "").strip() or None
-    
-    task = AnalysisTask(
-        unternehmen=extraction.unternehmen,
-        standort=extraction.standort,
-        position=extraction.position,
-        zusatzkontext=extraction.zusatzkontext,
-        manus_prompt=manus_prompt,
-        input_modus=modus.value,
+    ack = await accept_briefing(
+        text,
+        db,
         source_platform="slack",
         slack_channel_id=channel_id,
         slack_user_id=user_id,
-        status=TaskStatus.PROCESSING,
     )
-    db.add(task)
-    db.commit()
-    db.refresh(task)
-    
-    await say(validation.reply_message)
-    
-    try:
-        manus_client = ManusClient(project_id=project_id)
-        manus_response = await manus_client.create_task(manus_prompt)
-        task.manus_task_id = manus_response.task_id
-        db.commit()
-        logger.info(
-            "Manus task %s erstellt für %s (DB task %s, Slack)",
-            manus_response.task_id,
-            extraction.unternehmen,
-            task.id,
-        )
-    except Exception as e:
-        logger.error("Manus API Fehler: %s", e)
-        task.status = TaskStatus.FAILED
-        task.error_message = str(e)
-        db.commit()
-        await say(f"Fehler bei der Manus-API: {e}\nBitte versuche es erneut.")
+    await say(ack.message)
 
 
 def _help_text() -> str:
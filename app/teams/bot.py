@@ -6,17 +6,7 @@ import logging
 from botbuilder.core import ActivityHandler, TurnContext
 from botbuilder.schema import ChannelAccount
 
-from app.input_processor import (
-    build_manus_prompt,
-    build_talent_report_prompt,
-    classify_input,
-    extract_fields,
-    validate_fields,
-    InputModus,
-)
-from app.manus.client import ManusClient
-from app.config import settings
-from app.models.task import AnalysisTask, TaskStatus
+from app.briefing import accept_briefing
 
 logger = logging.getLogger(__name__)
 
@@ -49,72 +39,19 @@ class SalesBot(ActivityHandler):
         conv_ref = TurnContext.get_conversation_reference(turn_context.activity)
         conv_ref_json = json.dumps(conv_ref.serialize(), ensure_ascii=False)
 
-        modus = classify_input(text)
-        extraction = await extract_fields(text, modus)
-        validation = validate_fields(extraction)
-
-        if not validation.is_valid:
-            await turn_context.send_activity(validation.reply_message)
-            return
-
-        # Routing: Talent-Report oder HiOffice-Wettbewerbsanalyse
-        if modus == InputModus.TALENT_REPORT:
-            manus_prompt = build_talent_report_prompt(extraction)
-            raw_id = (settings.manus_talent_report_project_id or "").strip() or (settings.manus_project_id or "").strip()
-            project_id = raw_id or None
-            logger.info(
-                "Talent-Report (Teams): MANUS_TALENT_REPORT_PROJECT_ID=%s, project_id=%s",
-                "gesetzt" if (settings.manus_talent_report_project_id or "").strip() else "leer",
-                "gesetzt" if project_id else "leer",
-            )
-        else:
-            manus_prompt = build_manus_prompt(extraction)
-            project_id = (settings.manus_project_id or "").strip() or None
-
-        db = self.db_session_factory()
-        try:
-            task = AnalysisTask(
-                unternehmen=extraction.unternehmen,
-                standort=extraction.standort,
-                position=extraction.position,
-                zusatzkontext=extraction.zusatzkontext,
-                manus_prompt=manus_prompt,
-                input_modus=modus.value,
+        async with self.db_session_factory() as db:
+            ack = await accept_briefing(
+                text,
+                db,
                 source_platform="teams",
                 teams_user_id=user_id,
                 teams_user_name=user_name,
                 teams_conversation_id=conversation_id,
                 teams_activity_id=turn_context.activity.id,
                 conversation_reference=conv_ref_json,
-                status=TaskStatus.PROCESSING,
             )
-            db.add(task)
-            db.commit()
-            db.refresh(task)
-
-            await turn_context.send_activity(validation.reply_message)
-
-            try:
-                manus_client = ManusClient(project_id=project_id)
-                manus_response = await manus_client.create_task(manus_prompt)
-                task.manus_task_id = manus_response.task_id
-                db.commit()
-                logger.info(
-                    "Manus task %s erstellt für %s (DB task %s)",
-                    manus_response.task_id,
-                    extraction.unternehmen,
-                    task.id,
-                )
-            except Exception as e:
-                logger.error("Manus API Fehler: %s", e)
-                task.status = TaskStatus.FAILED
-                task.error_message = str(e)
-                db.commit()
-                await turn_context.send_activity(
-                    f"Fehler bei der Manus-API: {e}\nBitte versuche es erneut."
-                )
-        finally:
-            db.close()
+
+        await turn_context.send_activity(ack.message)
 
     async def on_members_added_activity(
         self, members_added: list[ChannelAccount], turn_context: TurnContext
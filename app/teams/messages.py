@@ -9,7 +9,7 @@ from botbuilder.core import (
 from botbuilder.schema import Activity
 
 from app.config import settings
-from app.database import SessionLocal
+from app.database import AsyncSessionLocal
 from app.teams.bot import SalesBot
 
 adapter_settings = BotFrameworkAdapterSettings(
@@ -18,7 +18,7 @@ adapter_settings = BotFrameworkAdapterSettings(
     channel_auth_tenant=settings.microsoft_tenant_id or None,
 )
 adapter = BotFrameworkAdapter(adapter_settings)
-bot = SalesBot(db_session_factory=SessionLocal)
+bot = SalesBot(db_session_factory=AsyncSessionLocal)
 
 
 async def on_error(context: TurnContext, error: Exception):
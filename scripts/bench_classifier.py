@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Micro-Benchmark: classify_input – 21 Einzel-Suchen vs. ein kombinierter Scan
+===========================================================================
+Vergleicht die bisherige Klassifikation (``.lower()``-Kopie, ``splitlines``,
+ein ``re.search`` pro Indikator) mit dem vorkompilierten Einzel-Scan aus
+``app.input_processor.classifier``. Geprüft wird außerdem, dass beide
+Varianten für jeden Input dasselbe Ergebnis liefern.
+
+Eingaben:
+  - kurz:   Minimal- und Rich-Beispiele aus dem Korpus (wenige Zeilen)
+  - lang:   eingefügte CRM-Notizen mit 10.000 Zeilen, einmal mit Indikatoren
+            am Anfang (früher Abbruch möglich) und einmal ganz ohne
+
+Usage:
+  python scripts/bench_classifier.py [--lines 10000] [--seconds 1.0]
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("MANUS_API_KEY", "bench")
+
+from app.input_processor.classifier import (  # noqa: E402
+    _RICH_INDICATORS,
+    _STRUCTURED_PATTERN,
+    _TALENT_REPORT_PATTERN,
+    InputModus,
+    classify_input,
+)
+
+CORPUS = Path(__file__).resolve().parent / "data" / "extraction_corpus.jsonl"
+
+
+def classify_input_legacy(text: str) -> InputModus:
+    """Bisherige Implementierung, unverändert zum Vergleich."""
+    if _TALENT_REPORT_PATTERN.search(text):
+        return InputModus.TALENT_REPORT
+    if _STRUCTURED_PATTERN.search(text):
+        return InputModus.STRUCTURED
+
+    text_lower = text.lower()
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    rich_score = sum(1 for pattern in _RICH_INDICATORS if re.search(pattern, text_lower))
+
+    if rich_score >= 3:
+        return InputModus.RICH
+    if len(lines) <= 5 and rich_score == 0:
+        return InputModus.MINIMAL
+    if len(lines) > 8:
+        return InputModus.RICH
+    return InputModus.MINIMAL
+
+
+def crm_notes(lines: int, with_indicators: bool) -> str:
+    head = (
+        ["Gesprächsnotiz: Rentenwelle im Team", "Bewerber springen ab", "Krankenstand hoch"]
+        if with_indicators
+        else []
+    )
+    body = [
+        f"{day:02d}.03. Telefonat mit Hr. Müller – Rückruf vereinbart, Angebot Nr. {day * 37} offen"
+        for day in range(lines - len(head))
+    ]
+    return "\n".join(head + body)
+
+
+def measure(func, inputs: list[str], seconds: float) -> float:
+    """Durchläufe pro Sekunde über alle ``inputs``."""
+    rounds = 0
+    started = time.perf_counter()
+    while True:
+        for text in inputs:
+            func(text)
+        rounds += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return rounds * len(inputs) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=10_000, help="Zeilen der langen CRM-Notizen")
+    parser.add_argument("--seconds", type=float, default=1.0, help="Messdauer pro Variante")
+    args = parser.parse_args()
+
+    with CORPUS.open(encoding="utf-8") as f:
+        short = [json.loads(line)["text"] for line in f if line.strip()]
+    cases = {
+        f"kurz ({len(short)} Inputs)": short,
+        f"lang, {args.lines} Zeilen mit Indikatoren": [crm_notes(args.lines, True)],
+        f"lang, {args.lines} Zeilen ohne Indikatoren": [crm_notes(args.lines, False)],
+    }
+
+    for inputs in cases.values():
+        for text in inputs:
+            assert classify_input(text) == classify_input_legacy(text), text[:80]
+
+    print(f"{'Eingabe':<40} {'vorher/s':>12} {'nachher/s':>12} {'Faktor':>8}")
+    for label, inputs in cases.items():
+        before = measure(classify_input_legacy, inputs, args.seconds)
+        after = measure(classify_input, inputs, args.seconds)
+        print(f"{label:<40} {before:>12,.0f} {after:>12,.0f} {after / before:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Commit-Durchsatz der Task-DB mit und ohne Pool-/SQLite-Tuning
+========================================================================
+Simuliert parallele Briefing- und Webhook-Schreiber (je ein kurzer Commit pro
+Vorgang) und vergleicht die Standard-Engine mit der Engine aus
+``app.database`` (Pool-Settings, WAL, synchronous=NORMAL, busy_timeout).
+
+Usage:
+  python scripts/bench_db_commits.py [--url sqlite:////tmp/bench.db] [--writers 8] [--commits 200]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import event, select, update  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.database import (  # noqa: E402
+    Base,
+    async_database_url,
+    configure_sqlite_connection,
+    engine_options,
+)
+from app.models.task import AnalysisTask, TaskStatus  # noqa: E402
+
+
+def build_engine(url: str, tuned: bool):
+    if not tuned:
+        return create_async_engine(url)
+    engine = create_async_engine(url, **engine_options(url))
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", configure_sqlite_connection)
+    return engine
+
+
+async def writer(session_factory, n: int, commits: int, errors: list) -> None:
+    for i in range(commits):
+        try:
+            async with session_factory() as db:
+                if i % 2 == 0:
+                    # Briefing: neuer Task
+                    db.add(AnalysisTask(
+                        unternehmen=f"Bench {n}-{i}", standort="Berlin", position="HEP",
+                        status=TaskStatus.PENDING,
+                    ))
+                else:
+                    # Webhook: Status-Update eines vorhandenen Tasks
+                    task_id = await db.scalar(select(AnalysisTask.id).limit(1))
+                    await db.execute(
+                        update(AnalysisTask)
+                        .where(AnalysisTask.id == task_id)
+                        .values(status=TaskStatus.PROCESSING)
+                    )
+                await db.commit()
+        except OperationalError as e:
+            errors.append(str(e.orig))
+
+
+async def run(url: str, tuned: bool, writers: int, commits: int) -> None:
+    engine = build_engine(url, tuned)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    errors: list[str] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(writer(session_factory, n, commits, errors) for n in range(writers)))
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+
+    total = writers * commits - len(errors)
+    label = "optimiert" if tuned else "Standard "
+    print(f"{label}: {total:6d} Commits in {elapsed:6.2f}s = {total / elapsed:8.1f}/s, "
+          f"{len(errors)} Fehler (z.B. 'database is locked')")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--url", help="Database-URL (Standard: temporäre SQLite-Datei)")
+    parser.add_argument("--writers", type=int, default=8, help="Parallele Schreiber")
+    parser.add_argument("--commits", type=int, default=200, help="Commits pro Schreiber")
+    args = parser.parse_args()
+
+    for tuned in (False, True):
+        if args.url:
+            url = async_database_url(args.url)
+            asyncio.run(run(url, tuned, args.writers, args.commits))
+            continue
+        with tempfile.TemporaryDirectory() as tmp:
+            url = async_database_url(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            asyncio.run(run(url, tuned, args.writers, args.commits))
+
+
+if __name__ == '__main__':
+    main()
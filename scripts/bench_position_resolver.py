@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: exakte vs. unscharfe Positions-Auflösung
+==================================================
+Vergleicht die bisherige exakte Dict-Suche mit ``resolve_position`` (Stemming,
+Gender-Endungen, Trigramm-Index + Edit-Distanz) auf typischen Schreibweisen
+aus Slack/Teams-Briefings. Erwartet ``None`` heißt: unbekannt oder mehrdeutig,
+hier darf nichts aufgelöst werden.
+
+Ausgabe: Treffer vorher/nachher, Fehlzuordnungen und Latenz pro Lookup.
+
+Usage:
+  python scripts/bench_position_resolver.py [--repeat 200] [-v]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("MANUS_API_KEY", "bench")
+
+from app.input_processor.taxonomy import (  # noqa: E402
+    current_taxonomy,
+    match_position,
+    resolve_position,
+)
+
+CASES: list[tuple[str, str | None]] = [
+    ("HEP", "Heilerziehungspfleger"),
+    ("HEPs", "Heilerziehungspfleger"),
+    ("Heilerziehungspflegerinnen", "Heilerziehungspfleger"),
+    ("Heilerziehungspfleger (m/w/d)", "Heilerziehungspfleger"),
+    ("Heilerziehungspfleer", "Heilerziehungspfleger"),
+    ("Heilerziehunspflegerin", "Heilerziehungspfleger"),
+    ("PFKs", "Pflegefachkraft"),
+    ("Pflegefachkräfte", "Pflegefachkraft"),
+    ("exam. Pflegefachkraft", "Pflegefachkraft"),
+    ("Pflegefachmänner", "Pflegefachkraft"),
+    ("Pflegefachkraeft", "Pflegefachkraft"),
+    ("Krankenschwestern", "Pflegefachkraft"),
+    ("Gesundheits- und Krankenpflegerin", "Pflegefachkraft"),
+    ("Erzieher*innen", "Erzieher"),
+    ("ErzieherInnen", "Erzieher"),
+    ("Erziher", "Erzieher"),
+    ("Altenpflegerinnen", "Altenpfleger"),
+    ("APs", "Altenpfleger"),
+    ("OTAs", "OTA"),
+    ("Operationstechnische Assistenten", "OTA"),
+    ("Operationstechnischer Asistent", "OTA"),
+    ("Sozialpädagogen", "Sozialarbeiter"),
+    ("Sozialarbeiter:innen", "Sozialarbeiter"),
+    ("Leitung HEP Wohngruppe", "Heilerziehungspfleger"),
+    ("Pflegekräfte", None),
+    ("Pfleger/in", None),
+    ("Fachkraft", None),
+    ("Kinderpfleger", None),
+    ("Koch", None),
+    ("Lausitz", None),
+    ("HEP und Erzieher", None),
+]
+
+
+def resolve_exact(raw: str) -> str | None:
+    """Bisherige Implementierung: exakter Dict-Lookup."""
+    taxonomy = current_taxonomy()
+    normalized = raw.strip().lower()
+    if normalized in taxonomy.ambiguous_terms:
+        return None
+    return taxonomy.position_map.get(normalized)
+
+
+def evaluate(resolver, label: str, verbose: bool) -> None:
+    hits = sum(1 for raw, expected in CASES if expected and resolver(raw) == expected)
+    wrong = [(raw, expected, resolver(raw)) for raw, expected in CASES if resolver(raw) not in (expected, None)]
+    wrong += [(raw, None, resolver(raw)) for raw, expected in CASES if expected is None and resolver(raw)]
+    expected_hits = sum(1 for _, expected in CASES if expected)
+    print(f"{label:<28} Treffer {hits}/{expected_hits}, Fehlzuordnungen {len(wrong)}")
+    if verbose:
+        for raw, expected, got in wrong:
+            print(f"    {raw!r}: erwartet {expected!r}, erhalten {got!r}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200, help="Wiederholungen pro Lookup für die Latenz")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    evaluate(resolve_exact, "Vorher (exakt)", args.verbose)
+    evaluate(resolve_position, "Nachher (unscharf)", args.verbose)
+
+    latencies = []
+    for raw, _ in CASES:
+        started = time.perf_counter()
+        for _ in range(args.repeat):
+            match_position(raw)
+        latencies.append((time.perf_counter() - started) / args.repeat)
+    latencies.sort()
+    print(
+        f"Latenz/Lookup: p50 {statistics.median(latencies) * 1e6:.0f} µs, "
+        f"max {latencies[-1] * 1e6:.0f} µs"
+    )
+    if args.verbose:
+        for raw, _ in CASES:
+            print(f"    {raw!r}: {match_position(raw)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: wie viele LLM-Aufrufe spart die regelbasierte Extraktion?
+===================================================================
+Läuft über einen gelabelten Korpus (JSONL mit ``text``, ``unternehmen``,
+``standort``, ``position``) und misst für jeden Input Klassifikation plus
+regelbasierte Extraktion – einmal ohne und einmal mit Rich-Regeln.
+Ein Label ``null`` heißt: Feld nicht eindeutig, Fallback aufs LLM erwartet.
+
+Ausgabe:
+  - Anteil der Inputs ohne LLM-Aufruf (vorher/nachher, je Modus)
+  - Inputs, die ohne LLM mit falschen Feldern angenommen wurden
+  - Latenz pro Input (p50/p95/max)
+
+Usage:
+  python scripts/bench_rule_extractor.py [--corpus scripts/data/extraction_corpus.jsonl]
+                                         [--repeat 200] [-v]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+os.environ.setdefault("MANUS_API_KEY", "bench")
+
+from app.config import settings  # noqa: E402
+from app.input_processor.classifier import classify_input  # noqa: E402
+from app.input_processor.extractor import try_extract_without_llm  # noqa: E402
+
+FIELDS = ("unternehmen", "standort", "position")
+DEFAULT_CORPUS = Path(__file__).resolve().parent / "data" / "extraction_corpus.jsonl"
+
+
+def _normalize(value: str | None) -> str | None:
+    return " ".join(value.split()).casefold() if value else None
+
+
+def load_corpus(path: Path) -> list[dict]:
+    with path.open(encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def run(corpus: list[dict], repeat: int, verbose: bool) -> dict:
+    avoided: Counter = Counter()
+    totals: Counter = Counter()
+    wrong = 0
+    latencies: list[float] = []
+
+    for row in corpus:
+        text = row["text"]
+        started = time.perf_counter()
+        for _ in range(repeat):
+            modus = classify_input(text)
+            result = try_extract_without_llm(text, modus)
+        latencies.append((time.perf_counter() - started) / repeat)
+
+        totals[modus.value] += 1
+        if result is None:
+            if verbose:
+                print(f"  LLM   [{modus.value:<13}] {text.splitlines()[0][:60]}")
+            continue
+
+        avoided[modus.value] += 1
+        mismatched = [
+            name
+            for name in FIELDS
+            if row.get(name) is None or _normalize(getattr(result, name)) != _normalize(row[name])
+        ]
+        if mismatched:
+            wrong += 1
+        if verbose:
+            status = "FALSCH " + ",".join(mismatched) if mismatched else "ok"
+            print(f"  Regel [{modus.value:<13}] {text.splitlines()[0][:60]} – {status}")
+
+    return {"avoided": avoided, "totals": totals, "wrong": wrong, "latencies": latencies}
+
+
+def report(label: str, stats: dict) -> None:
+    totals, avoided = stats["totals"], stats["avoided"]
+    total, saved = sum(totals.values()), sum(avoided.values())
+    latencies = sorted(stats["latencies"])
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    print(f"\n{label}")
+    print(f"  ohne LLM:      {saved}/{total} ({saved / total:.0%})")
+    for modus in sorted(totals):
+        print(f"    {modus:<14} {avoided[modus]}/{totals[modus]}")
+    print(f"  falsch ohne LLM angenommen: {stats['wrong']}")
+    print(
+        f"  Latenz/Input:  p50 {statistics.median(latencies) * 1e6:.0f} µs, "
+        f"p95 {p95 * 1e6:.0f} µs, max {latencies[-1] * 1e6:.0f} µs"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=200, help="Wiederholungen pro Input für die Latenz")
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    print(f"Korpus: {args.corpus} ({len(corpus)} Inputs)")
+
+    settings.extraction_rich_rules = False
+    report("Vorher (Rich Inputs immer per LLM)", run(corpus, args.repeat, args.verbose))
+
+    settings.extraction_rich_rules = True
+    report("Nachher (Rich-Regeln mit Konfidenz-Schwelle)", run(corpus, args.repeat, args.verbose))
+
+
+if __name__ == "__main__":
+    main()
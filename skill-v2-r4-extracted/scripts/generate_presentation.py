@@ -12,7 +12,8 @@ NEU in v2.5:
 - Konsistenz-Regeln für Datenformate (Gehalt, Mitarbeiter, Entfernung)
 
 Usage:
-    python3 generate_presentation.py <input.json> <output.pdf>
+    python3 generate_presentation.py <input.json> <output.pdf> [--shared-assets]
+    python3 generate_presentation.py <input.json> --html-dir <ordner> [--shared-assets]
 
 JSON-Schema: siehe SKILL.md
 """
@@ -22,8 +23,14 @@ import sys
 import re
 import os
 import base64
+import hashlib
+import io
+import threading
+import time
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 # ── Logo (inline SVG, base64) ────────────────────────────────────────────────
@@ -39,33 +46,264 @@ except Exception:
 
 # ── Hilfsfunktionen ──────────────────────────────────────────────────────────
 
-def fetch_image_b64(url: str, retries: int = 2) -> str:
+# Bild-Downloads: Timeout pro Request, Gesamtbudget fuer alle Bilder, parallele Downloads
+IMAGE_TIMEOUT = 15
+IMAGE_DEADLINE = 30
+IMAGE_WORKERS = 8
+
+# ── Bild-Cache (Festplatte) ──────────────────────────────────────────────────
+# Stadtbilder und Logos wiederholen sich pro Region; sie werden content-adressiert
+# (sha256 der Bytes) abgelegt, pro URL gibt es eine Metadatei mit ETag/Last-Modified.
+# WA_IMAGE_CACHE_DIR="" schaltet den Cache ab.
+IMAGE_CACHE_DIR = os.environ.get(
+    "WA_IMAGE_CACHE_DIR", str(Path.home() / ".cache" / "wettbewerbsanalyse" / "images"))
+IMAGE_CACHE_MAX_BYTES = int(os.environ.get("WA_IMAGE_CACHE_MAX_MB", "200")) * 1024 * 1024
+IMAGE_CACHE_TTL = 7 * 24 * 3600        # so lange ohne Rueckfrage beim Server verwenden
+IMAGE_CACHE_NEGATIVE_TTL = 3600        # fehlgeschlagene URLs so lange nicht erneut versuchen
+
+class ImageCache:
+    """Bild-Cache mit LRU-Verdraengung nach Gesamtgroesse und Negativ-Eintraegen."""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = {"treffer": 0, "revalidiert": 0, "downloads": 0, "negativ": 0}
+        self._lock = threading.Lock()
+
+    def count(self, name: str):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _meta_path(self, url: str) -> Path:
+        return self.root / (hashlib.sha256(url.encode()).hexdigest() + ".json")
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / (digest + ".img")
+
+    def _write(self, path: Path, data: bytes):
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def get(self, url: str):
+        """Metadaten (mit 'data' bei Erfolg) oder None. Markiert den Eintrag als zuletzt benutzt."""
+        meta_path = self._meta_path(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta.get("blob"):
+                meta["data"] = self._blob_path(meta["blob"]).read_bytes()
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def put(self, url: str, data: bytes, content_type: str, etag: str = None, last_modified: str = None):
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            self._write(blob, data)
+        meta = {"url": url, "blob": digest, "content_type": content_type, "size": len(data),
+                "etag": etag, "last_modified": last_modified, "fetched_at": time.time()}
+        self._write(self._meta_path(url), json.dumps(meta).encode())
+
+    def refresh(self, url: str, meta: dict):
+        """Server hat 304 geantwortet: Eintrag gilt wieder IMAGE_CACHE_TTL lang."""
+        meta = {k: v for k, v in meta.items() if k != "data"}
+        meta["fetched_at"] = time.time()
+        self._write(self._meta_path(url), json.dumps(meta).encode())
+
+    def put_failure(self, url: str, error: str):
+        meta = {"url": url, "failed_at": time.time(), "error": error[:200]}
+        self._write(self._meta_path(url), json.dumps(meta).encode())
+
+    def evict(self):
+        """Verdraengt die am laengsten unbenutzten URLs, bis der Cache unter max_bytes liegt."""
+        metas, refs, sizes = [], {}, {}
+        now = time.time()
+        for path in self.root.iterdir():
+            try:
+                if path.suffix == ".img":
+                    sizes[path.stem] = path.stat().st_size
+                elif path.suffix == ".tmp" and now - path.stat().st_mtime > 3600:
+                    path.unlink()
+                elif path.suffix == ".json":
+                    meta = json.loads(path.read_text(encoding="utf-8"))
+                    if meta.get("failed_at") and now - meta["failed_at"] > IMAGE_CACHE_NEGATIVE_TTL:
+                        path.unlink()
+                        continue
+                    metas.append((path.stat().st_mtime, path, meta.get("blob")))
+                    if meta.get("blob"):
+                        refs[meta["blob"]] = refs.get(meta["blob"], 0) + 1
+            except (OSError, ValueError):
+                continue
+        # Bilder ohne Metadatei (z.B. nach Abbruch) zaehlen nicht, sondern fliegen raus
+        for digest in [d for d in sizes if d not in refs]:
+            self._blob_path(digest).unlink(missing_ok=True)
+            del sizes[digest]
+        total = sum(sizes.values())
+        for _, path, digest in sorted(metas, key=lambda m: m[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            if digest:
+                refs[digest] -= 1
+                if refs[digest] == 0:
+                    self._blob_path(digest).unlink(missing_ok=True)
+                    total -= sizes.get(digest, 0)
+
+def open_image_cache():
+    if not IMAGE_CACHE_DIR:
+        return None
+    try:
+        return ImageCache(IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_BYTES)
+    except OSError as e:
+        print(f"  WARNUNG: Bild-Cache nicht verfuegbar ({IMAGE_CACHE_DIR}): {e}")
+        return None
+
+IMAGE_CACHE = open_image_cache()
+
+# ── Bild-Optimierung (optional: Pillow) ──────────────────────────────────────
+# Bilder werden auf ihre gerenderte Box verkleinert und als WebP (sonst JPEG/PNG)
+# neu komprimiert, statt Originale mit mehreren MB inline einzubetten. Ohne Pillow
+# bleiben die Originalbytes. WA_IMAGE_SCALE > 1 behaelt Reserven fuer Zoom im PDF.
+try:
+    from PIL import Image, ImageOps, features as pil_features
+    IMAGE_WEBP = pil_features.check("webp")
+except ImportError:
+    Image = None
+    IMAGE_WEBP = False
+
+IMAGE_SCALE = float(os.environ.get("WA_IMAGE_SCALE", "1.0"))
+IMAGE_QUALITY = int(os.environ.get("WA_IMAGE_QUALITY", "80"))
+# Slot -> gerenderte Groesse in px (Folie 1 Vollbild, Folie 2 Kartenkopf), jeweils object-fit:cover
+IMAGE_BOXES = {"background": (1280, 720), "competitor_building": (400, 120), "competitor": (400, 120)}
+
+def image_box(slot: str):
+    return IMAGE_BOXES.get(slot.rstrip("0123456789").rstrip("_"))
+
+def optimize_image(data: bytes, content_type: str, box) -> tuple:
+    """Verkleinert auf die Box (wie object-fit:cover, nie vergroessern) und komprimiert neu.
+    SVG/GIF, nicht lesbare Bilder und Ergebnisse, die nicht kleiner werden, bleiben unveraendert."""
+    if Image is None or not box or content_type in ("image/svg+xml", "image/gif"):
+        return data, content_type
+    width, height = (round(v * IMAGE_SCALE) for v in box)
+    out = io.BytesIO()
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            img.draft("RGB", (width, height))  # JPEG: gleich verkleinert dekodieren
+            img = ImageOps.exif_transpose(img)
+            scale = max(width / img.width, height / img.height)
+            if scale < 1:
+                size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+                img = img.resize(size, Image.LANCZOS)
+            alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+            if IMAGE_WEBP:
+                img.convert("RGBA" if alpha else "RGB").save(out, "WEBP", quality=IMAGE_QUALITY, method=4)
+                new_type = "image/webp"
+            elif alpha:
+                img.convert("RGBA").save(out, "PNG", optimize=True)
+                new_type = "image/png"
+            else:
+                img.convert("RGB").save(out, "JPEG", quality=IMAGE_QUALITY, optimize=True, progressive=True)
+                new_type = "image/jpeg"
+    except Exception as e:
+        print(f"    WARNUNG: Bild nicht optimiert, Original wird eingebettet ({e})")
+        return data, content_type
+    if out.tell() >= len(data):
+        return data, content_type
+    return out.getvalue(), new_type
+
+def image_data_uri(data: bytes, content_type: str, box=None, url: str = "") -> str:
+    if box:
+        optimized, new_type = optimize_image(data, content_type, box)
+        if optimized is not data:
+            print(f"    Bild optimiert: {len(data) / 1024:.1f} KB {content_type} -> "
+                  f"{len(optimized) / 1024:.1f} KB {new_type} ({url[:60]})")
+        data, content_type = optimized, new_type
+    return f"data:{content_type};base64," + base64.b64encode(data).decode()
+
+def is_permanent_image_error(e: Exception) -> bool:
+    """Nur Fehler, die sich beim naechsten Lauf nicht von selbst erledigen, werden negativ
+    gecacht: HTTP 4xx (ausser 408/429) und DNS-Fehler. Timeouts zaehlen nie dazu – auch
+    nicht, wenn die Batch-Frist das Timeout verkuerzt hat und das Bild nur langsam war."""
+    import socket
+    import urllib.error
+    if isinstance(e, urllib.error.HTTPError):
+        return 400 <= e.code < 500 and e.code not in (408, 429)
+    if isinstance(e, urllib.error.URLError):
+        return isinstance(e.reason, socket.gaierror)
+    return False
+
+def fetch_image_b64(url: str, retries: int = 2, deadline: float = None, box=None) -> str:
     """Laedt ein Bild von URL und gibt einen base64 data-URI zurueck.
-    Versucht bis zu 2x mit 2s Pause. Validiert Content-Type und erkennt SVGs."""
+    Versucht bis zu 2x mit 2s Pause. Validiert Content-Type und erkennt SVGs.
+    Mit deadline (time.monotonic()) werden Timeout und Pause auf die Restzeit begrenzt,
+    mit box (Breite, Hoehe) wird das Bild vor dem Einbetten verkleinert.
+    Frische Cache-Eintraege kommen ohne Netzwerk, aeltere werden per ETag/Last-Modified
+    revalidiert; scheitert der Download, wird ein vorhandener alter Stand verwendet."""
     if not url:
         return ""
     import urllib.request
     import urllib.error
-    import time
+    cached = IMAGE_CACHE.get(url) if IMAGE_CACHE else None
+    if cached and cached.get("failed_at"):
+        if time.time() - cached["failed_at"] < IMAGE_CACHE_NEGATIVE_TTL:
+            IMAGE_CACHE.count("negativ")
+            print(f"    Bild zuletzt fehlgeschlagen, uebersprungen (Cache): {url[:80]}")
+            return ""
+        cached = None
+    if cached and time.time() - cached["fetched_at"] < IMAGE_CACHE_TTL:
+        IMAGE_CACHE.count("treffer")
+        return image_data_uri(cached["data"], cached["content_type"], box, url)
+
+    headers = {"User-Agent": "Mozilla/5.0"}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+    def stale():
+        return image_data_uri(cached["data"], cached["content_type"], box, url) if cached else ""
+
     for attempt in range(retries):
+        timeout = IMAGE_TIMEOUT
+        if deadline is not None:
+            timeout = min(timeout, deadline - time.monotonic())
+            if timeout <= 0:
+                print(f"    WARNUNG: Zeitlimit erreicht, Bild uebersprungen: {url[:80]}")
+                return stale()
         try:
-            req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-            with urllib.request.urlopen(req, timeout=15) as resp:
+            req = urllib.request.Request(url, headers=headers)
+            with urllib.request.urlopen(req, timeout=timeout) as resp:
                 ct = resp.headers.get_content_type() or "image/jpeg"
                 if not ct.startswith("image/"):
                     print(f"    WARNUNG: URL liefert '{ct}' statt Bild (Fehlerseite?): {url[:80]}")
-                    return ""
+                    if IMAGE_CACHE and not cached:
+                        IMAGE_CACHE.put_failure(url, f"Content-Type {ct}")
+                    return stale()
                 data = resp.read()
                 if data[:4] == b"<svg" or data[:5] == b"<?xml":
                     ct = "image/svg+xml"
-                return f"data:{ct};base64," + base64.b64encode(data).decode()
+                if IMAGE_CACHE:
+                    IMAGE_CACHE.count("downloads")
+                    IMAGE_CACHE.put(url, data, ct, resp.headers.get("ETag"), resp.headers.get("Last-Modified"))
+                return image_data_uri(data, ct, box, url)
         except Exception as e:
+            if cached and isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                IMAGE_CACHE.count("revalidiert")
+                IMAGE_CACHE.refresh(url, cached)
+                return stale()
             if attempt < retries - 1:
                 print(f"    Bild-Download fehlgeschlagen (Versuch {attempt+1}/{retries}): {e}")
-                time.sleep(2)
+                pause = 2 if deadline is None else min(2, max(0, deadline - time.monotonic()))
+                time.sleep(pause)
+            elif cached:
+                print(f"    WARNUNG: Bild nicht aktualisiert, verwende Cache-Stand: {url[:80]} ({e})")
             else:
                 print(f"    WARNUNG: Bild konnte nicht geladen werden: {url[:80]} ({e})")
-    return ""
+                if IMAGE_CACHE and is_permanent_image_error(e):
+                    IMAGE_CACHE.put_failure(url, str(e))
+    return stale()
 
 def parse_salary(salary_str: str) -> float:
     s = re.sub(r'[^0-9,.]', '', str(salary_str))
@@ -80,10 +318,69 @@ def parse_salary(salary_str: str) -> float:
     except ValueError:
         return 0.0
 
-FONT_IMPORT = '<link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;800&display=swap" rel="stylesheet">'
+FONT_URL = "https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700;800&display=swap"
+FONT_IMPORT = f'<link href="{FONT_URL}" rel="stylesheet">'
+
+SLIDE_CSS = """@page { size: 1280px 720px; margin: 0; }
+* { margin:0; padding:0; box-sizing:border-box; }
+html, body { width:1280px; height:720px; overflow:hidden; background:#001666; font-family:'Inter',sans-serif; }
+"""
+
+# ── Gemeinsame Assets (--shared-assets) ──────────────────────────────────────
+# Standard: jede Folie ist eigenstaendig (Logo als base64, Google-Fonts-Link).
+# Mit --shared-assets schreibt das Skript einmal assets/ (Logo, CSS, Inter aus
+# templates/fonts/*.woff2) neben die Folien; diese verweisen per relativem Pfad darauf.
+ASSETS_DIR = "assets"
+FONTS_DIR = Path(__file__).resolve().parent.parent / "templates" / "fonts"
+FONT_WEIGHTS = {"regular": "400", "medium": "500", "semibold": "600", "bold": "700", "extrabold": "800"}
+SHARED_ASSETS = {}   # von write_shared_assets gesetzt: {"css": ..., "logo": ...}
+
+def logo_src() -> str:
+    return SHARED_ASSETS.get("logo", LOGO_B64)
+
+def slide_head() -> str:
+    """Schrift und Grund-CSS einer Folie: eingebettet oder als Verweis auf assets/."""
+    if SHARED_ASSETS:
+        return f'<link href="{SHARED_ASSETS["css"]}" rel="stylesheet">'
+    return f"{FONT_IMPORT}\n<style>\n{SLIDE_CSS}</style>"
+
+def font_face_css(fonts: list) -> str:
+    """@font-face je Datei: Inter-Bold.woff2 -> 700, Inter-600.woff2 -> 600, sonst variabel."""
+    rules = []
+    for path in fonts:
+        suffix = path.stem.rsplit("-", 1)[-1].lower() if "-" in path.stem else ""
+        weight = FONT_WEIGHTS.get(suffix) or (suffix if suffix.isdigit() else "100 900")
+        rules.append(f"@font-face {{ font-family:'Inter'; font-style:normal; font-weight:{weight}; "
+                     f"font-display:block; src:url('fonts/{path.name}') format('woff2'); }}")
+    return "\n".join(rules) + "\n"
+
+def write_shared_assets(out_dir: str):
+    """Schreibt assets/ (CSS, Schriften, Logo) nach out_dir und schaltet die Folien darauf um."""
+    assets = Path(out_dir) / ASSETS_DIR
+    assets.mkdir(parents=True, exist_ok=True)
+    fonts = sorted(FONTS_DIR.glob("Inter*.woff2"))
+    for path in fonts:
+        (assets / "fonts").mkdir(exist_ok=True)
+        shutil.copyfile(path, assets / "fonts" / path.name)
+    if fonts:
+        css = font_face_css(fonts)
+    else:
+        print(f"  WARNUNG: Keine Inter-Schrift in {FONTS_DIR} – Folien laden sie von Google Fonts.")
+        css = f"@import url('{FONT_URL}');\n"
+    (assets / "slides.css").write_text(css + SLIDE_CSS, encoding="utf-8")
+
+    SHARED_ASSETS.clear()
+    SHARED_ASSETS["css"] = f"{ASSETS_DIR}/slides.css"
+    if LOGO_B64:
+        header, b64 = LOGO_B64.split(",", 1)
+        ext = "svg" if "svg" in header else "png"
+        (assets / f"logo.{ext}").write_bytes(base64.b64decode(b64))
+        SHARED_ASSETS["logo"] = f"{ASSETS_DIR}/logo.{ext}"
+    print(f"  Gemeinsame Assets: {assets} ({len(fonts)} Schriftdateien)")
 
 def footer_html() -> str:
-    logo_img = f'<img src="{LOGO_B64}" style="height:26px;" />' if LOGO_B64 else \
+    logo = logo_src()
+    logo_img = f'<img src="{logo}" style="height:26px;" />' if logo else \
                '<span style="color:white;font-size:14px;font-weight:700;">hiOffice</span>'
     return f'''<div style="position:absolute;bottom:0;left:0;right:0;height:44px;display:flex;align-items:center;justify-content:space-between;padding:0 40px;border-top:1px solid rgba(255,255,255,0.12);">
     <span style="color:rgba(255,255,255,0.5);font-size:12px;">@HiOffice Group 2026</span>
@@ -95,13 +392,7 @@ def slide_wrapper(content: str) -> str:
     return f"""<!DOCTYPE html>
 <html lang="de"><head>
 <meta charset="UTF-8">
-{FONT_IMPORT}
-<style>
-  @page {{ size: 1280px 720px; margin: 0; }}
-  * {{ margin:0; padding:0; box-sizing:border-box; }}
-  html, body {{ width:1280px; height:720px; overflow:hidden; background:#001666;
-                font-family:'Inter',sans-serif; }}
-</style>
+{slide_head()}
 </head><body>
 <div style="width:1280px;height:720px;position:relative;background:#001666;overflow:hidden;">
   <div style="position:absolute;top:0;left:0;right:0;bottom:44px;padding:28px 36px 0 36px;display:flex;flex-direction:column;overflow:hidden;">
@@ -128,17 +419,13 @@ def slide_1(d: dict, images: dict) -> str:
 
     bg_layer = f'<img src="{bg_b64}" style="position:absolute;top:0;left:0;width:100%;height:100%;object-fit:cover;opacity:0.22;" />' if bg_b64 else ''
 
-    logo_img = f'<img src="{LOGO_B64}" style="height:26px;" />' if LOGO_B64 else ''
+    logo = logo_src()
+    logo_img = f'<img src="{logo}" style="height:26px;" />' if logo else ''
 
     return f"""<!DOCTYPE html>
 <html lang="de"><head>
 <meta charset="UTF-8">
-{FONT_IMPORT}
-<style>
-  @page {{ size: 1280px 720px; margin: 0; }}
-  * {{ margin:0; padding:0; box-sizing:border-box; }}
-  html, body {{ width:1280px; height:720px; overflow:hidden; background:#001666; font-family:'Inter',sans-serif; }}
-</style>
+{slide_head()}
 </head><body>
 <div style="width:1280px;height:720px;position:relative;background:#001666;overflow:hidden;">
   {bg_layer}
@@ -465,39 +752,75 @@ def slide_7(d: dict, images: dict) -> str:
 
 # ── Bilder vorladen ───────────────────────────────────────────────────────────
 
+def fetch_first_image(urls: list, deadline: float, box=None) -> str:
+    """Probiert die URLs der Reihe nach (z.B. Logo, dann Clearbit) und liefert das erste Bild."""
+    for url in urls:
+        b64 = fetch_image_b64(url, deadline=deadline, box=box)
+        if b64:
+            return b64
+    return ""
+
+def fetch_images_parallel(slots: dict) -> dict:
+    """Laedt alle Slots (Schluessel -> URL-Fallback-Kette) gleichzeitig.
+    Jeder Slot loest seine Kette unabhaengig auf; alle zusammen haben IMAGE_DEADLINE
+    Sekunden, die Laufzeit entspricht also dem langsamsten einzelnen Bild."""
+    if not slots:
+        return {}
+    started = time.monotonic()
+    deadline = started + IMAGE_DEADLINE
+    pool = ThreadPoolExecutor(max_workers=min(IMAGE_WORKERS, len(slots)))
+    futures = {
+        pool.submit(fetch_first_image, urls, deadline, image_box(key)): key for key, urls in slots.items()
+    }
+    # Kleiner Puffer: ein laufender read() kann das Socket-Timeout knapp ueberschreiten
+    done, pending = wait(futures, timeout=IMAGE_DEADLINE + 2)
+    pool.shutdown(wait=False, cancel_futures=True)
+    images = {futures[f]: f.result() for f in done}
+    for f in pending:
+        print(f"    WARNUNG: Zeitlimit ({IMAGE_DEADLINE}s) ueberschritten: {futures[f]}")
+    loaded = sum(1 for b64 in images.values() if b64)
+    embedded_kb = sum(len(b64) for b64 in images.values()) // 1024
+    print(f"  {loaded}/{len(slots)} Bilder in {time.monotonic() - started:.1f}s geladen ({embedded_kb} KB eingebettet)")
+    if IMAGE_CACHE:
+        print("  Bild-Cache: " + ", ".join(f"{n} {k}" for k, n in IMAGE_CACHE.stats.items()))
+        IMAGE_CACHE.evict()
+    return images
+
 def preload_images(d: dict) -> dict:
-    """Lädt alle Bilder herunter und gibt ein Dict mit base64-Daten zurück."""
-    images = {}
-    location = d.get('location', 'city')
+    """Lädt alle Bilder parallel herunter und gibt ein Dict mit base64-Daten zurück."""
     print("  Lade Bilder...")
+    slots = {}
 
     bg_url = d.get('background_image_url', '')
     if bg_url:
         print(f"    Hintergrund/Stadtbild: {bg_url[:60]}...")
-        images['background'] = fetch_image_b64(bg_url)
-
-    if not images.get('background'):
-        print(f"    WARNUNG: Kein Hintergrundbild (background_image_url) verfuegbar oder laden fehlgeschlagen. Folie 1 wird ohne Stadtbild generiert.")
+        slots['background'] = [bg_url]
 
-    # Folie 2: Pro Wettbewerber Gebäudebild, Fallback Logo
+    # Folie 2: Pro Wettbewerber Gebäudebild, Fallback Logo (Clearbit, falls logo_url fehlt/scheitert)
     for i, comp in enumerate(d.get('competitors', [])[:3]):
         build_url = comp.get('building_image_url', '')
         if build_url:
             print(f"    Wettbewerber {i+1} Gebäude: {build_url[:60]}...")
-            images[f'competitor_building_{i}'] = fetch_image_b64(build_url)
+            slots[f'competitor_building_{i}'] = [build_url]
 
+        logo_urls = []
         url = comp.get('logo_url', '') or comp.get('image_url', '')
         if url:
             print(f"    Wettbewerber {i+1} Logo: {url[:60]}...")
-            images[f'competitor_{i}'] = fetch_image_b64(url)
+            logo_urls.append(url)
+        domain = comp.get('domain', '')
+        if domain:
+            clearbit_url = f"https://logo.clearbit.com/{domain}"
+            print(f"    Wettbewerber {i+1} Clearbit Fallback: {clearbit_url[:60]}...")
+            logo_urls.append(clearbit_url)
+        if logo_urls:
+            slots[f'competitor_{i}'] = logo_urls
 
-        if not images.get(f'competitor_{i}'):
-            domain = comp.get('domain', '')
-            if domain:
-                clearbit_url = f"https://logo.clearbit.com/{domain}"
-                print(f"    Wettbewerber {i+1} Clearbit Fallback: {clearbit_url[:60]}...")
-                images[f'competitor_{i}'] = fetch_image_b64(clearbit_url)
+    images = fetch_images_parallel(slots)
 
+    if not images.get('background'):
+        print(f"    WARNUNG: Kein Hintergrundbild (background_image_url) verfuegbar oder laden fehlgeschlagen. Folie 1 wird ohne Stadtbild generiert.")
+    for i, comp in enumerate(d.get('competitors', [])[:3]):
         if not images.get(f'competitor_building_{i}') and not images.get(f'competitor_{i}'):
             print(f"    Wettbewerber {i+1}: Kein Gebäude/Logo – Initialen-Platzhalter wird verwendet.")
 
@@ -505,45 +828,67 @@ def preload_images(d: dict) -> dict:
 
 
 # ── PDF-Export via Chromium ───────────────────────────────────────────────────
+# Alle Folien kommen in ein mehrseitiges HTML-Dokument (eine Druckseite pro Folie),
+# das Chromium in einem einzigen Lauf druckt: ein Browser-Start pro Deck statt
+# sieben plus pypdf-Merge.
+
+CHROMIUM_BINARIES = ("chromium-browser", "chromium", "google-chrome")
+
+def combine_slides(html_pages: list) -> str:
+    """Fuegt vollstaendige Folien-HTMLs (slide_wrapper/slide_1) zu einem Dokument zusammen."""
+    pages = []
+    for html in html_pages:
+        m = re.search(r"<body>(.*)</body>", html, re.S)
+        pages.append(f'<div class="page">{m.group(1) if m else html}</div>')
+    return f"""<!DOCTYPE html>
+<html lang="de"><head>
+<meta charset="UTF-8">
+{slide_head()}
+<style>
+  html, body {{ height:auto; overflow:visible; }}
+  .page {{ width:1280px; height:720px; overflow:hidden; break-after:page; }}
+  .page:last-child {{ break-after:auto; }}
+</style>
+</head><body>
+{chr(10).join(pages)}
+</body></html>"""
 
-def export_pdf(html_files: list, output_pdf: str) -> bool:
-    """Exportiert eine Liste von HTML-Dateien als mehrseitiges PDF."""
-    from pypdf import PdfWriter
-    import glob
+def export_pdf(html_files: list, output_pdf: str) -> None:
+    """Exportiert eine Liste von HTML-Dateien als mehrseitiges PDF (ein Browser-Lauf).
+    Das kombinierte Dokument liegt neben den Folien, damit relative Pfade gelten.
 
-    tmp_pdfs = []
+    Wirft RuntimeError, wenn Chromium fehlschlaegt oder kein PDF entsteht."""
+    pages = []
     for html_path in html_files:
-        pdf_path = html_path.replace('.html', '.pdf')
+        with open(html_path, 'r', encoding='utf-8') as f:
+            pages.append(f.read())
+    deck_path = os.path.join(os.path.dirname(html_files[0]), "deck.html")
+    with open(deck_path, 'w', encoding='utf-8') as f:
+        f.write(combine_slides(pages))
+
+    started = time.monotonic()
+    chromium = next(filter(None, map(shutil.which, CHROMIUM_BINARIES)), CHROMIUM_BINARIES[0])
+    try:
         result = subprocess.run([
-            'chromium-browser', '--headless', '--disable-gpu', '--no-sandbox',
-            f'--print-to-pdf={pdf_path}',
+            chromium, '--headless', '--disable-gpu', '--no-sandbox',
+            f'--print-to-pdf={output_pdf}',
             '--print-to-pdf-no-header',
             '--run-all-compositor-stages-before-draw',
             '--virtual-time-budget=3000',
-            f'file://{html_path}'
-        ], capture_output=True, timeout=30)
-        if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 1000:
-            tmp_pdfs.append(pdf_path)
-        else:
-            print(f"  WARNUNG: PDF für {html_path} nicht erzeugt.")
-
-    if not tmp_pdfs:
-        return False
-
-    writer = PdfWriter()
-    for pdf in tmp_pdfs:
-        writer.append(pdf)
-    with open(output_pdf, 'wb') as fh:
-        writer.write(fh)
-
-    # Aufräumen
-    for f in tmp_pdfs:
-        try:
-            os.remove(f)
-        except Exception:
-            pass
-
-    return os.path.exists(output_pdf) and os.path.getsize(output_pdf) > 1000
+            Path(deck_path).resolve().as_uri()
+        ], capture_output=True, text=True, timeout=60)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise RuntimeError(f"Chromium ({chromium}) nicht ausfuehrbar: {e}") from e
+    finally:
+        os.remove(deck_path)
+
+    if result.returncode != 0:
+        stderr = result.stderr.strip().splitlines()
+        raise RuntimeError(f"Chromium beendet mit Code {result.returncode}"
+                           + (f": {stderr[-1]}" if stderr else ""))
+    if not os.path.exists(output_pdf) or os.path.getsize(output_pdf) == 0:
+        raise RuntimeError(f"Chromium hat kein PDF erzeugt: {output_pdf}")
+    print(f"  {len(pages)} Folien in {time.monotonic() - started:.1f}s gedruckt")
 
 
 # ── Hauptprogramm ─────────────────────────────────────────────────────────────
@@ -553,10 +898,12 @@ def main():
         print("Usage:")
         print("  PDF-Modus:  python generate_presentation.py <input.json> <output.pdf>")
         print("  HTML-Modus: python generate_presentation.py <input.json> --html-dir <ordner>")
+        print("  Optional:   --shared-assets (Logo, Schrift, CSS einmal in <ordner>/assets/)")
         sys.exit(1)
 
     json_path = sys.argv[1]
     html_only = '--html-dir' in sys.argv
+    shared_assets = '--shared-assets' in sys.argv
 
     if html_only:
         idx = sys.argv.index('--html-dir')
@@ -583,6 +930,8 @@ def main():
 
     if html_only:
         os.makedirs(html_dir, exist_ok=True)
+        if shared_assets:
+            write_shared_assets(html_dir)
         print(f"  Generiere HTML-Folien nach {html_dir} ...")
         for i, gen in enumerate(generators, 1):
             html = gen(data, images)
@@ -594,6 +943,8 @@ def main():
     else:
         tmp_dir = tempfile.mkdtemp(prefix="wa_slides_")
         html_files = []
+        if shared_assets:
+            write_shared_assets(tmp_dir)
 
         print("  Generiere HTML-Folien...")
         for i, gen in enumerate(generators, 1):
@@ -606,22 +957,15 @@ def main():
 
         print("  Exportiere PDF...")
         try:
-            from pypdf import PdfWriter
-        except ImportError:
-            subprocess.run(['pip3', 'install', '-q', 'pypdf'], check=True)
-            from pypdf import PdfWriter
-
-        success = export_pdf(html_files, output_path)
-
-        import shutil
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-
-        if success:
-            size_kb = os.path.getsize(output_path) // 1024
-            print(f"\n✓ PDF erfolgreich erstellt: {output_path} ({size_kb} KB)")
-        else:
-            print(f"\n✗ PDF-Export fehlgeschlagen.")
+            export_pdf(html_files, output_path)
+        except RuntimeError as e:
+            print(f"\n✗ PDF-Export fehlgeschlagen: {e}")
             sys.exit(1)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+        size_kb = os.path.getsize(output_path) // 1024
+        print(f"\n✓ PDF erfolgreich erstellt: {output_path} ({size_kb} KB)")
 
 if __name__ == '__main__':
     main()
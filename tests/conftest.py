@@ -0,0 +1,38 @@
+import os
+import tempfile
+
+# Vor dem ersten Import von app.*: Settings brauchen einen Manus-Key, und die
+# globale Engine soll nicht auf ./salesbot.db zeigen.
+os.environ.setdefault("MANUS_API_KEY", "test")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='salesbot-test-')}/app.db")
+
+import pytest  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.database import async_database_url, upgrade_schema  # noqa: E402
+
+
+@pytest.fixture
+def database_url(tmp_path) -> str:
+    return async_database_url(f"sqlite:///{tmp_path / 'test.db'}")
+
+
+@pytest.fixture
+async def engine(database_url):
+    engine = create_async_engine(database_url)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def session_factory(engine):
+    """Sessions auf einer frisch per Alembic migrierten SQLite-Datenbank."""
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+    return async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
+
+@pytest.fixture
+async def db(session_factory):
+    async with session_factory() as session:
+        yield session
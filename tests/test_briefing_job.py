@@ -0,0 +1,140 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import select
+
+from app.input_processor import InputModus
+from app.input_processor.extractor import ExtractionResult
+from app.jobs import briefing
+from app.models.job import Job
+from app.models.task import AnalysisTask, TaskStatus
+
+TEXT = "Lebenshilfe Lausitz e.V.\nCottbus\nHeilerziehungspfleger"
+
+
+@pytest.fixture
+def task_and_job(db):
+    async def create() -> tuple[AnalysisTask, Job]:
+        task = AnalysisTask(
+            unternehmen="",
+            standort="",
+            position="",
+            source_platform="slack",
+            slack_channel_id="C-1",
+            status=TaskStatus.PENDING,
+            input_modus=InputModus.MINIMAL.value,
+        )
+        db.add(task)
+        await db.flush()
+        job = Job(kind="briefing", task_id=task.id, payload=json.dumps({"text": TEXT}), attempts=1)
+        db.add(job)
+        await db.commit()
+        return task, job
+
+    return create
+
+
+def _extraction(**fields) -> ExtractionResult:
+    return ExtractionResult(raw_input=TEXT, input_modus=InputModus.MINIMAL, **fields)
+
+
+async def test_notification_failure_does_not_fail_briefing(db, task_and_job, monkeypatch):
+    task, job = await task_and_job()
+
+    async def extract_fields(text, modus, on_mandatory_fields=None):
+        return _extraction(unternehmen="Lebenshilfe Lausitz e.V.", standort="Cottbus", position="HEP")
+
+    async def notify_user(task, text):
+        raise RuntimeError("Slack nicht erreichbar")
+
+    monkeypatch.setattr(briefing, "extract_fields", extract_fields)
+    monkeypatch.setattr(briefing, "notify_user", notify_user)
+
+    await briefing.process_briefing(job, db)
+
+    await db.refresh(task)
+    assert task.status == TaskStatus.PENDING
+    assert task.error_message is None
+    continuation = await db.scalar(select(Job).where(Job.id != job.id, Job.task_id == task.id))
+    assert continuation is not None and continuation.ordering_key.startswith("briefing:")
+
+
+async def test_no_confirmation_when_validation_fails(db, task_and_job, monkeypatch):
+    task, job = await task_and_job()
+    sent: list[str] = []
+
+    async def extract_fields(text, modus, on_mandatory_fields=None):
+        return _extraction(unternehmen="Lebenshilfe Lausitz e.V.", standort="Cottbus")
+
+    async def notify_user(task, text):
+        sent.append(text)
+
+    monkeypatch.setattr(briefing, "extract_fields", extract_fields)
+    monkeypatch.setattr(briefing, "notify_user", notify_user)
+
+    await briefing.process_briefing(job, db)
+
+    await db.refresh(task)
+    assert task.status == TaskStatus.FAILED
+    assert len(sent) == 1 and "position" in sent[0].lower()
+
+
+def _streaming(final: ExtractionResult, partial: ExtractionResult, sent: list[str]):
+    """extract_fields, das die Pflichtfelder vorab meldet und danach ``final`` liefert."""
+
+    async def extract_fields(text, modus, on_mandatory_fields=None):
+        await on_mandatory_fields(partial)
+        await asyncio.sleep(0)
+        assert sent, "Bestätigung muss vor dem Ende des Streams gesendet sein"
+        return final
+
+    return extract_fields
+
+
+@pytest.fixture
+def sent(monkeypatch) -> list[str]:
+    messages: list[str] = []
+
+    async def notify_user(task, text):
+        messages.append(text)
+
+    monkeypatch.setattr(briefing, "notify_user", notify_user)
+    return messages
+
+
+FIELDS = dict(unternehmen="Lebenshilfe Lausitz e.V.", standort="Cottbus", position="HEP")
+
+
+async def test_early_confirmation_is_sent_once(db, task_and_job, monkeypatch, sent):
+    task, job = await task_and_job()
+    final = _extraction(**FIELDS, zusatzkontext="Rentenwelle")
+    monkeypatch.setattr(briefing, "extract_fields", _streaming(final, _extraction(**FIELDS), sent))
+
+    await briefing.process_briefing(job, db)
+
+    assert len(sent) == 1 and "Lebenshilfe Lausitz" in sent[0]
+    assert not sent[0].startswith(briefing.CORRECTION_PREFIX)
+
+
+async def test_stream_failure_after_early_confirmation_sends_correction(db, task_and_job, monkeypatch, sent):
+    task, job = await task_and_job()
+    broken = _extraction(errors=["LLM-Antwort konnte nicht geparst werden"])
+    monkeypatch.setattr(briefing, "extract_fields", _streaming(broken, _extraction(**FIELDS), sent))
+
+    await briefing.process_briefing(job, db)
+
+    await db.refresh(task)
+    assert task.status == TaskStatus.FAILED
+    assert len(sent) == 2 and sent[1].startswith(briefing.CORRECTION_PREFIX)
+
+
+async def test_changed_fields_after_early_confirmation_send_correction(db, task_and_job, monkeypatch, sent):
+    task, job = await task_and_job()
+    final = _extraction(**{**FIELDS, "standort": "Spremberg"})
+    monkeypatch.setattr(briefing, "extract_fields", _streaming(final, _extraction(**FIELDS), sent))
+
+    await briefing.process_briefing(job, db)
+
+    assert len(sent) == 2
+    assert sent[1].startswith(briefing.CORRECTION_PREFIX) and "Spremberg" in sent[1]
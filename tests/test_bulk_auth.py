@@ -0,0 +1,25 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+
+CSV = "unternehmen,standort,position\nLebenshilfe Lausitz,Cottbus,HEP\n"
+
+
+@pytest.fixture
+def client(monkeypatch) -> TestClient:
+    monkeypatch.setattr(settings, "admin_api_key", "geheim")
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Key": "falsch"}])
+def test_bulk_import_requires_admin_key(client, headers):
+    response = client.post("/api/bulk/briefings?dry_run=true", content=CSV, headers=headers)
+    assert response.status_code == 401
+
+
+def test_bulk_import_disabled_without_configured_key(client, monkeypatch):
+    monkeypatch.setattr(settings, "admin_api_key", "")
+    response = client.post("/api/bulk/briefings?dry_run=true", content=CSV, headers={"X-Admin-Key": ""})
+    assert response.status_code == 503
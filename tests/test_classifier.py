@@ -0,0 +1,87 @@
+import itertools
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from app.input_processor.classifier import (
+    _PREFIX_CHARS,
+    _RICH_INDICATORS,
+    _STRUCTURED_PATTERN,
+    _TALENT_REPORT_PATTERN,
+    InputModus,
+    classify_input,
+    scan_input,
+)
+
+CORPUS = Path(__file__).resolve().parent.parent / "scripts" / "data" / "extraction_corpus.jsonl"
+
+
+def legacy_indicators(text: str) -> set[str]:
+    text_lower = text.lower()
+    return {pattern for pattern in _RICH_INDICATORS if re.search(pattern, text_lower)}
+
+
+def classify_input_legacy(text: str) -> InputModus:
+    """Ursprüngliche Klassifikation: ein ``re.search`` pro Indikator."""
+    if _TALENT_REPORT_PATTERN.search(text):
+        return InputModus.TALENT_REPORT
+    if _STRUCTURED_PATTERN.search(text):
+        return InputModus.STRUCTURED
+
+    lines = [line.strip() for line in text.splitlines() if line.strip()]
+    rich_score = len(legacy_indicators(text))
+
+    if rich_score >= 3:
+        return InputModus.RICH
+    if len(lines) <= 5 and rich_score == 0:
+        return InputModus.MINIMAL
+    if len(lines) > 8:
+        return InputModus.RICH
+    return InputModus.MINIMAL
+
+
+def _corpus() -> list[str]:
+    with CORPUS.open(encoding="utf-8") as f:
+        return [json.loads(line)["text"] for line in f if line.strip()]
+
+
+def _overlaps() -> list[str]:
+    """Jeder Indikator allein und jede Verkettung, bei der zwei sich überlappen."""
+    samples = [re.sub(r"\\s\*", " ", pattern) for pattern in _RICH_INDICATORS]
+    texts = list(samples)
+    for a, b in itertools.permutations(samples, 2):
+        for k in range(1, min(len(a), len(b))):
+            if a[-k:] == b[:k]:
+                texts.append(a + b[k:])
+    return texts
+
+
+REVIEW_EXAMPLES = [
+    "Lebenshilfe Lausitz\nCottbus\nHEP\nin Rentenwelle, Ghosting",
+    "Lebenshilfe Lausitz\nCottbus\nHEP\nLeiharbeitnehmerüberlassung, hoher Krankenstand",
+]
+
+
+@pytest.mark.parametrize("text", REVIEW_EXAMPLES)
+def test_overlapping_indicators_are_counted(text):
+    assert classify_input(text) == classify_input_legacy(text) == InputModus.RICH
+
+
+@pytest.mark.parametrize("text", _overlaps())
+def test_scan_finds_every_indicator_like_per_pattern_search(text):
+    assert scan_input(text).indicators == legacy_indicators(text)
+
+
+def test_matches_legacy_classifier_on_corpus():
+    for text in _corpus():
+        assert scan_input(text).indicators == legacy_indicators(text), text[:80]
+        assert classify_input(text) == classify_input_legacy(text), text[:80]
+
+
+def test_matches_legacy_classifier_beyond_prefix():
+    filler = "x" * _PREFIX_CHARS
+    for text in REVIEW_EXAMPLES + _corpus():
+        padded = filler + " " + text
+        assert classify_input(padded) == classify_input_legacy(padded), text[:80]
@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy import select
+
+from app import notifications
+from app.coalescing import attach
+from app.jobs.briefing import on_briefing_failed
+from app.jobs.webhook import DELIVERY_JOB, process_delivery, process_webhook_event
+from app.models.job import Job
+from app.models.task import AnalysisTask, TaskStatus
+
+
+def _task(channel: str, **kwargs) -> AnalysisTask:
+    return AnalysisTask(
+        unternehmen="Lebenshilfe Lausitz e.V.",
+        standort="Cottbus",
+        position="Heilerziehungspfleger",
+        source_platform="slack",
+        slack_channel_id=channel,
+        cache_key="a" * 64,
+        **kwargs,
+    )
+
+
+@pytest.fixture
+def sent(monkeypatch) -> list[tuple[str, str]]:
+    messages: list[tuple[str, str]] = []
+
+    async def send_to_slack(task, text):
+        messages.append((task.slack_channel_id, text))
+
+    monkeypatch.setattr(notifications, "send_to_slack", send_to_slack)
+    return messages
+
+
+async def _stop(db, stop_reason: str, message: str = "") -> None:
+    job = Job(
+        kind="manus_webhook",
+        payload=(
+            '{"event_id": "evt-1", "event_type": "task_stopped", "task_detail": '
+            f'{{"task_id": "manus-1", "stop_reason": "{stop_reason}", "message": "{message}"}}}}'
+        ),
+    )
+    await process_webhook_event(job, db)
+
+
+async def _deliver_all(db) -> None:
+    for job in (await db.scalars(select(Job).where(Job.kind == DELIVERY_JOB))).all():
+        await process_delivery(job, db)
+
+
+async def test_leader_failure_fails_and_notifies_coalesced_tasks(db, sent):
+    leader = _task("C-leader", status=TaskStatus.PROCESSING, manus_task_id="manus-1")
+    db.add(leader)
+    await db.flush()
+    followers = [_task(f"C-{i}", status=TaskStatus.PENDING) for i in range(2)]
+    for follower in followers:
+        db.add(follower)
+        attach(follower, leader)
+    await db.commit()
+
+    await _stop(db, "error", "Kontingent erschöpft")
+
+    for follower in followers:
+        await db.refresh(follower)
+        assert follower.status == TaskStatus.FAILED
+        assert follower.error_message == "Kontingent erschöpft"
+
+    await _deliver_all(db)
+    assert {channel for channel, _ in sent} == {"C-leader", "C-0", "C-1"}
+    assert all("fehlgeschlagen: Kontingent erschöpft" in text for _, text in sent)
+
+
+async def test_leader_success_delivers_to_coalesced_tasks(db, sent):
+    leader = _task("C-leader", status=TaskStatus.PROCESSING, manus_task_id="manus-1")
+    db.add(leader)
+    await db.flush()
+    follower = _task("C-0", status=TaskStatus.PENDING)
+    db.add(follower)
+    attach(follower, leader)
+    await db.commit()
+
+    await _stop(db, "finish")
+    await db.refresh(follower)
+    assert follower.status == TaskStatus.COMPLETED
+
+    await _deliver_all(db)
+    assert {channel for channel, _ in sent} == {"C-leader", "C-0"}
+    assert all("ist fertig" in text or "abgeschlossen" in text for _, text in sent)
+
+
+async def test_failed_leader_job_fails_coalesced_tasks(db, sent):
+    leader = _task("C-leader", status=TaskStatus.PROCESSING, manus_task_id="manus-1")
+    db.add(leader)
+    await db.flush()
+    follower = _task("C-0", status=TaskStatus.PENDING)
+    db.add(follower)
+    attach(follower, leader)
+    await db.commit()
+
+    await on_briefing_failed(Job(kind="briefing", task_id=leader.id), db, RuntimeError("Timeout"))
+    await db.refresh(follower)
+    assert follower.status == TaskStatus.FAILED
+
+    await _deliver_all(db)
+    assert {channel for channel, _ in sent} == {"C-leader", "C-0"}
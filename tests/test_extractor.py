@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import pytest
+
+from app.config import settings
+from app.input_processor import extractor, llm_cache
+from app.input_processor.classifier import InputModus
+from app.input_processor.extractor import ExtractionResult, extract_fields
+
+LLM_SECONDS = 0.3
+
+
+@pytest.fixture
+def llm(monkeypatch) -> dict:
+    """Langsame LLM-Extraktion; zählt Starts und vollständige Durchläufe."""
+    calls = {"started": 0, "finished": 0}
+
+    async def extract_with_llm(text, modus, on_mandatory_fields=None):
+        calls["started"] += 1
+        await asyncio.sleep(LLM_SECONDS)
+        calls["finished"] += 1
+        return ExtractionResult(
+            unternehmen="Sonnenschein gGmbH", standort="Cottbus", position="Heilerziehungspfleger",
+            raw_input=text, input_modus=modus, used_llm=True,
+        )
+
+    monkeypatch.setattr(extractor, "_extract_with_llm", extract_with_llm)
+    monkeypatch.setattr(settings, "extraction_speculative", True)
+    return calls
+
+
+@pytest.fixture
+def cache(monkeypatch) -> dict:
+    entries: dict = {}
+
+    async def lookup(key):
+        await asyncio.sleep(LLM_SECONDS)
+        return entries.get("hit")
+
+    async def store(key, fields):
+        entries["stored"] = fields
+
+    monkeypatch.setattr(llm_cache, "lookup", lookup)
+    monkeypatch.setattr(llm_cache, "store", store)
+    return entries
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Haus am See\nPflege\nBerlin",  # sicher zugeordnet
+        "Lebenshilfe Lausitz e.V.\nCottbus\nHEP",  # vollständig, aber unsicher
+    ],
+)
+async def test_complete_rule_result_does_not_wait_for_llm(llm, cache, text):
+    started = time.monotonic()
+    result = await extract_fields(text, InputModus.MINIMAL)
+    await asyncio.sleep(0)
+
+    assert time.monotonic() - started < LLM_SECONDS / 3
+    assert not result.used_llm
+    assert llm == {"started": 0, "finished": 0}
+
+
+async def test_incomplete_rules_overlap_llm_with_cache_lookup(llm, cache):
+    started = time.monotonic()
+    result = await extract_fields("Sonnenschein\nCottbus", InputModus.MINIMAL)
+
+    # Cache-Abfrage und LLM laufen gleichzeitig, nicht nacheinander
+    assert time.monotonic() - started < LLM_SECONDS * 1.7
+    assert result.used_llm and result.position == "Heilerziehungspfleger"
+    assert cache["stored"]["unternehmen"] == "Sonnenschein gGmbH"
+
+
+async def test_cache_hit_cancels_speculative_llm(llm, cache):
+    cache["hit"] = {"unternehmen": "Sonnenschein gGmbH", "standort": "Cottbus", "position": "HEP"}
+    result = await extract_fields("Sonnenschein\nCottbus", InputModus.MINIMAL)
+    await asyncio.sleep(LLM_SECONDS)
+
+    assert result.unternehmen == "Sonnenschein gGmbH"
+    assert llm["finished"] == 0
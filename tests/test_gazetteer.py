@@ -0,0 +1,54 @@
+import pytest
+
+from app.input_processor.extractor import _find_standort
+from app.input_processor.gazetteer import PLACE_PATTERN, is_place_mention
+
+
+def _mentions(line: str) -> list[str]:
+    return [m.group(1) for m in PLACE_PATTERN.finditer(line) if is_place_mention(line, m)]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "Essen wird gestellt",
+        "Mittagessen und Essen auf Rädern inklusive",
+        "Sport in Halle 3",
+        "Die Halle ist neu renoviert",
+        "Urlaub im Harz möglich",
+        "Herr Hagen leitet die Einrichtung",
+        "Keine Rügen bei der letzten Prüfung",
+    ],
+)
+def test_ambiguous_nouns_are_not_places(line):
+    assert _mentions(line) == []
+
+
+@pytest.mark.parametrize(
+    ("line", "place"),
+    [
+        ("Einrichtung in Essen", "Essen"),
+        ("Wohngruppen im Raum Hamm", "Hamm"),
+        ("06108 Halle (Saale)", "Halle"),
+        ("Standort: Kiel", "Kiel"),
+        ("Essen, NRW", "Essen"),
+        ("- Siegen", "Siegen"),
+        ("Region Harz", "Harz"),
+    ],
+)
+def test_ambiguous_names_with_place_context(line, place):
+    assert place in _mentions(line)
+
+
+def test_unambiguous_names_need_no_context():
+    assert _mentions("Cottbus und Dresden") == ["Cottbus", "Dresden"]
+
+
+def test_standort_ignores_ambiguous_noun():
+    lines = ["Sonnenschein gGmbH", "Essen wird gestellt", "Wohngruppe in Cottbus"]
+    assert _find_standort(lines, company_index=0) == ("Cottbus, Brandenburg", 0.9)
+
+
+def test_standort_from_company_line():
+    lines = ["AWO Kreisverband Halle e.V.", "Heilerziehungspfleger gesucht"]
+    assert _find_standort(lines, company_index=0)[0] == "Halle, Sachsen-Anhalt"
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.models  # noqa: F401  (registriert alle Tabellen an Base.metadata)
+from app.database import ALEMBIC_INI, Base, upgrade_schema
+from app.models.job import Job
+from app.models.task import AnalysisTask, TaskStatus
+
+# analysis_tasks, wie sie vor Alembic per create_all angelegt wurde (einzige Tabelle)
+_legacy = sa.MetaData()
+sa.Table(
+    "analysis_tasks",
+    _legacy,
+    sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+    sa.Column("unternehmen", sa.String(500), nullable=False),
+    sa.Column("standort", sa.String(300), nullable=False),
+    sa.Column("position", sa.String(300), nullable=False),
+    sa.Column("zusatzkontext", sa.Text),
+    sa.Column("manus_prompt", sa.Text),
+    sa.Column("manus_task_id", sa.String(200), index=True),
+    sa.Column("manus_task_url", sa.String(1000)),
+    sa.Column("status", sa.Enum(TaskStatus), nullable=False),
+    sa.Column("result_file_url", sa.String(1000)),
+    sa.Column("result_file_name", sa.String(500)),
+    sa.Column("error_message", sa.Text),
+    sa.Column("source_platform", sa.String(20), nullable=False),
+    sa.Column("teams_user_id", sa.String(200)),
+    sa.Column("teams_user_name", sa.String(300)),
+    sa.Column("teams_conversation_id", sa.String(500)),
+    sa.Column("teams_activity_id", sa.String(500)),
+    sa.Column("conversation_reference", sa.Text),
+    sa.Column("slack_channel_id", sa.String(200)),
+    sa.Column("slack_user_id", sa.String(200)),
+    sa.Column("input_modus", sa.String(20)),
+    sa.Column("created_at", sa.DateTime, nullable=False),
+    sa.Column("updated_at", sa.DateTime, nullable=False),
+    sa.Column("completed_at", sa.DateTime),
+)
+
+
+def _schema(connection) -> dict[str, set[str]]:
+    inspector = inspect(connection)
+    return {name: {c["name"] for c in inspector.get_columns(name)} for name in inspector.get_table_names()}
+
+
+def _assert_matches_models(schema: dict[str, set[str]]) -> None:
+    for name, table in Base.metadata.tables.items():
+        assert name in schema, f"Tabelle {name} fehlt"
+        assert {c.name for c in table.columns} <= schema[name], f"Spalten fehlen in {name}"
+
+
+async def test_upgrade_pre_alembic_database(engine):
+    """Altbestand (nur analysis_tasks, kein alembic_version) bekommt alle Tabellen."""
+    async with engine.begin() as conn:
+        await conn.run_sync(_legacy.create_all)
+        now = datetime(2026, 1, 1)
+        await conn.execute(
+            _legacy.tables["analysis_tasks"].insert(),
+            {
+                "unternehmen": "Alt GmbH", "standort": "Berlin", "position": "HEP",
+                "status": "COMPLETED", "source_platform": "teams",
+                "created_at": now, "updated_at": now,
+            },
+        )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(upgrade_schema)
+        schema = await conn.run_sync(_schema)
+        version = (await conn.execute(text("SELECT version_num FROM alembic_version"))).scalar_one()
+
+    _assert_matches_models(schema)
+    assert version == ScriptDirectory.from_config(Config(str(ALEMBIC_INI))).get_current_head()
+
+    # Bestandsdaten bleiben erhalten, Job-Queue ist benutzbar
+    async with AsyncSession(engine) as db:
+        task = await db.scalar(select(AnalysisTask))
+        assert task.unternehmen == "Alt GmbH"
+        db.add(Job(kind="briefing", task_id=task.id))
+        await db.commit()
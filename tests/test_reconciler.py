@@ -0,0 +1,123 @@
+import time
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from app.jobs.webhook import WEBHOOK_JOB
+from app.manus.dedupe import remember_event
+from app.manus.reconciler import TaskReconciler, _utcnow, event_from_task_response
+from app.manus.schemas import TaskResponse
+from app.models.job import Job
+from app.models.task import AnalysisTask, TaskStatus
+
+
+class FakeClient:
+    def __init__(self, status: str, **fields):
+        self.response = TaskResponse(task_id="manus-1", status=status, **fields)
+        self.calls = 0
+
+    async def get_task(self, manus_task_id: str) -> TaskResponse:
+        self.calls += 1
+        return self.response
+
+
+async def _stale_task(db) -> AnalysisTask:
+    old = _utcnow() - timedelta(hours=2)
+    task = AnalysisTask(
+        unternehmen="Lebenshilfe Lausitz e.V.",
+        standort="Cottbus",
+        position="Heilerziehungspfleger",
+        source_platform="slack",
+        status=TaskStatus.PROCESSING,
+        manus_task_id="manus-1",
+        created_at=old,
+        updated_at=old,
+    )
+    db.add(task)
+    await db.commit()
+    return task
+
+
+async def _webhook_jobs(db) -> int:
+    return await db.scalar(select(func.count()).select_from(Job).where(Job.kind == WEBHOOK_JOB))
+
+
+def test_event_from_completed_task_carries_attachments():
+    event = event_from_task_response(
+        TaskResponse(
+            task_id="manus-1",
+            status="Completed",
+            artifacts=[{"fileUrl": "https://files.example/report.pdf"}, {"name": "ohne-url"}],
+        )
+    )
+    assert event.event_id == "reconcile-manus-1-completed"
+    assert event.event_type == "task_stopped"
+    assert event.task_detail.stop_reason == "finish"
+    assert [(a.file_name, a.url) for a in event.task_detail.attachments] == [
+        ("report.pdf", "https://files.example/report.pdf")
+    ]
+
+
+def test_event_from_failed_task_is_error():
+    event = event_from_task_response(TaskResponse(task_id="manus-1", status="failed", output="Quota"))
+    assert event.task_detail.stop_reason == "error"
+    assert event.task_detail.message == "Quota"
+
+
+@pytest.mark.parametrize("status", ["running", "pending", ""])
+def test_event_from_running_task_is_none(status):
+    assert event_from_task_response(TaskResponse(task_id="manus-1", status=status)) is None
+
+
+async def test_sweep_enqueues_terminal_task(db, session_factory, engine):
+    task = await _stale_task(db)
+    reconciler = TaskReconciler(session_factory, engine, client=FakeClient("completed"))
+
+    assert await reconciler.sweep() == 1
+
+    assert await _webhook_jobs(db) == 1
+    assert task.id not in reconciler._schedule
+
+
+async def test_sweep_backs_off_running_task(db, session_factory, engine):
+    task = await _stale_task(db)
+    client = FakeClient("running")
+    reconciler = TaskReconciler(session_factory, engine, client=client)
+
+    assert await reconciler.sweep() == 1
+    assert await reconciler.sweep() == 0
+
+    assert client.calls == 1
+    assert reconciler._schedule[task.id][0] > time.monotonic()
+    assert await _webhook_jobs(db) == 0
+
+
+async def test_sweep_backs_off_already_remembered_event(db, session_factory, engine):
+    task = await _stale_task(db)
+    client = FakeClient("completed")
+    # Event schon eingereiht (z.B. voriger Sweep), Job aber noch nicht verarbeitet
+    assert await remember_event(db, event_from_task_response(client.response))
+    await db.commit()
+    reconciler = TaskReconciler(session_factory, engine, client=client)
+
+    assert await reconciler.sweep() == 1
+    assert await reconciler.sweep() == 0
+
+    assert client.calls == 1
+    assert reconciler._schedule[task.id][0] > time.monotonic()
+    assert await _webhook_jobs(db) == 0
+
+
+async def test_file_lock_held_elsewhere_skips_leadership(session_factory, engine, monkeypatch):
+    fcntl = pytest.importorskip("fcntl")
+    reconciler = TaskReconciler(session_factory, engine, client=FakeClient("running"))
+
+    async def run_as_leader():
+        raise AssertionError("zweiter Prozess darf nicht abgleichen")
+
+    monkeypatch.setattr(reconciler, "_run_as_leader", run_as_leader)
+    # flock gilt pro geöffneter Datei – ein eigener Handle simuliert den anderen Worker
+    with open(f"{engine.url.database}.reconciler.lock", "a") as other:
+        fcntl.flock(other, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        await reconciler._run_with_file_lock()
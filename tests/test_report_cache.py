@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import settings
+from app.models.task import AnalysisTask, TaskStatus
+from app.report_cache import find_cached_report, reuse_report
+
+KEY = "a" * 64
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _task(**kwargs) -> AnalysisTask:
+    defaults = dict(
+        unternehmen="Lebenshilfe Lausitz e.V.",
+        standort="Cottbus",
+        position="Heilerziehungspfleger",
+        source_platform="slack",
+        cache_key=KEY,
+    )
+    return AnalysisTask(**{**defaults, **kwargs})
+
+
+def _manus_report(completed_at: datetime) -> AnalysisTask:
+    return _task(
+        status=TaskStatus.COMPLETED,
+        manus_task_id="manus-1",
+        result_file_url="https://files.example/report.pptx",
+        result_file_name="report.pptx",
+        created_at=completed_at - timedelta(minutes=30),
+        completed_at=completed_at,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _max_age(monkeypatch):
+    monkeypatch.setattr(settings, "report_cache_max_age_days", 7)
+
+
+async def test_reused_report_is_not_a_cache_source(db):
+    """Eine Wiederverwendung verlängert die Frische des Originals nicht."""
+    original = _manus_report(_now() - timedelta(days=6))
+    db.add(original)
+    await db.commit()
+
+    first = _task(status=TaskStatus.PROCESSING)
+    db.add(first)
+    cached = await find_cached_report(db, KEY)
+    assert cached is original
+    reuse_report(first, cached)
+    await db.commit()
+
+    # Zwei Tage später ist das Original abgelaufen – die Kopie darf nicht einspringen
+    original.completed_at = _now() - timedelta(days=8)
+    await db.commit()
+    assert await find_cached_report(db, KEY) is None
+
+
+async def test_coalesced_task_is_not_a_cache_source(db):
+    leader = _manus_report(_now() - timedelta(days=8))
+    db.add(leader)
+    await db.flush()
+    db.add(
+        _task(
+            status=TaskStatus.COMPLETED,
+            coalesced_into_task_id=leader.id,
+            result_file_url=leader.result_file_url,
+            completed_at=_now(),
+        )
+    )
+    await db.commit()
+    assert await find_cached_report(db, KEY) is None
+
+
+async def test_newest_fresh_original_wins(db):
+    older = _manus_report(_now() - timedelta(days=5))
+    newer = _manus_report(_now() - timedelta(days=1))
+    db.add_all([older, newer])
+    await db.commit()
+    assert await find_cached_report(db, KEY) is newer
@@ -0,0 +1,83 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.manus.resilience import CircuitBreaker, CircuitOpenError, CircuitState, call_with_resilience
+
+REQUEST = httpx.Request("POST", "https://api.manus.example/v1/tasks")
+
+
+@pytest.fixture(autouse=True)
+def _single_attempt(monkeypatch):
+    monkeypatch.setattr(settings, "manus_retry_max_attempts", 1)
+
+
+@pytest.fixture
+def half_open() -> CircuitBreaker:
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    breaker.opened_at -= 61
+    assert breaker.state == CircuitState.HALF_OPEN
+    return breaker
+
+
+def _respond(status: int):
+    async def send() -> httpx.Response:
+        return httpx.Response(status, request=REQUEST)
+
+    return send
+
+
+def _raise(exc: BaseException):
+    async def send() -> httpx.Response:
+        raise exc
+
+    return send
+
+
+@pytest.mark.parametrize("exc", [asyncio.CancelledError(), RuntimeError("kaputt")])
+async def test_probe_is_released_when_send_raises_unexpectedly(half_open, exc):
+    with pytest.raises(type(exc)):
+        await call_with_resilience("create_task", _raise(exc), idempotent=False, breaker=half_open)
+
+    assert half_open.state == CircuitState.HALF_OPEN
+    response = await call_with_resilience("create_task", _respond(200), idempotent=False, breaker=half_open)
+    assert response.status_code == 200
+    assert half_open.state == CircuitState.CLOSED
+
+
+async def test_probe_is_released_when_caller_is_cancelled(half_open):
+    started = asyncio.Event()
+
+    async def hang() -> httpx.Response:
+        started.set()
+        await asyncio.sleep(3600)
+
+    probe = asyncio.create_task(call_with_resilience("get_task", hang, idempotent=True, breaker=half_open))
+    await started.wait()
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+
+    assert half_open.allow()
+
+
+async def test_throttled_probe_reopens_breaker(half_open):
+    with pytest.raises(httpx.HTTPStatusError):
+        await call_with_resilience("create_task", _respond(429), idempotent=False, breaker=half_open)
+
+    assert half_open.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await call_with_resilience("create_task", _respond(200), idempotent=False, breaker=half_open)
+
+
+async def test_throttling_does_not_reset_failure_count():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    with pytest.raises(httpx.HTTPStatusError):
+        await call_with_resilience("get_task", _respond(429), idempotent=True, breaker=breaker)
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failures == 1
@@ -0,0 +1,61 @@
+"""Die Monitoring-Abfragen auf analysis_tasks müssen ihre Indizes nutzen (EXPLAIN QUERY PLAN)."""
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select, text
+
+from app.models.task import AnalysisTask, TaskStatus
+
+CUTOFF = datetime(2026, 1, 1)
+
+QUERIES = {
+    "ix_analysis_tasks_status_created_at": (
+        select(AnalysisTask.id)
+        .where(AnalysisTask.status == TaskStatus.PROCESSING, AnalysisTask.created_at < CUTOFF)
+        .order_by(AnalysisTask.created_at)
+    ),
+    "ix_analysis_tasks_slack_user_created_at": (
+        select(AnalysisTask)
+        .where(AnalysisTask.slack_user_id == "U123")
+        .order_by(AnalysisTask.created_at.desc())
+        .limit(20)
+    ),
+    "ix_analysis_tasks_teams_user_created_at": (
+        select(AnalysisTask)
+        .where(AnalysisTask.teams_user_id == "29:abc")
+        .order_by(AnalysisTask.created_at.desc())
+        .limit(20)
+    ),
+    "ix_analysis_tasks_source_platform_created_at": (
+        select(AnalysisTask.id)
+        .where(AnalysisTask.source_platform == "slack", AnalysisTask.created_at >= CUTOFF)
+    ),
+}
+
+
+@pytest.fixture
+async def seeded_conn(engine, session_factory):
+    """Genug Zeilen, damit der Planer Indizes gegenüber einem Scan bevorzugt."""
+    statuses = list(TaskStatus)
+    rows = [
+        {
+            "unternehmen": f"Firma {i}", "standort": "Berlin", "position": "HEP",
+            "status": statuses[i % len(statuses)].name,
+            "source_platform": "slack" if i % 3 else "teams",
+            "slack_user_id": f"U{i % 200}", "teams_user_id": f"29:{i % 200}",
+            "created_at": CUTOFF - timedelta(minutes=i), "updated_at": CUTOFF,
+        }
+        for i in range(5000)
+    ]
+    async with engine.begin() as conn:
+        await conn.execute(AnalysisTask.__table__.insert(), rows)
+        await conn.execute(text("ANALYZE"))
+    async with engine.connect() as conn:
+        yield conn
+
+
+@pytest.mark.parametrize("index", list(QUERIES))
+async def test_task_queries_use_indexes(seeded_conn, index):
+    sql = str(QUERIES[index].compile(dialect=seeded_conn.dialect, compile_kwargs={"literal_binds": True}))
+    plan = "\n".join(str(row[-1]) for row in await seeded_conn.execute(text("EXPLAIN QUERY PLAN " + sql)))
+    assert index in plan, plan
@@ -0,0 +1,38 @@
+import pytest
+
+from app.input_processor.taxonomy import FUZZY_MIN_CONFIDENCE, match_position, resolve_position
+
+
+@pytest.mark.parametrize(
+    ("raw", "position"),
+    [
+        ("Heilerziehungspfleger", "Heilerziehungspfleger"),
+        ("Heilerziehungspflegerinnen", "Heilerziehungspfleger"),
+        ("Heilerziehungspflger", "Heilerziehungspfleger"),  # Tippfehler
+        ("HEP Wohngruppe", "Heilerziehungspfleger"),
+        ("Pflegefachkrft", "Pflegefachkraft"),
+        ("Operationstechnischer Asistent", "OTA"),
+    ],
+)
+def test_resolves_variants_and_typos(raw, position):
+    match = match_position(raw)
+    assert match is not None and match.position == position
+    assert match.confidence >= FUZZY_MIN_CONFIDENCE
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        # Helfer-/Assistenzberufe sind eigene, niedriger qualifizierte Rollen
+        "Heilerziehungspflegehelfer",
+        "Heilerziehungspflegehelferin",
+        "Heilerziehungspflegeassistent",
+        "Heilerziehungspflegeassistentin",
+        "Heilerziehungspflegehilfe",
+        "Helfer HEP",
+        "Pflegefachkrafthelfer",
+    ],
+)
+def test_does_not_resolve_lower_qualified_roles(raw):
+    assert match_position(raw) is None
+    assert resolve_position(raw) is None